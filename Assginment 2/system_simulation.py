@@ -1,40 +1,410 @@
-import multiprocessing
+import argparse
+import gzip
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import random
+import shutil
+import signal
+import sys
 import time
+from collections import deque
 
 # -------------------------------
 # Sub-Task 1: Initialize Logging
 # -------------------------------
-logging.basicConfig(
-    filename='process_log.txt',
-    level=logging.INFO,
-    format='%(asctime)s - %(processName)s - %(message)s'
-)
+# Workers never open the log file. Each one sends its records to a shared
+# queue through a QueueHandler, and a single QueueListener in the parent
+# writes them to process_log.txt. The listener drains every record that is
+# waiting before it flushes the file, so a burst of records from many
+# workers becomes a few large writes instead of one write per record.
+LOG_FILE = 'process_log.txt'
+LOG_FORMAT = '%(asctime)s - %(processName)s - %(message)s'
+
+
+class BatchedFileHandler(logging.FileHandler):
+    """
+    A FileHandler that leaves flushing to flush_batch() instead of flushing
+    every record. Closing it flushes the last batch.
+    """
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        logging.FileHandler.flush(self)
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    A RotatingFileHandler that flushes in batches like BatchedFileHandler.
+    With compress=True, rotated files are gzipped (process_log.txt.1.gz, ...).
+    """
+    def __init__(self, filename, max_bytes, backups, compress=False):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backups)
+        if compress:
+            self.namer = lambda name: name + '.gz'
+            self.rotator = _gzip_rotator
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        logging.handlers.RotatingFileHandler.flush(self)
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+def _gzip_rotator(source, dest):
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    A QueueListener that flushes its handlers only when the queue runs dry,
+    and once more after stop() has written the records still queued.
+    """
+    def stop(self):
+        super().stop()
+        for handler in self.handlers:
+            handler.flush_batch()
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get(block=False)
+        except queue.Empty:
+            if not block:
+                raise
+        for handler in self.handlers:
+            handler.flush_batch()
+        return self.queue.get(block=True)
+
+
+def start_log_listener(log_queue, filename=LOG_FILE, rotate_bytes=0, backups=5, compress=False):
+    """
+    Starts the parent's listener, which writes the records workers put on
+    log_queue to filename (rotating it every rotate_bytes bytes if set).
+    Call stop() on the result after the workers have finished.
+    """
+    if rotate_bytes:
+        handler = BatchedRotatingFileHandler(filename, rotate_bytes, backups, compress)
+    else:
+        handler = BatchedFileHandler(filename)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = BatchingQueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def init_worker_logging(log_queue):
+    """Sends this process's log records to log_queue (call first thing in a worker)."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
 # -----------------------------------------------
 # Sub-Task 2: Define a dummy system process task
 # -----------------------------------------------
-def system_process(task_name):
-    logging.info(f"{task_name} started")
-    time.sleep(2)   # simulate work
-    logging.info(f"{task_name} ended")
+HUNG_EXIT = 2 # Exit status of a worker that abandoned a task
+
+
+class TaskInterrupted(Exception):
+    """Raised inside a running task when its deadline passes or the supervisor abandons it."""
+
+
+_task_running = False # The interrupt signals are ignored outside a task
+
+
+def _interrupt_task(signum, frame):
+    if _task_running:
+        raise TaskInterrupted(signal.Signals(signum).name)
+
+
+def system_process(slot, task_queue, result_queue, log_queue, crash_rate=0.0, task_timeout=0):
+    """
+    Worker: runs tasks from task_queue until it gets None. Reports
+    ('start', slot, task id, time) and ('done', slot, task id, time) on
+    result_queue. SIGINT and SIGTERM are ignored: the supervisor decides when
+    workers stop, so a worker always finishes the task it is running.
+    With crash_rate > 0 a task makes the worker die with that probability.
+    A task still running after task_timeout seconds (SIGALRM), or when the
+    supervisor sends SIGUSR1, is abandoned and the worker exits with
+    HUNG_EXIT. The interrupt is only raised inside the task itself, never
+    while the worker is using a queue, so the supervisor never has to kill a
+    worker and leave the shared queues half-written.
+    """
+    global _task_running
+    signal.signal(signal.SIGALRM, _interrupt_task)
+    signal.signal(signal.SIGUSR1, _interrupt_task)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    init_worker_logging(log_queue)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        task_id, task_name, seconds = task
+        result_queue.put(('start', slot, task_id, time.monotonic()))
+        logging.info(f"{task_name} started")
+        if random.random() < crash_rate:
+            logging.error(f"{task_name} crashed")
+            sys.exit(1)
+        try:
+            _task_running = True
+            if task_timeout:
+                signal.setitimer(signal.ITIMER_REAL, task_timeout)
+            time.sleep(seconds)   # simulate work
+        except TaskInterrupted as e:
+            logging.error(f"{task_name} abandoned ({'deadline' if str(e) == 'SIGALRM' else 'supervisor'})")
+            sys.exit(HUNG_EXIT)
+        finally:
+            _task_running = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        logging.info(f"{task_name} ended")
+        result_queue.put(('done', slot, task_id, time.monotonic()))
 
 # -----------------------------------------------
-# Sub-Task 3 & 4: Create, start, join processes
+# Sub-Task 3 & 4: Create, start, supervise processes
 # -----------------------------------------------
-if __name__ == '__main__':
-    print("System Starting...")
+DEFAULT_CONFIG = {
+    'workers': 2,          # Worker processes
+    'tasks': 2,            # Tasks to run
+    'task_seconds': 2.0,   # Simulated work per task
+    'crash_rate': 0.0,     # Chance that a task kills its worker
+    'task_timeout': 0,     # Abandon a task (and restart its worker) after this long (0 = never)
+    'backoff': 0.5,        # First restart delay after a crash (seconds), doubled per crash in a row
+    'backoff_max': 30.0,
+    'max_restarts': 10,    # Give up on a worker after this many crashes in a row
+    'drain_timeout': 30.0, # On shutdown, abandon tasks still running after this long
+}
+
+
+class Supervisor:
+    """
+    Runs config['workers'] system_process workers fed from one shared task
+    queue. A worker that dies is restarted after a backoff that doubles with
+    each crash in a row (reset when it completes a task), and the task it
+    was running is queued again. A worker abandons a task running past
+    task_timeout and exits, which counts as a hung worker and is restarted
+    the same way. SIGTERM (or SIGINT) stops the feeding of new tasks;
+    workers finish what is queued and exit, and tasks still running after
+    drain_timeout are abandoned (SIGUSR1). Workers are never killed: they
+    share the task, result and log queues, which a kill could corrupt.
+    run() sets gave_up if every slot was given up with tasks unfinished.
+    Counts completed tasks, throughput and latency (queueing plus service
+    time) per worker slot.
+    """
+    def __init__(self, config, log_queue):
+        self.config = dict(DEFAULT_CONFIG, **config)
+        self.log_queue = log_queue
+        workers = self.config['workers']
+        self.task_queue = multiprocessing.Queue(maxsize=2 * workers) # Bounded, so a drain is short
+        self.result_queue = multiprocessing.Queue()
+        self.processes = [None] * workers
+        self.crashes = [0] * workers     # Crashes in a row per slot
+        self.restart_at = {}             # slot -> time to restart it
+        self.in_flight = {}              # slot -> (task id, start time)
+        self.queued_at = {}              # task id -> time it was queued
+        self.retry = deque()             # Tasks to run again after a crash
+        self.stats = [{'completed': 0, 'latency': 0.0, 'max_latency': 0.0, 'service': 0.0,
+                       'restarts': 0, 'crashes': 0, 'timeouts': 0} for _ in range(workers)]
+        self.done = 0                    # Tasks completed
+        self.stopping = False
+        self.gave_up = False
+
+    def request_stop(self, signum=None, frame=None):
+        if not self.stopping:
+            logging.info("Supervisor: stop requested, draining")
+        self.stopping = True
+
+    def start_worker(self, slot):
+        process = multiprocessing.Process(
+            target=system_process, name=f"Worker-{slot + 1}",
+            args=(slot, self.task_queue, self.result_queue, self.log_queue, self.config['crash_rate'],
+                  self.config['task_timeout']))
+        process.start()
+        self.processes[slot] = process
 
-    # Create at least two processes
-    p1 = multiprocessing.Process(target=system_process, args=('Process-1',))
-    p2 = multiprocessing.Process(target=system_process, args=('Process-2',))
+    def _task(self, task_id):
+        return (task_id, f"Task-{task_id}", self.config['task_seconds'])
 
-    # Start processes
-    p1.start()
-    p2.start()
+    def _handle_results(self):
+        while True:
+            try:
+                kind, slot, task_id, when = self.result_queue.get_nowait()
+            except queue.Empty:
+                return
+            if kind == 'start':
+                self.in_flight[slot] = (task_id, when)
+                continue
+            started = self.in_flight.pop(slot, (task_id, when))[1]
+            latency = when - self.queued_at.pop(task_id, when)
+            stats = self.stats[slot]
+            stats['completed'] += 1
+            stats['latency'] += latency
+            stats['max_latency'] = max(stats['max_latency'], latency)
+            stats['service'] += when - started
+            self.crashes[slot] = 0
+            self.done += 1
 
-    # Wait for processes to finish
-    p1.join()
-    p2.join()
+    def _handle_exit(self, slot):
+        process = self.processes[slot]
+        self.processes[slot] = None
+        task = self.in_flight.pop(slot, None)
+        if task is not None:
+            self.retry.append(task[0]) # Run the interrupted task again
+        if self.stopping and task is None and process.exitcode == 0:
+            return # Drained and exited
+        self.crashes[slot] += 1
+        self.stats[slot]['crashes'] += 1
+        if process.exitcode == HUNG_EXIT:
+            self.stats[slot]['timeouts'] += 1
+        if self.stopping:
+            logging.warning(f"Supervisor: {process.name} exited with {process.exitcode} while draining")
+            return
+        if self.crashes[slot] > self.config['max_restarts']:
+            logging.error(f"Supervisor: {process.name} crashed {self.crashes[slot]} times in a row, giving up")
+            return
+        delay = min(self.config['backoff'] * 2 ** (self.crashes[slot] - 1), self.config['backoff_max'])
+        logging.warning(f"Supervisor: {process.name} exited with {process.exitcode}, restarting in {delay:g} s")
+        self.restart_at[slot] = time.monotonic() + delay
+
+    def run(self):
+        """Runs every task (or until stopped). Returns the elapsed time in seconds."""
+        config = self.config
+        start = time.monotonic()
+        next_task = 1
+        sentinels = 0 # Stop markers still to queue
+        drain_deadline = None
+        abandoned = set() # Slots told to abandon their task at the drain deadline
+        for slot in range(config['workers']):
+            self.start_worker(slot)
+
+        while True:
+            now = time.monotonic()
+            # Feed the shared queue, interrupted tasks first
+            while not self.stopping and (self.retry or next_task <= config['tasks']):
+                task_id = self.retry[0] if self.retry else next_task
+                try:
+                    self.task_queue.put_nowait(self._task(task_id))
+                except queue.Full:
+                    break
+                if self.retry:
+                    self.retry.popleft()
+                else:
+                    next_task += 1
+                self.queued_at.setdefault(task_id, time.monotonic())
+            if not self.stopping and self.done >= config['tasks']:
+                self.stopping = True
+            if self.stopping and drain_deadline is None:
+                drain_deadline = now + config['drain_timeout']
+                self.restart_at.clear()
+                sentinels = sum(p is not None for p in self.processes)
+            while sentinels:
+                try:
+                    self.task_queue.put_nowait(None)
+                except queue.Full:
+                    break
+                sentinels -= 1
+
+            live = [p for p in self.processes if p is not None]
+            if not live and self.stopping:
+                break
+            if not live and not self.restart_at:
+                logging.error("Supervisor: no workers left")
+                self.gave_up = True
+                break
+            ready = multiprocessing.connection.wait([p.sentinel for p in live], timeout=0.1)
+            self._handle_results()
+            for slot, process in enumerate(self.processes):
+                if process is not None and process.sentinel in ready:
+                    process.join()
+                    self._handle_exit(slot)
+
+            now = time.monotonic()
+            if drain_deadline is not None and now > drain_deadline:
+                # Ask busy workers to abandon their tasks; one that is between
+                # tasks ignores it, so it is sent again on every pass
+                for slot in self.in_flight:
+                    process = self.processes[slot]
+                    if process is not None and process.is_alive():
+                        if slot not in abandoned:
+                            logging.warning(f"Supervisor: {process.name} did not drain in time, abandoning its task")
+                            abandoned.add(slot)
+                        os.kill(process.pid, signal.SIGUSR1)
+            for slot, when in list(self.restart_at.items()):
+                if now >= when:
+                    del self.restart_at[slot]
+                    self.stats[slot]['restarts'] += 1
+                    self.start_worker(slot)
+        self._handle_results()
+        return time.monotonic() - start
+
+    def print_report(self, elapsed):
+        print(f"\n{'Worker':<10}{'Tasks':>7}{'Tasks/s':>9}{'Mean Latency':>14}{'Max Latency':>13}"
+              f"{'Mean Service':>14}{'Crashes':>9}{'Hung':>6}{'Restarts':>10}")
+        for slot, s in enumerate(self.stats):
+            done = s['completed']
+            mean = s['latency'] / done if done else 0.0
+            service = s['service'] / done if done else 0.0
+            print(f"{f'Worker-{slot + 1}':<10}{done:>7}{done / elapsed if elapsed else 0:>9.2f}"
+                  f"{mean:>12.3f} s{s['max_latency']:>11.3f} s{service:>12.3f} s{s['crashes']:>9}{s['timeouts']:>6}{s['restarts']:>10}")
+        total = sum(s['completed'] for s in self.stats)
+        print(f"\nCompleted {total} of {self.config['tasks']} tasks in {elapsed:.2f} s "
+              f"({total / elapsed if elapsed else 0:.2f} tasks/s)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="System startup and process simulation.")
+    parser.add_argument('--config', help="JSON file with supervisor settings (see DEFAULT_CONFIG)")
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--tasks', type=int)
+    parser.add_argument('--task-seconds', type=float)
+    parser.add_argument('--crash-rate', type=float)
+    parser.add_argument('--log-file', default=LOG_FILE)
+    parser.add_argument('--rotate-bytes', type=int, default=0, help="Rotate the log at this size (0 = never)")
+    parser.add_argument('--backups', type=int, default=5, help="Rotated logs to keep")
+    parser.add_argument('--compress', action='store_true', help="Gzip rotated logs")
+    args = parser.parse_args()
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+        unknown = set(config) - set(DEFAULT_CONFIG)
+        if unknown:
+            parser.error(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    for key in ('workers', 'tasks', 'task_seconds', 'crash_rate'):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+
+    print("System Starting...")
+    log_queue = multiprocessing.Queue()
+    listener = start_log_listener(log_queue, args.log_file, args.rotate_bytes, args.backups, args.compress)
+    init_worker_logging(log_queue) # The supervisor's own records go through the listener too
 
-    print("System Shutdown.")
\ No newline at end of file
+    supervisor = Supervisor(config, log_queue)
+    signal.signal(signal.SIGTERM, supervisor.request_stop)
+    signal.signal(signal.SIGINT, supervisor.request_stop)
+    try:
+        elapsed = supervisor.run()
+    finally:
+        logging.getLogger().handlers.clear()
+        listener.stop() # Writes any records still queued
+    supervisor.print_report(elapsed)
+    print("System Shutdown.")
+    if supervisor.gave_up:
+        sys.exit(1) # Every worker was given up with tasks unfinished
@@ -0,0 +1,215 @@
+import math
+import sys
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; the report notes whether it was used
+    np = None
+
+try:
+    import resource
+except ImportError: # Not on Windows; benchmarks fall back to tracemalloc
+    resource = None
+
+from cpu_scheduling import JobTable, MLFQPolicy, PriorityPolicy, RoundRobinPolicy, SRTFPolicy
+from file_allocation import make_file_disk, replay_file_trace
+from memory import MVTMemory, make_allocator, replay_allocations, simulate_mvt
+from disk_scheduling import schedule_disk
+from paging import fault_curve
+from traces import (Sampler, TRACE_FIELDS, allocate_workload, disk_workload, files_workload,
+    mvt_workload, paging_workload, schedule_workload)
+
+# ==========================================
+# BENCHMARKS
+# ==========================================
+# Each benchmark runs one simulator engine on a synthetic trace of n jobs or
+# events. The trace is generated into memory first and is not timed. Every
+# point runs in a fresh worker process. Its reported peak is the engine's own:
+# the growth of peak RSS over the RSS once the trace is built (on Linux the
+# peak is first reset to the current RSS through /proc/self/clear_refs, so
+# trace generation and the interpreter do not count). Without the resource
+# module it is the peak of Python allocations traced during the run.
+
+BENCH_BLOCKS = [1024] * 16 # Memory blocks for the allocation benchmarks
+BENCH_MEMORY = 2048 # MVT memory size
+BENCH_CYLINDERS = 5000
+
+def _bench_columns(kind, n, seed):
+    """Generates a trace of the given kind as columns: array('q') for numbers, lists otherwise."""
+    makers = {'schedule': schedule_workload, 'allocate': allocate_workload, 'mvt': mvt_workload,
+              'disk': disk_workload, 'paging': paging_workload,
+              'files': lambda sampler, n: files_workload(sampler, n, create=0.1, delete=0.095)}
+    columns = {}
+    for chunk in makers[kind](Sampler(seed), n):
+        for field, values in chunk.items():
+            if np is not None and isinstance(values, np.ndarray):
+                values = values.tolist()
+            col = columns.setdefault(field, array('q'))
+            if isinstance(col, array):
+                size = len(col)
+                try:
+                    col.extend(values)
+                    continue
+                except TypeError: # Text or blank values: keep this column as a list
+                    col = columns[field] = col[:size].tolist()
+            col.extend(values)
+    return columns
+
+def _bench_records(columns, fields):
+    """Yields the rows of a column trace as plain records, as read_trace would."""
+    for row in zip(*(columns[field] for field in fields)):
+        yield dict(zip(fields, row))
+
+def _bench_jobs(columns, policy):
+    JobTable(columns['id'], columns['at'], columns['bt'], columns['p']).run(policy)
+    return len(columns['id'])
+
+def _bench_allocations(columns, strategy):
+    allocator = make_allocator(strategy, BENCH_BLOCKS)
+    for _ in replay_allocations(_bench_records(columns, TRACE_FIELDS['allocate']), allocator):
+        pass
+    return len(columns['op'])
+
+def _bench_mvt(columns):
+    memory = MVTMemory(BENCH_MEMORY, 'first')
+    for _ in simulate_mvt(_bench_records(columns, TRACE_FIELDS['mvt']), memory, compact=True):
+        pass
+    return 2 * len(columns['id']) # One arrival and one exit per process
+
+def _bench_files(columns, layout):
+    n = len(columns['op'])
+    disk = make_file_disk(layout, n // 2 + (1 << 16))
+    replay_file_trace(_bench_records(columns, TRACE_FIELDS['files']), disk)
+    return n
+
+def _bench_disk(columns, algorithm):
+    for _ in schedule_disk(_bench_records(columns, TRACE_FIELDS['disk']), algorithm, 0, BENCH_CYLINDERS):
+        pass
+    return len(columns['id'])
+
+def _bench_paging(columns, policy):
+    fault_curve(columns['page'], [64], [policy])
+    return len(columns['page'])
+
+# name -> (trace kind, function running the engine on the columns and returning the events processed)
+BENCHMARKS = {
+    'priority': ('schedule', lambda c: _bench_jobs(c, PriorityPolicy())),
+    'srtf': ('schedule', lambda c: _bench_jobs(c, SRTFPolicy())),
+    'rr': ('schedule', lambda c: _bench_jobs(c, RoundRobinPolicy(4))),
+    'mlfq': ('schedule', lambda c: _bench_jobs(c, MLFQPolicy())),
+    'first-fit': ('allocate', lambda c: _bench_allocations(c, 'first')),
+    'best-fit': ('allocate', lambda c: _bench_allocations(c, 'best')),
+    'worst-fit': ('allocate', lambda c: _bench_allocations(c, 'worst')),
+    'buddy': ('allocate', lambda c: _bench_allocations(c, 'buddy')),
+    'slab': ('allocate', lambda c: _bench_allocations(c, 'slab')),
+    'mvt': ('mvt', _bench_mvt),
+    'sequential-files': ('files', lambda c: _bench_files(c, 'sequential')),
+    'indexed-files': ('files', lambda c: _bench_files(c, 'indexed')),
+    'linked-files': ('files', lambda c: _bench_files(c, 'fat+cache')),
+    'disk-sstf': ('disk', lambda c: _bench_disk(c, 'sstf')),
+    'disk-clook': ('disk', lambda c: _bench_disk(c, 'clook')),
+    'paging-lru': ('paging', lambda c: _bench_paging(c, 'lru')),
+    'paging-clock': ('paging', lambda c: _bench_paging(c, 'clock')),
+}
+
+def _max_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak # Reported in bytes there, KB elsewhere
+
+def _reset_peak_rss():
+    """Lowers this process's peak RSS to its current RSS, where the OS allows it (Linux)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+def _bench_point(point):
+    """Runs one benchmark at one size (in a worker process) and returns its result row."""
+    name, n, seed = point
+    kind, run = BENCHMARKS[name]
+    columns = _bench_columns(kind, n, seed)
+    if resource is None:
+        tracemalloc.start()
+    else:
+        _reset_peak_rss()
+        baseline = _max_rss_kb()
+    start = time.perf_counter()
+    events = run(columns)
+    seconds = time.perf_counter() - start
+    if resource is not None:
+        peak = _max_rss_kb() - baseline
+    else:
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return {'benchmark': name, 'n': n, 'events': events, 'seconds': seconds,
+            'events_per_sec': events / seconds if seconds else 0.0, 'peak_rss_kb': peak}
+
+def scaling_exponent(rows):
+    """
+    Least-squares slope of log(seconds) against log(n): about 1 for linear
+    scaling, 2 for quadratic. Points under 10^4 are dropped when there are
+    enough larger ones, since fixed overheads dominate them.
+    """
+    points = [(r['n'], r['seconds']) for r in rows if r['seconds'] > 0]
+    large = [p for p in points if p[0] >= 10000]
+    if len(large) >= 2:
+        points = large
+    if len({n for n, _ in points}) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(s) for _, s in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+
+def run_benchmarks(names, sizes, seed=1):
+    """
+    Runs every benchmark at every size, one point at a time, each in a fresh
+    process. Returns {'python', 'numpy', 'created', 'results', 'scaling'}.
+    """
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}")
+    points = [(name, n, seed) for name in names for n in sizes]
+    rows = []
+    for point in points:
+        # A new single-worker pool per point, so no point inherits another's heap
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            rows.append(pool.submit(_bench_point, point).result())
+    scaling = {name: scaling_exponent([r for r in rows if r['benchmark'] == name]) for name in names}
+    return {'python': sys.version.split()[0], 'numpy': np is not None,
+            'created': time.strftime("%Y-%m-%d %H:%M:%S"), 'results': rows, 'scaling': scaling}
+
+def find_regressions(report, baseline, tolerance=0.25, max_exponent=1.25):
+    """
+    Compares a benchmark report with a saved baseline report. Flags every
+    point whose events per second fell more than tolerance below the
+    baseline, and every benchmark whose scaling exponent exceeds max_exponent.
+    Returns a list of messages (empty if nothing regressed).
+    """
+    before = {(r['benchmark'], r['n']): r for r in baseline.get('results', [])}
+    messages = []
+    for r in report['results']:
+        old = before.get((r['benchmark'], r['n']))
+        if old and old['events_per_sec'] and r['events_per_sec'] < old['events_per_sec'] * (1 - tolerance):
+            messages.append(f"{r['benchmark']} n={r['n']}: {r['events_per_sec']:.0f} events/s, "
+                            f"{r['events_per_sec'] / old['events_per_sec'] * 100:.0f}% of baseline")
+    for name, exponent in report['scaling'].items():
+        if exponent is not None and exponent > max_exponent:
+            messages.append(f"{name}: time grows as n^{exponent:.2f}")
+    return messages
+
+def print_benchmarks(report, baseline=None, file=None):
+    before = {(r['benchmark'], r['n']): r for r in (baseline or {}).get('results', [])}
+    print(f"\n{'Benchmark':<18}{'N':<12}{'Seconds':<12}{'Events/s':<14}{'Peak +RSS MB':<14}{'vs Baseline':<12}", file=file)
+    for r in report['results']:
+        old = before.get((r['benchmark'], r['n']))
+        ratio = f"{r['events_per_sec'] / old['events_per_sec'] * 100:.0f}%" if old and old['events_per_sec'] else "-"
+        print(f"{r['benchmark']:<18}{r['n']:<12}{r['seconds']:<12.3f}{r['events_per_sec']:<14.0f}"
+              f"{r['peak_rss_kb'] / 1024:<14.1f}{ratio:<12}", file=file)
+    print("\nScaling (time ~ n^k): " + ", ".join(
+        f"{name} {k:.2f}" for name, k in report['scaling'].items() if k is not None), file=file)
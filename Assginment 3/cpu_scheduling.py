@@ -0,0 +1,879 @@
+import heapq
+import io
+import itertools
+import operator
+import sys
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; metrics fall back to pure Python
+    np = None
+
+# ==========================================
+# PART 1: CPU SCHEDULING ALGORITHMS
+# ==========================================
+
+# ------------------------------------------
+# Discrete-event simulation kernel
+# ------------------------------------------
+# A policy owns the ready queue and answers four questions for the kernel:
+#   push(job) / pop()   -> enqueue a runnable job / pick the next one to run
+#   quantum(job)        -> length of the next time slice (None = run to completion)
+#   preempts(running)   -> should a newly arrived job take the CPU right now?
+#   expire(job)         -> requeue a job whose time slice ran out
+# 'preemptive' marks policies that re-check the CPU on every arrival, and
+# 'fixed_quantum' marks policies whose quantum never changes for a job.
+# Jobs are Job objects (see below); large traces live in a JobTable.
+
+class Job:
+    """
+    One process as the kernel sees it. __slots__ keeps each job to a few
+    machine words with no per-instance dict, and the dispatch loop reads
+    fields as attributes instead of hashing string keys.
+    row is the job's row in a JobTable (-1 when it has none).
+    """
+    __slots__ = ('id', 'at', 'bt', 'p', 'rem_bt', 'lvl', 'ct', 'row')
+
+    def __init__(self, id, at, bt, p=0, rem_bt=0, lvl=0, ct=0, row=-1):
+        self.id = id
+        self.at = at
+        self.bt = bt
+        self.p = p
+        self.rem_bt = rem_bt
+        self.lvl = lvl
+        self.ct = ct
+        self.row = row
+
+    def __repr__(self):
+        return (f"Job(id={self.id}, at={self.at}, bt={self.bt}, p={self.p}, rem_bt={self.rem_bt}, "
+                f"lvl={self.lvl}, ct={self.ct}, row={self.row})")
+
+    @property
+    def tat(self):
+        return self.ct - self.at
+
+    @property
+    def wt(self):
+        return self.ct - self.at - self.bt
+
+    def record(self):
+        """The job as a plain result record (RESULT_FIELDS)."""
+        return {'id': self.id, 'at': self.at, 'bt': self.bt, 'p': self.p,
+                'ct': self.ct, 'wt': self.wt, 'tat': self.tat}
+
+class JobTable:
+    """
+    Column store for large traces: one int64 column (array('q'), or any
+    buffer of int64 such as a shared memory view) per field. A job costs 40
+    bytes here instead of a few hundred as a dict. Job objects are only
+    created while a job is in the system, and completion times are written
+    back into the ct column. The columns can be passed straight to
+    compute_metrics, which wraps them in NumPy arrays without copying when
+    NumPy is available.
+    """
+    def __init__(self, id=None, at=None, bt=None, p=None):
+        self.id = array('q') if id is None else id
+        self.at = array('q') if at is None else at
+        self.bt = array('q') if bt is None else bt
+        self.p = array('q', bytes(8 * len(self.id))) if p is None else p
+        self.ct = array('q', bytes(8 * len(self.id)))
+
+    @classmethod
+    def from_records(cls, records):
+        """Builds a table from plain records (only 'bt' is required) or Job objects."""
+        table = cls()
+        append = table.append
+        for i, record in enumerate(records):
+            if isinstance(record, Job):
+                append(record.id, record.at, record.bt, record.p)
+            else:
+                append(int(record.get('id', i + 1)), int(record.get('at', 0)),
+                       int(record['bt']), int(record.get('p', 0)))
+        return table
+
+    def append(self, id, at, bt, p=0):
+        self.id.append(id)
+        self.at.append(at)
+        self.bt.append(bt)
+        self.p.append(p)
+        self.ct.append(0)
+
+    def __len__(self):
+        return len(self.id)
+
+    def jobs(self):
+        """Yields a Job per row in arrival order (ties by process ID), as the kernel expects."""
+        ids, at, bt, p = self.id, self.at, self.bt, self.p
+        n = len(ids)
+        if all(map(operator.le, zip(at, ids), itertools.islice(zip(at, ids), 1, None))):
+            rows = range(n)
+        else:
+            rows = sorted(range(n), key=lambda i: (at[i], ids[i]))
+        for i in rows:
+            yield Job(ids[i], at[i], bt[i], p[i], row=i)
+
+    def run(self, policy, context_switch=0, order=None, log=None):
+        """Runs the table through a policy, filling in the ct column. Returns the table."""
+        ct = self.ct
+        for job in simulate(self.jobs(), policy, context_switch, order, log):
+            ct[job.row] = job.ct
+        return self
+
+    def metrics(self):
+        return compute_metrics(self.at, self.bt, self.ct)
+
+    def records(self):
+        """Yields one result record per row, in table order."""
+        for i in range(len(self.id)):
+            at, bt, ct = self.at[i], self.bt[i], self.ct[i]
+            yield {'id': self.id[i], 'at': at, 'bt': bt, 'p': self.p[i],
+                   'ct': ct, 'wt': ct - at - bt, 'tat': ct - at}
+
+class PriorityPolicy:
+    """
+    Priority Scheduling. Lower number implies higher priority.
+    Ties are broken by arrival time, then by process ID.
+    """
+    fixed_quantum = False
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+        self.ready = []
+        self.seq = itertools.count()
+
+    def __len__(self):
+        return len(self.ready)
+
+    def key(self, job):
+        return (job.p, job.at, job.id)
+
+    def push(self, job):
+        heapq.heappush(self.ready, (self.key(job), next(self.seq), job))
+
+    def pop(self):
+        return heapq.heappop(self.ready)[2]
+
+    def quantum(self, job):
+        return None
+
+    def preempts(self, running):
+        return self.key(self.ready[0][2]) < self.key(running)
+
+    def expire(self, job):
+        self.push(job)
+
+class SRTFPolicy(PriorityPolicy):
+    """
+    Shortest Remaining Time First (preemptive SJF).
+    """
+    def __init__(self):
+        super().__init__(preemptive=True)
+
+    def key(self, job):
+        return (job.rem_bt, job.at, job.id)
+
+class RoundRobinPolicy:
+    """
+    Round Robin with a fixed Time Quantum over a FIFO ready queue.
+    """
+    preemptive = False
+    fixed_quantum = True
+
+    def __init__(self, time_quantum):
+        if time_quantum <= 0:
+            raise ValueError("Time Quantum must be positive.")
+        self.time_quantum = time_quantum
+        self.ready = deque()
+
+    def __len__(self):
+        return len(self.ready)
+
+    def push(self, job):
+        self.ready.append(job)
+
+    def pop(self):
+        return self.ready.popleft()
+
+    def quantum(self, job):
+        return self.time_quantum
+
+    def preempts(self, running):
+        return False
+
+    def expire(self, job):
+        self.ready.append(job)
+
+class MLFQPolicy:
+    """
+    Multi-Level Feedback Queue.
+    New jobs enter level 0. A job that uses up its whole quantum drops one level;
+    the last level has no quantum (FCFS). A job arriving at a higher level
+    preempts a job running at a lower one.
+    """
+    preemptive = True
+    fixed_quantum = False
+
+    def __init__(self, quanta=(4, 8, None)):
+        if any(q is not None and q <= 0 for q in quanta):
+            raise ValueError("MLFQ quanta must be positive.")
+        self.quanta = list(quanta)
+        self.levels = [deque() for _ in self.quanta]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, job):
+        self.levels[job.lvl].append(job)
+        self.size += 1
+
+    def pop(self):
+        for queue in self.levels:
+            if queue:
+                self.size -= 1
+                return queue.popleft()
+
+    def quantum(self, job):
+        return self.quanta[job.lvl]
+
+    def preempts(self, running):
+        return any(self.levels[lvl] for lvl in range(running.lvl))
+
+    def expire(self, job):
+        job.lvl = min(job.lvl + 1, len(self.levels) - 1)
+        self.push(job)
+
+def _arrivals(jobs):
+    """Yields jobs ready for the kernel, checking that they come in arrival order."""
+    last_at = None
+    for job in jobs:
+        if last_at is not None and job.at < last_at:
+            raise ValueError("Jobs must be in arrival order.")
+        last_at = job.at
+        job.rem_bt = job.bt
+        yield job
+
+def simulate(jobs, policy, context_switch=0, order=None, log=None):
+    """
+    Runs Job objects through the given policy, filling in ct.
+    jobs may be any iterable (a list or a streamed trace) but must be in arrival
+    order; it is only read as far as the simulation clock has reached.
+    Yields each job as it completes. If an order list is given, the execution
+    order (process IDs in dispatch order) is appended to it. If an EventLog is
+    given, every dispatch, preemption and completion is recorded to it.
+
+    The clock only moves between events - arrival, quantum expiry and
+    completion - so an idle CPU jumps straight to the next arrival and a long
+    burst costs one step per time slice, not one per time unit. A process
+    that is alone on a fixed-quantum policy runs to its next event in one step.
+    context_switch time is charged whenever the CPU moves to a different process.
+    """
+    if context_switch < 0:
+        raise ValueError("Context switch time cannot be negative.")
+    arrivals = _arrivals(jobs)
+    upcoming = next(arrivals, None) # Next job to arrive
+    current_time = 0
+    last_id = None
+    running = None
+    slice_end = 0
+
+    while True:
+        # Admit every process that has arrived by now
+        while upcoming is not None and upcoming.at <= current_time:
+            policy.push(upcoming)
+            upcoming = next(arrivals, None)
+
+        if running is None:
+            if not policy:
+                if upcoming is None:
+                    return
+                # CPU idle: jump to the next arrival
+                current_time = upcoming.at
+                continue
+            running = policy.pop()
+            if running.id != last_id:
+                if last_id is not None and context_switch:
+                    # Switching to a different process costs dispatcher time
+                    current_time += context_switch
+                    while upcoming is not None and upcoming.at <= current_time:
+                        policy.push(upcoming)
+                        upcoming = next(arrivals, None)
+                last_id = running.id
+                if order is not None:
+                    order.append(last_id)
+            if log is not None:
+                log.record(DISPATCH, current_time, running.id)
+
+            quantum = policy.quantum(running)
+            if quantum is None:
+                run_for = running.rem_bt
+            elif policy.fixed_quantum and not policy:
+                # Only runnable process: it keeps the CPU for whole quanta until
+                # the quantum boundary at or after the next arrival
+                if upcoming is not None:
+                    gap = upcoming.at - current_time
+                    run_for = min(running.rem_bt, -(-gap // quantum) * quantum)
+                else:
+                    run_for = running.rem_bt
+            else:
+                run_for = min(quantum, running.rem_bt)
+            slice_end = current_time + run_for
+
+        if policy.preemptive and upcoming is not None and upcoming.at < slice_end:
+            # Run up to the arrival, then let the policy decide on preemption
+            running.rem_bt -= upcoming.at - current_time
+            current_time = upcoming.at
+            while upcoming is not None and upcoming.at <= current_time:
+                policy.push(upcoming)
+                upcoming = next(arrivals, None)
+            if policy.preempts(running):
+                if log is not None:
+                    log.record(PREEMPT, current_time, running.id)
+                policy.push(running)
+                running = None
+            continue
+
+        # Run to the end of the slice
+        running.rem_bt -= slice_end - current_time
+        current_time = slice_end
+        if running.rem_bt == 0:
+            running.ct = current_time
+            if log is not None:
+                log.record(COMPLETE, current_time, running.id)
+            yield running
+        else:
+            # Quantum expired: arrivals during the slice queue up ahead of it
+            while upcoming is not None and upcoming.at <= current_time:
+                policy.push(upcoming)
+                upcoming = next(arrivals, None)
+            if log is not None:
+                log.record(PREEMPT, current_time, running.id)
+            policy.expire(running)
+        running = None
+
+def run_kernel(processes, policy, context_switch=0, log=None):
+    """
+    Runs a list of Job objects through the given policy and fills in ct.
+    Returns the execution order (process IDs in dispatch order).
+    """
+    result_sequence = []
+    pending = sorted(processes, key=lambda x: (x.at, x.id))
+    for _ in simulate(pending, policy, context_switch, result_sequence, log):
+        pass
+    return result_sequence
+
+# ------------------------------------------
+# Batch API (plain data in, plain data out)
+# ------------------------------------------
+
+RESULT_FIELDS = ('id', 'at', 'bt', 'p', 'ct', 'wt', 'tat')
+
+def _job(record, i):
+    """Builds a kernel job from a plain record (only 'bt' is required) or a Job."""
+    if isinstance(record, Job):
+        return Job(record.id, record.at, record.bt, record.p)
+    return Job(int(record.get('id', i + 1)), int(record.get('at', 0)),
+               int(record['bt']), int(record.get('p', 0)))
+
+def stream_schedule(jobs, policy, context_switch=0, log=None):
+    """
+    Streams job records (in arrival order) through the kernel and yields one
+    result record per job as it completes, so traces never sit in memory whole.
+    """
+    prepared = (_job(record, i) for i, record in enumerate(jobs))
+    for job in simulate(prepared, policy, context_switch, log=log):
+        yield job.record()
+
+def schedule(jobs, policy, context_switch=0):
+    """
+    Schedules job records with the given policy on a JobTable.
+    Returns {'order': [...], 'jobs': [...]} with results in input order.
+    """
+    table = jobs if isinstance(jobs, JobTable) else JobTable.from_records(jobs)
+    order = []
+    table.run(policy, context_switch, order)
+    return {'order': order, 'jobs': list(table.records())}
+
+def schedule_priority(jobs, preemptive=False):
+    return schedule(jobs, PriorityPolicy(preemptive))
+
+def schedule_srtf(jobs):
+    return schedule(jobs, SRTFPolicy())
+
+def schedule_rr(jobs, quantum, context_switch=0):
+    return schedule(jobs, RoundRobinPolicy(quantum), context_switch)
+
+def schedule_mlfq(jobs, quanta=(4, 8, None)):
+    return schedule(jobs, MLFQPolicy(quanta))
+
+def make_policy(name, quantum=None, quanta=None):
+    """Builds a scheduling policy from its command-line name."""
+    if name == 'priority':
+        return PriorityPolicy()
+    if name == 'ppriority':
+        return PriorityPolicy(preemptive=True)
+    if name == 'srtf':
+        return SRTFPolicy()
+    if name == 'rr':
+        if quantum is None:
+            raise ValueError("Round Robin needs --quantum.")
+        return RoundRobinPolicy(quantum)
+    if name == 'mlfq':
+        return MLFQPolicy(quanta + [None] if quanta else (4, 8, None))
+    raise ValueError(f"Unknown scheduling policy: {name}")
+
+# ------------------------------------------
+# Metrics
+# ------------------------------------------
+# Results are kept column-wise in compact array('q') buffers; when NumPy is
+# available the statistics are computed on zero-copy views of those buffers.
+
+def collect_metrics(results):
+    """
+    Consumes result records (e.g. from stream_schedule) into arrival, burst
+    and completion columns, and returns compute_metrics() of them.
+    """
+    at, bt, ct = array('q'), array('q'), array('q')
+    for r in results:
+        at.append(r['at'])
+        bt.append(r['bt'])
+        ct.append(r['ct'])
+    return compute_metrics(at, bt, ct)
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile, matching numpy.percentile's default."""
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+def compute_metrics(at, bt, ct):
+    """
+    Computes summary statistics from arrival, burst and completion columns:
+    mean and p50/p95/p99 of waiting and turnaround time, throughput
+    (processes per time unit), CPU utilization (busy time / makespan) and
+    Jain's fairness index over normalized service (burst / turnaround).
+    """
+    n = len(ct)
+    if n == 0:
+        raise ValueError("No processes to report on.")
+
+    if np is not None:
+        at = np.asarray(at, dtype=np.int64)
+        bt = np.asarray(bt, dtype=np.int64)
+        ct = np.asarray(ct, dtype=np.int64)
+        tat = ct - at
+        wt = tat - bt
+        wt_p = np.percentile(wt, [50, 95, 99])
+        tat_p = np.percentile(tat, [50, 95, 99])
+        busy = int(bt.sum())
+        makespan = int(ct.max() - at.min())
+        share = np.divide(bt, tat, out=np.ones(n), where=tat > 0)
+        fairness = float(share.sum() ** 2 / (n * (share ** 2).sum()))
+        avg_wt, avg_tat = float(wt.mean()), float(tat.mean())
+    else:
+        tat = [c - a for a, c in zip(at, ct)]
+        wt = sorted(t - b for t, b in zip(tat, bt))
+        share = [b / t if t > 0 else 1.0 for b, t in zip(bt, tat)]
+        avg_wt, avg_tat = sum(wt) / n, sum(tat) / n
+        tat.sort()
+        wt_p = [percentile(wt, q) for q in (50, 95, 99)]
+        tat_p = [percentile(tat, q) for q in (50, 95, 99)]
+        busy = sum(bt)
+        makespan = max(ct) - min(at)
+        fairness = sum(share) ** 2 / (n * sum(s * s for s in share))
+
+    return {
+        'n': n,
+        'avg_wt': avg_wt, 'p50_wt': float(wt_p[0]), 'p95_wt': float(wt_p[1]), 'p99_wt': float(wt_p[2]),
+        'avg_tat': avg_tat, 'p50_tat': float(tat_p[0]), 'p95_tat': float(tat_p[1]), 'p99_tat': float(tat_p[2]),
+        'throughput': n / makespan if makespan else 0.0,
+        'utilization': busy / makespan if makespan else 0.0,
+        'fairness': fairness,
+    }
+
+def job_metrics(jobs):
+    """compute_metrics() for a list of scheduled Job objects."""
+    return compute_metrics([j.at for j in jobs], [j.bt for j in jobs], [j.ct for j in jobs])
+
+def compare_policies(jobs, policies, context_switch=0):
+    """
+    Runs the same trace through several policies.
+    jobs is a list of records, or a zero-argument callable returning a fresh
+    stream of them (so a trace file can be re-read instead of held in memory).
+    policies maps a label to a zero-argument callable building the policy.
+    Returns {label: metrics}.
+    """
+    table = {}
+    for label, make in policies.items():
+        trace = jobs() if callable(jobs) else jobs
+        table[label] = collect_metrics(stream_schedule(trace, make(), context_switch))
+    return table
+
+def print_summary(metrics, file=None):
+    print(f"Average Waiting Time: {metrics['avg_wt']:.2f}", file=file)
+    print(f"Average Turnaround Time: {metrics['avg_tat']:.2f}", file=file)
+    print(f"Waiting Time p50/p95/p99: {metrics['p50_wt']:.2f} / {metrics['p95_wt']:.2f} / {metrics['p99_wt']:.2f}", file=file)
+    print(f"Turnaround Time p50/p95/p99: {metrics['p50_tat']:.2f} / {metrics['p95_tat']:.2f} / {metrics['p99_tat']:.2f}", file=file)
+    print(f"Throughput: {metrics['throughput']:.4f} processes/unit time", file=file)
+    print(f"CPU Utilization: {metrics['utilization'] * 100:.2f}%", file=file)
+    print(f"Fairness (Jain's Index): {metrics['fairness']:.4f}", file=file)
+
+def print_comparison(table, file=None):
+    print(f"\n{'Policy':<12}{'Avg Wait':<12}{'p95 Wait':<12}{'p99 Wait':<12}{'Avg TAT':<12}"
+          f"{'p99 TAT':<12}{'Util %':<10}{'Fairness':<10}", file=file)
+    for label, m in table.items():
+        print(f"{label:<12}{m['avg_wt']:<12.2f}{m['p95_wt']:<12.2f}{m['p99_wt']:<12.2f}{m['avg_tat']:<12.2f}"
+              f"{m['p99_tat']:<12.2f}{m['utilization'] * 100:<10.2f}{m['fairness']:<10.4f}", file=file)
+
+# ------------------------------------------
+# Event log and Gantt chart
+# ------------------------------------------
+# The kernel can record its timeline to a binary event log: a magic header
+# followed by one pair of little-endian int64 words per event, (time,
+# pid << 2 | kind). Events are buffered in an array('q') and written out in
+# blocks. Event times never decrease, so a reader can stream the log and
+# find its time span from the first and last events alone.
+
+DISPATCH, PREEMPT, COMPLETE = 0, 1, 2
+EVENT_NAMES = ('dispatch', 'preempt', 'complete')
+EVENT_LOG_MAGIC = b'OSLEVT1\x00'
+
+class EventLog:
+    """
+    Buffered writer for the binary event log. path may be a file name or a
+    binary file object (e.g. io.BytesIO), which is left open on close().
+    """
+    def __init__(self, path, buffer_events=1 << 16):
+        self.owned = isinstance(path, str)
+        self.file = open(path, 'wb') if self.owned else path
+        self.file.write(EVENT_LOG_MAGIC)
+        self.buffer = array('q')
+        self.limit = 2 * buffer_events
+        self.events = 0
+
+    def record(self, kind, time, pid):
+        buffer = self.buffer
+        buffer.append(time)
+        buffer.append(pid << 2 | kind)
+        if len(buffer) >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if sys.byteorder != 'little':
+            self.buffer.byteswap()
+        self.file.write(self.buffer.tobytes())
+        self.events += len(self.buffer) // 2
+        del self.buffer[:]
+
+    def close(self):
+        self.flush()
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _open_event_log(path):
+    f = open(path, 'rb') if isinstance(path, str) else path
+    f.seek(0)
+    if f.read(len(EVENT_LOG_MAGIC)) != EVENT_LOG_MAGIC:
+        raise ValueError("Not a scheduler event log.")
+    return f
+
+def read_event_log(path, chunk_events=1 << 16):
+    """Streams (time, pid, kind) from an event log, one block of events at a time."""
+    f = _open_event_log(path)
+    try:
+        while True:
+            block = f.read(16 * chunk_events)
+            if not block:
+                return
+            words = array('q', block)
+            if sys.byteorder != 'little':
+                words.byteswap()
+            for i in range(0, len(words), 2):
+                yield words[i], words[i + 1] >> 2, words[i + 1] & 3
+    finally:
+        if isinstance(path, str):
+            f.close()
+
+def event_log_span(path):
+    """(first, last) event times of a log, read from its ends, or None if it is empty."""
+    f = _open_event_log(path)
+    try:
+        first = f.read(8)
+        if not first:
+            return None
+        f.seek(-16, 2)
+        last = f.read(8)
+        return int.from_bytes(first, 'little', signed=True), int.from_bytes(last, 'little', signed=True)
+    finally:
+        if isinstance(path, str):
+            f.close()
+
+def gantt_columns(events, start, end, width):
+    """
+    Downsamples a stream of events to width columns over [start, end), where
+    width <= end - start. Yields (busy, dispatches, pid) per column: the share
+    of the column the CPU was busy, how many dispatches fell in it, and the
+    process that held the CPU longest in it (None if idle). Only the current
+    column's shares are kept, so memory does not grow with the log.
+    """
+    span = end - start
+    column = 0
+    shares = {} # pid -> busy time in the current column
+    dispatches = 0
+
+    def edge(k):
+        # First time unit of column k (integer maths, so columns tile exactly)
+        return start + -(-k * span // width)
+
+    def advance(k):
+        nonlocal column, shares, dispatches
+        while column < k:
+            busy = sum(shares.values())
+            yield busy / (edge(column + 1) - edge(column)), dispatches, \
+                max(shares, key=shares.get) if shares else None
+            column += 1
+            shares = {}
+            dispatches = 0
+
+    def charge(pid, t, stop):
+        # Splits the run [t, stop) over the columns it covers
+        while t < stop:
+            k = (t - start) * width // span
+            yield from advance(k)
+            upto = min(stop, edge(k + 1))
+            shares[pid] = shares.get(pid, 0) + upto - t
+            t = upto
+
+    running, since = None, start
+    for time, pid, kind in events:
+        if time >= end:
+            break
+        if running is not None:
+            yield from charge(running, max(since, start), time)
+        if kind == DISPATCH:
+            running, since = pid, time
+            if time >= start:
+                yield from advance((time - start) * width // span)
+                dispatches += 1
+        else:
+            running = None
+    if running is not None:
+        yield from charge(running, max(since, start), end)
+    yield from advance(width)
+
+GANTT_SYMBOLS = '123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+GANTT_SHADES = ' .:-=+*#%@'
+
+def render_gantt_text(path, width=100, start=None, end=None, file=None):
+    """
+    Prints a text Gantt chart of an event log, downsampled to at most width
+    columns. The Process row shows the process that held the CPU longest in
+    each column; the first processes seen get their own symbols (see the
+    legend) and the rest share '+'. The Busy row shades CPU utilization and
+    the Switch row dispatch density.
+    """
+    span = event_log_span(path)
+    if span is None:
+        print("Empty event log.", file=file)
+        return
+    start = span[0] if start is None else start
+    end = span[1] if end is None else end
+    if end <= start:
+        raise ValueError("Nothing to draw: the end time must be after the start time.")
+    width = max(1, min(width, end - start))
+    symbols = {} # pid -> symbol
+    procs, busy, switch = [], [], []
+    counts = []
+    for share, dispatches, pid in gantt_columns(read_event_log(path), start, end, width):
+        if pid is None:
+            procs.append(' ')
+        else:
+            if pid not in symbols and len(symbols) < len(GANTT_SYMBOLS):
+                symbols[pid] = GANTT_SYMBOLS[len(symbols)]
+            procs.append(symbols.get(pid, '+'))
+        busy.append(GANTT_SHADES[min(int(share * (len(GANTT_SHADES) - 1) + 0.5), len(GANTT_SHADES) - 1)])
+        counts.append(dispatches)
+    peak = max(counts) or 1
+    switch = [GANTT_SHADES[-(-c * (len(GANTT_SHADES) - 1) // peak)] for c in counts]
+    print(f"\nGantt Chart: time {start} to {end}, {(end - start) / width:g} time unit(s) per column", file=file)
+    print(f"Process |{''.join(procs)}|", file=file)
+    print(f"Busy    |{''.join(busy)}|", file=file)
+    print(f"Switch  |{''.join(switch)}| (max {peak} dispatches per column)", file=file)
+    if symbols:
+        print("Legend: " + "  ".join(f"{s}=P{pid}" for pid, s in symbols.items()), file=file)
+
+def render_gantt_svg(path, out_path, width=1000, start=None, end=None):
+    """
+    Writes an SVG Gantt chart of an event log, downsampled to at most width
+    columns: one bar per run of columns held by the same process, coloured
+    by process and faded by CPU utilization. Returns the number of bars.
+    """
+    span = event_log_span(path)
+    if span is None:
+        raise ValueError("Empty event log.")
+    start = span[0] if start is None else start
+    end = span[1] if end is None else end
+    if end <= start:
+        raise ValueError("Nothing to draw: the end time must be after the start time.")
+    width = max(1, min(width, end - start))
+    bars = 0
+    with open(out_path, 'w') as out:
+        out.write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} 60" '
+                  f'preserveAspectRatio="none" width="{max(width, 600)}" height="120">\n')
+        out.write(f'<text x="0" y="58" font-size="8">{start}</text>'
+                  f'<text x="{width}" y="58" font-size="8" text-anchor="end">{end}</text>\n')
+        run_pid, run_start, run_busy = None, 0, 0.0
+
+        def bar(x1):
+            nonlocal bars
+            if run_pid is not None:
+                hue = run_pid * 137 % 360 # Spread consecutive pids around the colour wheel
+                opacity = run_busy / (x1 - run_start)
+                out.write(f'<rect x="{run_start}" y="5" width="{x1 - run_start}" height="40" '
+                          f'fill="hsl({hue},70%,50%)" fill-opacity="{opacity:.2f}"><title>P{run_pid}</title></rect>\n')
+                bars += 1
+
+        for x, (share, _, pid) in enumerate(gantt_columns(read_event_log(path), start, end, width)):
+            if pid != run_pid:
+                bar(x)
+                run_pid, run_start, run_busy = pid, x, 0.0
+            run_busy += share
+        bar(width)
+        out.write('</svg>\n')
+    return bars
+
+def priority_scheduling():
+    """
+    Simulates Non-Preemptive Priority Scheduling.
+    Lower number implies higher priority (standard convention).
+    """
+    print("\n--- Priority Scheduling (Non-Preemptive) ---")
+    try:
+        n = int(input("Enter number of processes: "))
+        processes = []
+        for i in range(n):
+            print(f"\nProcess {i+1}:")
+            arrival = int(input("  Arrival Time: "))
+            burst = int(input("  Burst Time: "))
+            priority = int(input("  Priority (1 is highest): "))
+            processes.append(Job(i+1, arrival, burst, priority))
+        
+        log = EventLog(io.BytesIO())
+        result_sequence = run_kernel(processes, PriorityPolicy(), log=log)
+        processes.sort(key=lambda x: (x.at, x.id)) # Report in arrival order
+        log.close()
+        show_table = input("Show per-process table? (y/n): ").lower() == 'y'
+        show_gantt = input("Show Gantt chart? (y/n): ").lower() == 'y'
+
+        print("\nProcess Execution Order:", " -> ".join(map(str, result_sequence)))
+        if show_table:
+            print(f"\n{'ID':<5}{'Priority':<10}{'Arrival':<10}{'Burst':<10}{'Wait':<10}{'Turnaround':<10}")
+            for p in processes:
+                print(f"{p.id:<5}{p.p:<10}{p.at:<10}{p.bt:<10}{p.wt:<10}{p.tat:<10}")
+
+        if show_gantt:
+            render_gantt_text(log.file)
+        print()
+        print_summary(job_metrics(processes))
+
+    except ValueError:
+        print("Invalid input. Please enter integers.")
+
+def round_robin_scheduling():
+    """
+    Simulates Round Robin Scheduling with a Time Quantum.
+    Processes join a FIFO ready queue as they arrive; a process whose quantum
+    expires goes behind any process that arrived during its slice.
+    """
+    print("\n--- Round Robin Scheduling ---")
+    try:
+        n = int(input("Enter number of processes: "))
+        time_quantum = int(input("Enter Time Quantum: "))
+        context_switch = int(input("Enter Context Switch Time (0 for none): "))
+        processes = []
+        for i in range(n):
+            print(f"Process {i+1}:")
+            arrival = int(input("  Arrival Time: "))
+            burst = int(input("  Burst Time: "))
+            processes.append(Job(i+1, arrival, burst))
+
+        log = EventLog(io.BytesIO())
+        result_sequence = run_kernel(processes, RoundRobinPolicy(time_quantum), context_switch, log=log)
+        log.close()
+        show_table = input("Show per-process table? (y/n): ").lower() == 'y'
+        show_gantt = input("Show Gantt chart? (y/n): ").lower() == 'y'
+
+        if show_table:
+            print(f"\n{'ID':<5}{'Arrival':<10}{'Burst':<10}{'Wait':<10}{'Turnaround':<10}")
+            for p in processes:
+                print(f"{p.id:<5}{p.at:<10}{p.bt:<10}{p.wt:<10}{p.tat:<10}")
+
+        if show_gantt:
+            render_gantt_text(log.file)
+        print(f"\nContext Switches: {max(len(result_sequence) - 1, 0)}")
+        print_summary(job_metrics(processes))
+
+    except ValueError:
+        print("Invalid input.")
+
+def preemptive_scheduling():
+    """
+    Simulates the preemptive policies: Preemptive Priority, SRTF and MLFQ.
+    """
+    print("\n--- Preemptive Scheduling ---")
+    print("1. Preemptive Priority")
+    print("2. Shortest Remaining Time First (SRTF)")
+    print("3. Multi-Level Feedback Queue (MLFQ)")
+    choice = input("Choice: ")
+
+    try:
+        if choice == '1':
+            policy = PriorityPolicy(preemptive=True)
+        elif choice == '2':
+            policy = SRTFPolicy()
+        elif choice == '3':
+            quanta = input("Enter quanta per level, last level FCFS (e.g. 4 8): ").split()
+            policy = MLFQPolicy([int(q) for q in quanta] + [None])
+        else:
+            print("Invalid choice.")
+            return
+
+        n = int(input("Enter number of processes: "))
+        processes = []
+        for i in range(n):
+            print(f"\nProcess {i+1}:")
+            arrival = int(input("  Arrival Time: "))
+            burst = int(input("  Burst Time: "))
+            priority = int(input("  Priority (1 is highest): ")) if choice == '1' else 0
+            processes.append(Job(i+1, arrival, burst, priority))
+
+        log = EventLog(io.BytesIO())
+        result_sequence = run_kernel(processes, policy, log=log)
+        log.close()
+        show_table = input("Show per-process table? (y/n): ").lower() == 'y'
+        show_gantt = input("Show Gantt chart? (y/n): ").lower() == 'y'
+
+        print("\nProcess Execution Order:", " -> ".join(map(str, result_sequence)))
+        if show_table:
+            print(f"\n{'ID':<5}{'Priority':<10}{'Arrival':<10}{'Burst':<10}{'Wait':<10}{'Turnaround':<10}")
+            for p in processes:
+                print(f"{p.id:<5}{p.p:<10}{p.at:<10}{p.bt:<10}{p.wt:<10}{p.tat:<10}")
+
+        if show_gantt:
+            render_gantt_text(log.file)
+        print()
+        print_summary(job_metrics(processes))
+
+    except ValueError:
+        print("Invalid input.")
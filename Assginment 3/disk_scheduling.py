@@ -0,0 +1,238 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; disk metrics fall back to pure Python
+    np = None
+
+from structures import SortedList
+from cpu_scheduling import percentile
+
+# ==========================================
+# PART 5: DISK SCHEDULING
+# ==========================================
+
+DISK_ALGORITHMS = {'1': 'fcfs', '2': 'sstf', '3': 'scan', '4': 'cscan', '5': 'look', '6': 'clook'}
+DISK_RESULT_FIELDS = ('id', 'block', 'at', 'ct', 'seek')
+
+def _disk_requests(requests):
+    """
+    Yields (id, at, block) for each request, checking that they come in
+    arrival order. Requests are records with 'block' (and optionally 'id' and
+    'at'), or bare block numbers, which all arrive at time 0.
+    """
+    last_at = 0
+    for i, r in enumerate(requests):
+        if isinstance(r, int):
+            yield i + 1, 0, r
+            continue
+        at = r.get('at') or 0
+        if at < last_at:
+            raise ValueError("Requests must be in arrival order.")
+        last_at = at
+        yield r.get('id', i + 1), at, int(r['block'])
+
+def schedule_disk(requests, algorithm, head=0, cylinders=None, seek_time=1, transfer_time=0, direction=1):
+    """
+    Disk-arm scheduling kernel. Streams requests in arrival order and yields
+    each one as it is served: {'id', 'block', 'at', 'ct', 'seek'}, where ct is
+    when its transfer completed and seek the cylinders the arm moved since the
+    previous request. That includes SCAN's sweep to the edge of the disk and
+    the return sweep of C-SCAN and C-LOOK.
+
+    Moving one cylinder takes seek_time and reading a block transfer_time.
+    Each time the arm is free it picks from the requests that have arrived,
+    so with every arrival at 0 this is the textbook algorithm on a fixed queue.
+    FCFS keeps a queue. The others keep the distinct pending blocks in a
+    SortedList, with a FIFO of requests per block, and find the next block
+    with a bisect instead of scanning every pending request.
+    """
+    algorithm = DISK_ALGORITHMS.get(algorithm, algorithm)
+    if algorithm not in DISK_ALGORITHMS.values():
+        raise ValueError(f"Unknown disk scheduling algorithm: {algorithm}")
+    if algorithm in ('scan', 'cscan') and cylinders is None:
+        raise ValueError("SCAN and C-SCAN need the number of cylinders.")
+    if head < 0 or (cylinders is not None and head >= cylinders):
+        raise ValueError("Head position is outside the disk.")
+
+    arrivals = _disk_requests(requests)
+    upcoming = next(arrivals, None)
+    fifo = deque()
+    blocks = SortedList()
+    waiting = {} # block -> deque of (id, at)
+    pending = 0
+    t = 0
+    moved = 0 # Cylinders moved since the last request was served
+    end = cylinders - 1 if cylinders else None
+
+    while True:
+        while upcoming is not None and upcoming[1] <= t:
+            block = upcoming[2]
+            if block < 0 or (cylinders is not None and block >= cylinders):
+                raise ValueError(f"Block {block} is outside the disk.")
+            if algorithm == 'fcfs':
+                fifo.append(upcoming)
+            else:
+                queue = waiting.get(block)
+                if queue is None:
+                    queue = waiting[block] = deque()
+                    blocks.add(block)
+                queue.append(upcoming[:2])
+            pending += 1
+            upcoming = next(arrivals, None)
+        if not pending:
+            if upcoming is None:
+                break
+            t = upcoming[1]
+            continue
+
+        if algorithm == 'fcfs':
+            rid, at, block = fifo.popleft()
+        else:
+            if algorithm == 'sstf':
+                up, down = blocks.ceiling(head), blocks.floor(head)
+                block = up if down is None or (up is not None and up - head <= head - down) else down
+            elif algorithm in ('scan', 'look'):
+                block = blocks.ceiling(head) if direction > 0 else blocks.floor(head)
+                if block is None:
+                    if algorithm == 'scan':
+                        edge = end if direction > 0 else 0
+                        moved += abs(edge - head)
+                        t += abs(edge - head) * seek_time
+                        head = edge
+                    direction = -direction
+                    continue # Admit anything that arrived during the sweep before choosing
+            else:
+                block = blocks.ceiling(head)
+                if block is None:
+                    if algorithm == 'cscan':
+                        travel = (end - head) + end # Out to the last cylinder, then back to cylinder 0
+                        moved += travel
+                        t += travel * seek_time
+                        head = 0
+                        continue
+                    block = blocks.ceiling(0) # C-LOOK jumps straight back to the lowest request
+            queue = waiting[block]
+            rid, at = queue.popleft()
+            if not queue:
+                del waiting[block]
+                blocks.remove(block)
+        pending -= 1
+
+        distance = abs(block - head)
+        moved += distance
+        t += distance * seek_time + transfer_time
+        head = block
+        yield {'id': rid, 'block': block, 'at': at, 'ct': t, 'seek': moved}
+        moved = 0
+
+def disk_metrics(results):
+    """
+    Consumes served requests (e.g. from schedule_disk) into seek and latency
+    columns, and returns compute_disk_metrics() of them.
+    """
+    seek, latency = array('q'), array('q')
+    for r in results:
+        seek.append(r['seek'])
+        latency.append(r['ct'] - r['at'])
+    return compute_disk_metrics(seek, latency)
+
+def compute_disk_metrics(seek, latency):
+    """
+    Computes total head movement, mean seek per request, and mean,
+    p50/p95/p99 and max latency (completion - arrival) from seek and
+    latency columns.
+    """
+    n = len(latency)
+    if n == 0:
+        raise ValueError("No requests to report on.")
+
+    if np is not None:
+        values = np.asarray(latency, dtype=np.int64)
+        movement = int(np.asarray(seek, dtype=np.int64).sum())
+        p = np.percentile(values, [50, 95, 99])
+        avg_latency, max_latency = float(values.mean()), int(values.max())
+    else:
+        movement = sum(seek)
+        ordered = sorted(latency)
+        p = [percentile(ordered, q) for q in (50, 95, 99)]
+        avg_latency, max_latency = sum(ordered) / n, ordered[-1]
+
+    return {
+        'n': n, 'head_movement': movement, 'avg_seek': movement / n,
+        'avg_latency': avg_latency, 'p50_latency': float(p[0]), 'p95_latency': float(p[1]),
+        'p99_latency': float(p[2]), 'max_latency': max_latency,
+    }
+
+def compare_disk_schedulers(requests, algorithms, head=0, cylinders=None, seek_time=1, transfer_time=0):
+    """
+    Runs the same request stream through several disk scheduling algorithms.
+    requests is a list, or a zero-argument callable returning a fresh stream.
+    Returns {algorithm: disk_metrics}.
+    """
+    table = {}
+    for algorithm in algorithms:
+        stream = requests() if callable(requests) else requests
+        table[algorithm] = disk_metrics(schedule_disk(stream, algorithm, head, cylinders,
+                                                      seek_time, transfer_time))
+    return table
+
+def print_disk_comparison(table, file=None):
+    print(f"\n{'Algorithm':<12}{'Head Movement':<16}{'Avg Seek':<12}{'Avg Latency':<14}"
+          f"{'p95 Latency':<14}{'p99 Latency':<14}{'Max Latency':<12}", file=file)
+    for label, m in table.items():
+        print(f"{label:<12}{m['head_movement']:<16}{m['avg_seek']:<12.2f}{m['avg_latency']:<14.2f}"
+              f"{m['p95_latency']:<14.2f}{m['p99_latency']:<14.2f}{m['max_latency']:<12}", file=file)
+
+def file_read_requests(disk, names=None):
+    """
+    Yields the block numbers read to read back files of a disk (Disk,
+    IndexedDisk or LinkedDisk), one whole file after another, so the layout
+    a file allocation simulation produced can drive the disk scheduler.
+    """
+    for name in list(disk.files if names is None else names):
+        yield from disk.read_order(name)
+
+def schedule_file_reads(disk):
+    """Reads every file of a disk back under each disk scheduling algorithm."""
+    requests = list(file_read_requests(disk))
+    if not requests:
+        print("No files to read.")
+        return
+    try:
+        head = int(input(f"Enter initial head position (0-{disk.total_blocks - 1}): "))
+        table = compare_disk_schedulers(requests, DISK_ALGORITHMS.values(), head, disk.total_blocks)
+    except ValueError as e:
+        print(f"Invalid input. {e}")
+        return
+    print(f"\nReading {len(requests)} blocks of {len(disk.files)} file(s):")
+    print_disk_comparison(table)
+
+def disk_scheduling():
+    """
+    Simulates disk-arm scheduling on a queue of block requests.
+    """
+    print("\n--- Disk Scheduling ---")
+    try:
+        entry = input("Enter number of cylinders (default 200): ")
+        cylinders = int(entry) if entry.strip() else 200
+        head = int(input(f"Enter initial head position (0-{cylinders - 1}): "))
+        requests = [int(x) for x in input("Enter request queue (space separated): ").split()]
+        print("1. FCFS\n2. SSTF\n3. SCAN\n4. C-SCAN\n5. LOOK\n6. C-LOOK\n7. Compare All")
+        choice = input("Choice: ")
+        if choice == '7':
+            print_disk_comparison(compare_disk_schedulers(requests, DISK_ALGORITHMS.values(), head, cylinders))
+            return
+        if choice not in DISK_ALGORITHMS:
+            print("Invalid choice.")
+            return
+        served = list(schedule_disk(requests, choice, head, cylinders))
+    except ValueError as e:
+        print(f"Invalid input. {e}")
+        return
+
+    print("\nService Order: " + " -> ".join([str(head)] + [str(r['block']) for r in served]))
+    print(f"Total Head Movement: {sum(r['seek'] for r in served)} cylinders")
+    if served:
+        print(f"Average Seek: {sum(r['seek'] for r in served) / len(served):.2f} cylinders per request")
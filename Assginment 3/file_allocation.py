@@ -0,0 +1,671 @@
+import itertools
+import random
+from array import array
+
+from structures import ExtentIndex
+from disk_scheduling import schedule_file_reads
+
+# ==========================================
+# PART 2: FILE ALLOCATION STRATEGIES
+# ==========================================
+
+DISK_STRATEGIES = {'1': 'first', '2': 'best', '3': 'next'}
+
+class Disk:
+    """
+    Simulated disk for contiguous (sequential) file allocation.
+    The block map is a bytearray with one byte per block (0 = free,
+    1 = allocated), so marking or clearing a run of blocks is one slice
+    assignment. Free space is also kept as an ExtentIndex of free runs with a
+    running free count, so finding room for a file of length L never scans
+    the block map, even on very large disks.
+    """
+    def __init__(self, total_blocks):
+        if total_blocks <= 0:
+            raise ValueError("Disk must have at least one block.")
+        self.total_blocks = total_blocks
+        self.bitmap = bytearray(total_blocks)
+        self.extents = ExtentIndex([(0, total_blocks)])
+        self.files = {} # name -> (start, length)
+
+    @property
+    def free(self):
+        return self.extents.free
+
+    def allocate(self, name, length, start=None, strategy='first'):
+        """
+        Allocates length contiguous blocks to a file, from the given start
+        block or, if start is None, wherever the strategy (first/best/next
+        fit) finds room. Returns the start block, or -1 if there is no room.
+        """
+        strategy = DISK_STRATEGIES.get(strategy, strategy)
+        if name in self.files:
+            raise ValueError(f"File '{name}' already exists.")
+        if length <= 0:
+            raise ValueError("File length must be positive.")
+        if start is None:
+            start = self.extents.find(length, strategy)
+            if start is None:
+                return -1
+        elif start < 0 or start + length > self.total_blocks:
+            raise ValueError("File exceeds disk bounds.")
+
+        if not self.extents.carve(start, length):
+            return -1
+        self.bitmap[start:start + length] = b'\x01' * length
+        self.files[name] = (start, length)
+        return start
+
+    def delete(self, name):
+        """Frees a file's blocks. Returns False if there is no such file."""
+        if name not in self.files:
+            return False
+        start, length = self.files.pop(name)
+        self.bitmap[start:start + length] = bytes(length)
+        self.extents.release(start, length)
+        return True
+
+    def locate(self, name, k):
+        """
+        Finds block k of a file. Returns (path, lookups): the blocks read to
+        reach it, in order, and the pointer lookups needed. A contiguous file
+        needs no lookups: block k is simply start + k.
+        """
+        start, length = self.files[name]
+        if not 0 <= k < length:
+            raise ValueError(f"File '{name}' has no block {k}.")
+        return (start + k,), 0
+
+    def read_order(self, name):
+        """The blocks read, in order, to read a whole file."""
+        start, length = self.files[name]
+        return range(start, start + length)
+
+def sequential_allocation():
+    """
+    Simulates Sequential File Allocation.
+    """
+    print("\n--- Sequential File Allocation ---")
+    entry = input("Enter total disk blocks (default 50): ")
+    try:
+        disk = Disk(int(entry) if entry.strip() else 50)
+    except ValueError:
+        print("Invalid input.")
+        return
+    total_blocks = disk.total_blocks
+
+    while True:
+        print(f"\nDisk Status (Total: {total_blocks} blocks): {disk.free} free")
+        choice = input("1. Allocate File (Choose Start Block)\n2. Allocate File (Automatic Placement)\n"
+                       "3. Delete File\n4. Show Files\n5. Schedule File Reads\n6. Exit to Main Menu\nChoice: ")
+        
+        if choice in ('1', '2'):
+            name = input("Enter file name: ")
+            try:
+                if choice == '1':
+                    start = int(input(f"Enter starting block (0-{total_blocks-1}): "))
+                    strategy = None
+                else:
+                    start = None
+                    strategy = input("Placement: 1. First Fit  2. Best Fit  3. Next Fit\nChoice: ")
+                length = int(input("Enter length of file: "))
+                
+                if name in disk.files:
+                    print(f"Error: File '{name}' already exists.")
+                    continue
+                if start is not None and (start < 0 or start + length > total_blocks):
+                    print("Error: File exceeds disk bounds.")
+                    continue
+                
+                start = disk.allocate(name, length, start, strategy or 'first')
+                if start != -1:
+                    print(f"File '{name}' allocated successfully at blocks {start} to {start+length-1}.")
+                elif choice == '1':
+                    print("Error: Blocks already allocated.")
+                else:
+                    print(f"Error: No run of {length} free blocks (largest is {disk.extents.largest()}).")
+            except ValueError:
+                print("Invalid input.")
+
+        elif choice == '3':
+            name = input("Enter file name: ")
+            if disk.delete(name):
+                print(f"File '{name}' deleted.")
+            else:
+                print(f"Error: No file named '{name}'.")
+
+        elif choice == '4':
+            print("\nAllocated Files:")
+            for name, (start, length) in disk.files.items():
+                print(f"File: {name} | Start: {start} | Length: {length}")
+            print(f"Free Extents: {len(disk.extents)} | Largest: {disk.extents.largest()}")
+
+        elif choice == '5':
+            schedule_file_reads(disk)
+        
+        elif choice == '6':
+            break
+
+class BlockPool:
+    """
+    Free-block pool for non-contiguous allocation.
+    Blocks are tracked in a bytearray block map (0 = free, 1 = allocated) with
+    a running free count and a rotating cursor: free blocks are found with
+    C-level bytearray.find() calls from where the last allocation stopped,
+    and whole runs of free blocks are claimed with one slice assignment, so
+    allocating never rebuilds a free list of the whole disk.
+    """
+    def __init__(self, total_blocks):
+        if total_blocks <= 0:
+            raise ValueError("Disk must have at least one block.")
+        self.total_blocks = total_blocks
+        self.bitmap = bytearray(total_blocks)
+        self.free = total_blocks
+        self.cursor = 0
+
+    def reserve(self, block):
+        """Marks a single block as used (e.g. by something outside the simulation)."""
+        if not self.bitmap[block]:
+            self.bitmap[block] = 1
+            self.free -= 1
+
+    def take(self, count=1):
+        """Allocates count free blocks at or after the cursor, wrapping around."""
+        if count > self.free:
+            raise ValueError("Not enough free blocks.")
+        blocks = []
+        while len(blocks) < count:
+            start = self.bitmap.find(0, self.cursor)
+            if start == -1:
+                start = self.bitmap.find(0, 0, self.cursor)
+            limit = min(start + count - len(blocks), self.total_blocks)
+            end = self.bitmap.find(1, start, limit)
+            if end == -1:
+                end = limit
+            self.bitmap[start:end] = b'\x01' * (end - start)
+            blocks.extend(range(start, end))
+            self.cursor = end if end < self.total_blocks else 0
+        self.free -= count
+        return blocks
+
+    def give(self, blocks):
+        """
+        Returns blocks to the pool. Every block is checked first, so giving
+        back one that is already free (or the same one twice) raises
+        ValueError and leaves the pool unchanged.
+        """
+        blocks = list(blocks)
+        for block in blocks:
+            if not self.bitmap[block]:
+                raise ValueError(f"Block {block} is already free.")
+        if len(set(blocks)) != len(blocks):
+            raise ValueError("A block is given back more than once.")
+        for block in blocks:
+            self.bitmap[block] = 0
+        self.free += len(blocks)
+
+class IndexedDisk:
+    """
+    Simulated disk for indexed (inode-style) file allocation, drawing blocks
+    from a BlockPool.
+
+    Each file has an index block holding pointers_per_block pointers: all but
+    the last two point straight at data blocks, the second to last at a
+    single-indirect block (pointers_per_block data pointers) and the last at a
+    double-indirect block (pointers to single-indirect blocks).
+    """
+    def __init__(self, total_blocks, pointers_per_block=8):
+        if pointers_per_block < 3:
+            raise ValueError("An index block needs room for at least 3 pointers.")
+        self.pool = BlockPool(total_blocks)
+        self.total_blocks = total_blocks
+        self.pointers = pointers_per_block
+        self.direct = pointers_per_block - 2
+        self.files = {} # name -> file record (see create)
+        self.data_blocks = 0
+        self.meta_blocks = 0
+
+    @property
+    def free(self):
+        return self.pool.free
+
+    def max_file_size(self):
+        return self.direct + self.pointers + self.pointers * self.pointers
+
+    def metadata_needed(self, size):
+        """Index and indirect blocks a file of size data blocks needs."""
+        blocks = 1
+        rest = size - self.direct
+        if rest > 0:
+            blocks += 1 # Single-indirect block
+            rest -= self.pointers
+        if rest > 0:
+            blocks += 1 + -(-rest // self.pointers) # Double-indirect block and its children
+        return blocks
+
+    def reserve(self, block):
+        self.pool.reserve(block)
+
+    def create(self, name, size):
+        """
+        Creates a file of size data blocks. Returns its record:
+        {'index', 'direct', 'single', 'double', 'data', 'meta'} where 'single'
+        is (block, pointers), 'double' is (block, [(block, pointers), ...]),
+        'data' lists every data block in file order and 'meta' every index block.
+        Returns None if the disk does not have enough free blocks.
+        """
+        if name in self.files:
+            raise ValueError(f"File '{name}' already exists.")
+        if size < 0:
+            raise ValueError("File size cannot be negative.")
+        if size > self.max_file_size():
+            raise ValueError(f"File too large: at most {self.max_file_size()} blocks.")
+        meta_needed = self.metadata_needed(size)
+        if self.free < size + meta_needed:
+            return None
+
+        index = self.pool.take()[0]
+        meta = array('i', [index])
+        data = array('i')
+        direct = self.pool.take(min(size, self.direct))
+        data.extend(direct)
+        rest = size - len(direct)
+
+        single = None
+        if rest > 0:
+            block = self.pool.take()[0]
+            meta.append(block)
+            pointers = self.pool.take(min(rest, self.pointers))
+            data.extend(pointers)
+            rest -= len(pointers)
+            single = (block, pointers)
+
+        double = None
+        if rest > 0:
+            top = self.pool.take()[0]
+            meta.append(top)
+            children = []
+            while rest > 0:
+                block = self.pool.take()[0]
+                meta.append(block)
+                pointers = self.pool.take(min(rest, self.pointers))
+                data.extend(pointers)
+                rest -= len(pointers)
+                children.append((block, pointers))
+            double = (top, children)
+
+        record = {'index': index, 'direct': direct, 'single': single, 'double': double,
+                  'data': data, 'meta': meta}
+        self.files[name] = record
+        self.data_blocks += len(data)
+        self.meta_blocks += len(meta)
+        return record
+
+    def delete(self, name):
+        """Frees every data and index block of a file. Returns False if there is no such file."""
+        record = self.files.get(name)
+        if record is None:
+            return False
+        self.pool.give(itertools.chain(record['data'], record['meta'])) # Raises before any change
+        del self.files[name]
+        self.data_blocks -= len(record['data'])
+        self.meta_blocks -= len(record['meta'])
+        return True
+
+    def locate(self, name, k):
+        """
+        Finds block k of a file. Returns (path, lookups): the index block, any
+        indirect blocks and the data block, in the order they are read, and
+        the number of pointers followed to get there.
+        """
+        record = self.files[name]
+        if not 0 <= k < len(record['data']):
+            raise ValueError(f"File '{name}' has no block {k}.")
+        if k < self.direct:
+            path = (record['index'], record['data'][k])
+        elif k < self.direct + self.pointers:
+            path = (record['index'], record['single'][0], record['data'][k])
+        else:
+            top, children = record['double']
+            child = children[(k - self.direct - self.pointers) // self.pointers][0]
+            path = (record['index'], top, child, record['data'][k])
+        return path, len(path) - 1
+
+    def read_order(self, name):
+        """
+        The blocks read, in order, to read a whole file: the index block and
+        its direct data blocks, then each indirect block followed by the data
+        blocks it points to.
+        """
+        record = self.files[name]
+        yield record['index']
+        yield from record['direct']
+        if record['single']:
+            block, pointers = record['single']
+            yield block
+            yield from pointers
+        if record['double']:
+            top, children = record['double']
+            yield top
+            for block, pointers in children:
+                yield block
+                yield from pointers
+
+    def metadata_overhead(self):
+        """Share of the files' blocks (not reserved ones) used for index blocks rather than data."""
+        used = self.data_blocks + self.meta_blocks
+        return self.meta_blocks / used if used else 0.0
+
+def indexed_allocation():
+    """
+    Simulates Indexed File Allocation.
+    """
+    print("\n--- Indexed File Allocation ---")
+    total_blocks = 50
+    disk = IndexedDisk(total_blocks)
+    # Randomly occupy some blocks to make it realistic
+    for i in range(10):
+        disk.reserve(random.randint(0, 49))
+        
+    print(f"Disk initialized with {total_blocks - disk.free} used blocks (random).")
+    print(f"Index block: {disk.direct} direct pointers + 1 single-indirect + 1 double-indirect "
+          f"(max file size {disk.max_file_size()} blocks).")
+    
+    while True:
+        choice = input("\n1. Create File\n2. Delete File\n3. Show Files\n4. Schedule File Reads\n5. Exit to Main Menu\nChoice: ")
+        if choice == '1':
+            name = input("Enter file name: ")
+            try:
+                size = int(input("Enter file size (in blocks): "))
+                record = disk.create(name, size)
+                if record is None:
+                    print("Error: Not enough memory.")
+                    continue
+                
+                print(f"\nFile '{name}' Allocated.")
+                print(f"Index Block: {record['index']}")
+                print(f"Data Blocks pointers in Index Block: {record['direct']}")
+                if record['single']:
+                    block, pointers = record['single']
+                    print(f"Single Indirect Block: {block} -> {pointers}")
+                if record['double']:
+                    block, children = record['double']
+                    print(f"Double Indirect Block: {block}")
+                    for child, pointers in children:
+                        print(f"  Indirect Block: {child} -> {pointers}")
+                
+            except ValueError as e:
+                print(f"Invalid input. {e}")
+        elif choice == '2':
+            name = input("Enter file name: ")
+            if disk.delete(name):
+                print(f"File '{name}' deleted.")
+            else:
+                print(f"Error: No file named '{name}'.")
+        elif choice == '3':
+            print("\nAllocated Files:")
+            for name, record in disk.files.items():
+                print(f"File: {name} | Index Block: {record['index']} | Data Blocks: {len(record['data'])} "
+                      f"| Index Blocks: {len(record['meta'])}")
+            print(f"Free Blocks: {disk.free} | Metadata Overhead: {disk.metadata_overhead() * 100:.2f}%")
+        elif choice == '4':
+            schedule_file_reads(disk)
+        elif choice == '5':
+            break
+
+FREE, END = -2, -1 # Next-pointer table markers
+
+class LinkedDisk:
+    """
+    Simulated disk for linked file allocation, drawing blocks from a BlockPool.
+    Each allocated block's successor is kept in one array('i') next-pointer
+    table (FREE for free blocks, END for the last block of a file).
+
+    In linked mode the pointer lives in the data block itself, so reaching
+    block k of a file means reading blocks 0..k from disk. In FAT mode the
+    table is a File Allocation Table held in memory: the chain is walked in
+    the table and only the data block itself is read.
+
+    With cache=True each file also keeps the part of its block list walked so
+    far, so reading a block that has been reached before costs no pointer
+    lookups, and walking further resumes from the furthest block known.
+    """
+    def __init__(self, total_blocks, fat=False, cache=False):
+        self.pool = BlockPool(total_blocks)
+        self.total_blocks = total_blocks
+        self.next = array('i', [FREE]) * total_blocks
+        self.fat = fat
+        self.cache = cache
+        self.files = {} # name -> (start, length)
+        self.cached = {} # name -> array('i') of the blocks walked so far
+
+    @property
+    def free(self):
+        return self.pool.free
+
+    def create(self, name, size):
+        """
+        Allocates size blocks to a file and links them in order.
+        Returns the start block, or None if there are not enough free blocks.
+        """
+        if name in self.files:
+            raise ValueError(f"File '{name}' already exists.")
+        if size <= 0:
+            raise ValueError("File length must be positive.")
+        if size > self.free:
+            return None
+        blocks = self.pool.take(size)
+        nxt = self.next
+        for block, successor in zip(blocks, itertools.islice(blocks, 1, None)):
+            nxt[block] = successor
+        nxt[blocks[-1]] = END
+        self.files[name] = (blocks[0], size)
+        return blocks[0]
+
+    def chain(self, name):
+        """Yields a file's blocks in order by following the next pointers."""
+        block = self.files[name][0]
+        nxt = self.next
+        while block != END:
+            yield block
+            block = nxt[block]
+
+    def block_list(self, name):
+        return array('i', self.chain(name))
+
+    def read_order(self, name):
+        """The blocks read, in order, to read a whole file: its chain."""
+        return self.chain(name)
+
+    def delete(self, name):
+        """Frees every block of a file. Returns False if there is no such file."""
+        if name not in self.files:
+            return False
+        blocks = self.block_list(name)
+        self.pool.give(blocks) # Raises before any change
+        for block in blocks:
+            self.next[block] = FREE
+        del self.files[name]
+        self.cached.pop(name, None)
+        return True
+
+    def locate(self, name, k):
+        """
+        Finds block k of a file. Returns (path, lookups): the blocks read from
+        disk to reach it, in order, and the next pointers followed.
+        """
+        start, length = self.files[name]
+        if not 0 <= k < length:
+            raise ValueError(f"File '{name}' has no block {k}.")
+        if self.cache:
+            known = self.cached.get(name)
+            if known is None:
+                known = self.cached[name] = array('i', [start])
+            if k < len(known):
+                return (known[k],), 0
+            first = len(known) - 1 # Resume the walk from the furthest block known
+        else:
+            known = array('i', [start])
+            first = 0
+        nxt = self.next
+        block = known[-1]
+        for _ in range(k - first):
+            block = nxt[block]
+            known.append(block)
+        if self.fat:
+            return (block,), k - first
+        return tuple(known[first:k + 1]), k - first
+
+def linked_allocation():
+    """
+    Simulates Linked File Allocation, with the next pointers either in the
+    data blocks or in a File Allocation Table.
+    """
+    print("\n--- Linked File Allocation ---")
+    try:
+        entry = input("Enter total disk blocks (default 50): ")
+        total_blocks = int(entry) if entry.strip() else 50
+        mode = input("1. Linked (pointer in each block)  2. FAT (pointer table in memory)\nChoice: ")
+        cache = input("Cache each file's block list? (y/n): ").lower() == 'y'
+        disk = LinkedDisk(total_blocks, fat=mode == '2', cache=cache)
+    except ValueError:
+        print("Invalid input.")
+        return
+    # Randomly occupy some blocks so files are scattered across the disk
+    for i in range(total_blocks // 5):
+        disk.pool.reserve(random.randrange(total_blocks))
+    print(f"Disk initialized with {total_blocks - disk.free} used blocks (random).")
+
+    while True:
+        choice = input("\n1. Create File\n2. Delete File\n3. Show Files\n4. Read Block\n"
+                       "5. Schedule File Reads\n6. Exit to Main Menu\nChoice: ")
+        if choice == '1':
+            name = input("Enter file name: ")
+            try:
+                size = int(input("Enter file size (in blocks): "))
+                if disk.create(name, size) is None:
+                    print("Error: Not enough memory.")
+                    continue
+                print(f"\nFile '{name}' Allocated.")
+                print("Block Chain: " + " -> ".join(map(str, disk.chain(name))) + " -> END")
+            except ValueError as e:
+                print(f"Invalid input. {e}")
+        elif choice == '2':
+            name = input("Enter file name: ")
+            if disk.delete(name):
+                print(f"File '{name}' deleted.")
+            else:
+                print(f"Error: No file named '{name}'.")
+        elif choice == '3':
+            print("\nAllocated Files:")
+            for name, (start, length) in disk.files.items():
+                print(f"File: {name} | Start Block: {start} | Length: {length}")
+            print(f"Free Blocks: {disk.free}")
+        elif choice == '4':
+            name = input("Enter file name: ")
+            try:
+                k = int(input("Enter block number within the file: "))
+                path, lookups = disk.locate(name, k)
+                print(f"Block {k} of '{name}' is disk block {path[-1]}: "
+                      f"{len(path)} block(s) read, {lookups} pointer(s) followed.")
+            except KeyError:
+                print(f"Error: No file named '{name}'.")
+            except ValueError as e:
+                print(f"Invalid input. {e}")
+        elif choice == '5':
+            schedule_file_reads(disk)
+        elif choice == '6':
+            break
+
+def access_cost(disk, accesses, head=0):
+    """
+    Replays (name, k) block reads against a disk (Disk, IndexedDisk or
+    LinkedDisk) and totals their cost: blocks read from disk, head movement
+    in blocks between consecutive reads, and pointer lookups. Reads of
+    missing files or blocks are counted as misses.
+    """
+    cost = {'accesses': 0, 'disk_reads': 0, 'seek': 0, 'lookups': 0, 'misses': 0}
+    for name, k in accesses:
+        try:
+            path, lookups = disk.locate(name, k)
+        except (KeyError, ValueError):
+            cost['misses'] += 1
+            continue
+        for block in path:
+            cost['seek'] += abs(block - head)
+            head = block
+        cost['accesses'] += 1
+        cost['disk_reads'] += len(path)
+        cost['lookups'] += lookups
+    return cost
+
+FILE_LAYOUTS = ('sequential', 'indexed', 'linked', 'fat', 'linked+cache', 'fat+cache')
+
+def make_file_disk(layout, total_blocks, pointers_per_block=128):
+    """Builds an empty disk for one of FILE_LAYOUTS."""
+    if layout == 'sequential':
+        return Disk(total_blocks)
+    if layout == 'indexed':
+        return IndexedDisk(total_blocks, pointers_per_block)
+    kind, _, cache = layout.partition('+')
+    if kind in ('linked', 'fat') and cache in ('', 'cache'):
+        return LinkedDisk(total_blocks, fat=kind == 'fat', cache=bool(cache))
+    raise ValueError(f"Unknown file layout: {layout}")
+
+def replay_file_trace(records, disk, head=0):
+    """
+    Replays a file trace against a disk and returns its access_cost() totals
+    plus 'files' and 'failed_creates'. Records have a 'name' and an 'op':
+    'create' (with 'size'), 'delete' or 'read' (with 'block', the block
+    number within the file).
+    """
+    failed = 0
+
+    def reads():
+        nonlocal failed
+        for i, r in enumerate(records):
+            name = r.get('name', r.get('id', i + 1))
+            op = r.get('op', 'create')
+            if op == 'read':
+                yield name, int(r.get('block') or 0)
+            elif op == 'delete':
+                disk.delete(name)
+            else:
+                size = int(r['size'])
+                try:
+                    if isinstance(disk, Disk):
+                        ok = disk.allocate(name, size) != -1
+                    else:
+                        ok = disk.create(name, size) is not None
+                except ValueError:
+                    ok = False
+                failed += not ok
+
+    cost = access_cost(disk, reads(), head)
+    cost['files'] = len(disk.files)
+    cost['failed_creates'] = failed
+    return cost
+
+def compare_file_layouts(records, layouts, total_blocks, pointers_per_block=128):
+    """
+    Runs the same file trace through several disk layouts.
+    records is a list, or a zero-argument callable returning a fresh stream.
+    Returns {layout: cost} with per-access averages added.
+    """
+    table = {}
+    for layout in layouts:
+        disk = make_file_disk(layout, total_blocks, pointers_per_block)
+        cost = replay_file_trace(records() if callable(records) else records, disk)
+        n = cost['accesses']
+        cost['avg_seek'] = cost['seek'] / n if n else 0.0
+        cost['avg_reads'] = cost['disk_reads'] / n if n else 0.0
+        cost['avg_lookups'] = cost['lookups'] / n if n else 0.0
+        table[layout] = cost
+    return table
+
+def print_layout_comparison(table, file=None):
+    print(f"\n{'Layout':<14}{'Reads':<10}{'Misses':<8}{'Avg Seek':<12}{'Disk Reads':<12}"
+          f"{'Lookups':<10}{'Failed Creates':<14}", file=file)
+    for label, c in table.items():
+        print(f"{label:<14}{c['accesses']:<10}{c['misses']:<8}{c['avg_seek']:<12.2f}{c['avg_reads']:<12.2f}"
+              f"{c['avg_lookups']:<10.2f}{c['failed_creates']:<14}", file=file)
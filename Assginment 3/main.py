@@ -1,361 +1,421 @@
-import random
+import argparse
+import csv
+import json
+import sys
 import time
+from array import array
+
+from cpu_scheduling import (EventLog, RESULT_FIELDS, compare_policies, compute_metrics, make_policy,
+    percentile, preemptive_scheduling, print_comparison, print_summary, priority_scheduling,
+    render_gantt_svg, render_gantt_text, round_robin_scheduling, stream_schedule)
+from file_allocation import (FILE_LAYOUTS, IndexedDisk, compare_file_layouts, indexed_allocation,
+    linked_allocation, make_file_disk, print_layout_comparison, replay_file_trace,
+    sequential_allocation)
+from memory import (ALLOCATION_STRATEGIES, MVTMemory, make_allocator, memory_allocation_simulation,
+    mft_mvt_simulation, print_fragmentation, replay_allocations, simulate_mvt)
+from disk_scheduling import (DISK_ALGORITHMS, DISK_RESULT_FIELDS, compare_disk_schedulers,
+    compute_disk_metrics, disk_scheduling, file_read_requests, print_disk_comparison, schedule_disk)
+from paging import PAGING_POLICIES, fault_curve, page_replacement, read_references
+from traces import (Sampler, TRACE_FIELDS, TRACE_KINDS, allocate_workload, disk_workload,
+    files_workload, mvt_workload, paging_workload, read_trace, schedule_workload, write_trace)
+from sweeps import allocate_grid, run_sweep, schedule_grid
+from bench import BENCHMARKS, find_regressions, print_benchmarks, run_benchmarks
 
 # ==========================================
-# PART 1: CPU SCHEDULING ALGORITHMS
+# BATCH MODE (TRACE FILES)
 # ==========================================
 
-def priority_scheduling():
+def write_records(records, path, fields):
     """
-    Simulates Non-Preemptive Priority Scheduling.
-    Lower number implies higher priority (standard convention).
+    Writes records as they are produced, as JSONL if path ends in .jsonl and
+    as CSV otherwise ('-' = stdout). Returns the number of records written.
     """
-    print("\n--- Priority Scheduling (Non-Preemptive) ---")
+    out = sys.stdout if path == '-' else open(path, 'w', newline='', buffering=1 << 20)
+    count = 0
     try:
-        n = int(input("Enter number of processes: "))
-        processes = []
-        for i in range(n):
-            print(f"\nProcess {i+1}:")
-            arrival = int(input("  Arrival Time: "))
-            burst = int(input("  Burst Time: "))
-            priority = int(input("  Priority (1 is highest): "))
-            # Store as [ID, Arrival, Burst, Priority, Waiting, Turnaround, Completion]
-            processes.append({'id': i+1, 'at': arrival, 'bt': burst, 'p': priority, 'wt': 0, 'tat': 0, 'ct': 0})
-        
-        # Sort by Arrival Time, then Priority
-        # Note: In a real simulation, we'd manage a ready queue based on time. 
-        # For this lab simulation, we'll sort primarily by priority for simplicity 
-        # assuming all arrive at 0 or handling a simple queue.
-        # Let's do a proper time-step simulation.
-        
-        processes.sort(key=lambda x: x['at']) # Initial sort by arrival
-        
-        completed = 0
-        current_time = 0
-        avg_wt = 0
-        avg_tat = 0
-        is_completed = [False] * n
-        result_sequence = []
-
-        while completed < n:
-            # Find processes that have arrived and are not completed
-            available_processes = []
-            for i in range(n):
-                if processes[i]['at'] <= current_time and not is_completed[i]:
-                    available_processes.append((processes[i]['p'], i)) # (Priority, Index)
-            
-            if available_processes:
-                # Select process with highest priority (lowest number)
-                available_processes.sort() 
-                _, idx = available_processes[0]
-                
-                # Execute process
-                p = processes[idx]
-                current_time += p['bt']
-                p['ct'] = current_time
-                p['tat'] = p['ct'] - p['at']
-                p['wt'] = p['tat'] - p['bt']
-                
-                avg_wt += p['wt']
-                avg_tat += p['tat']
-                is_completed[idx] = True
-                completed += 1
-                result_sequence.append(p['id'])
-            else:
-                current_time += 1
-
-        print("\nProcess Execution Order:", " -> ".join(map(str, result_sequence)))
-        print(f"\n{'ID':<5}{'Priority':<10}{'Arrival':<10}{'Burst':<10}{'Wait':<10}{'Turnaround':<10}")
-        for p in processes:
-            print(f"{p['id']:<5}{p['p']:<10}{p['at']:<10}{p['bt']:<10}{p['wt']:<10}{p['tat']:<10}")
-            
-        print(f"\nAverage Waiting Time: {avg_wt/n:.2f}")
-        print(f"Average Turnaround Time: {avg_tat/n:.2f}")
-
-    except ValueError:
-        print("Invalid input. Please enter integers.")
+        if path.endswith('.jsonl'):
+            for record in records:
+                out.write(json.dumps(record) + "\n")
+                count += 1
+        else:
+            writer = csv.writer(out)
+            writer.writerow(fields)
+            for record in records:
+                writer.writerow([record[field] for field in fields])
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count
 
-def round_robin_scheduling():
+def batch_main(argv):
     """
-    Simulates Round Robin Scheduling with a Time Quantum.
+    Non-interactive front end. Examples:
+      python main.py schedule rr jobs.csv --quantum 4 -o results.csv
+      python main.py schedule srtf jobs.csv --event-log run.evt
+      python main.py gantt run.evt --width 120 --start 0 --end 5000
+      python main.py compare jobs.csv --policies priority,srtf,rr --quantum 4
+      python main.py sweep schedule jobs.csv --policies rr,mlfq --quantum 1,2,4,8
+      python main.py allocate requests.jsonl --blocks 100,500,200 --strategy best
+      python main.py layouts files.csv --blocks 10000 --layouts sequential,indexed,fat+cache
+      python main.py disk requests.csv --cylinders 5000 --head 2500 --algorithms sstf,look
+      python main.py paging refs.txt --frames 1-64 --policies lru,opt -o curve.csv
+      python main.py generate schedule -n 1000000 --seed 1 --burst pareto -o jobs.csv
+      python main.py bench --sizes 1000,10000,100000 --baseline bench.json
+    Scheduling traces need 'bt' (and optionally 'id', 'at', 'p') in arrival order;
+    allocation traces need 'size' (and optionally 'op' = alloc/free and 'id');
+    MVT traces need 'id' and either 'op' = arrive/exit or 'at' and 'duration';
+    indexed allocation traces need 'name' and 'size' (and optionally 'op' = create/delete);
+    file layout traces need 'name' and 'op' = create (with 'size'), read (with 'block') or delete;
+    disk scheduling traces need 'block' (and optionally 'id', 'at') in arrival order;
+    paging traces are page numbers separated by whitespace or commas (or a 'page' column).
     """
-    print("\n--- Round Robin Scheduling ---")
-    try:
-        n = int(input("Enter number of processes: "))
-        time_quantum = int(input("Enter Time Quantum: "))
-        processes = []
-        for i in range(n):
-            print(f"Process {i+1}:")
-            burst = int(input("  Burst Time: "))
-            # For simplicity in this lab version, assuming all arrive at t=0
-            processes.append({'id': i+1, 'bt': burst, 'rem_bt': burst, 'wt': 0, 'tat': 0})
-        
-        current_time = 0
-        queue = processes[:] # All processes in queue initially (Arrival Time = 0)
-        completed_list = []
-        
-        while any(p['rem_bt'] > 0 for p in processes):
-            done_something = False
-            for p in processes:
-                if p['rem_bt'] > 0:
-                    done_something = True
-                    if p['rem_bt'] > time_quantum:
-                        current_time += time_quantum
-                        p['rem_bt'] -= time_quantum
-                    else:
-                        current_time += p['rem_bt']
-                        p['wt'] = current_time - p['bt']
-                        p['rem_bt'] = 0
-                        p['tat'] = current_time
-            if not done_something:
-                break
-
-        print(f"\n{'ID':<5}{'Burst':<10}{'Wait':<10}{'Turnaround':<10}")
-        avg_wt = 0
-        avg_tat = 0
-        for p in processes:
-            print(f"{p['id']:<5}{p['bt']:<10}{p['wt']:<10}{p['tat']:<10}")
-            avg_wt += p['wt']
-            avg_tat += p['tat']
-        
-        print(f"\nAverage Waiting Time: {avg_wt/n:.2f}")
-        print(f"Average Turnaround Time: {avg_tat/n:.2f}")
+    parser = argparse.ArgumentParser(prog='main.py', description="OS Lab simulators in batch mode.")
+    sub = parser.add_subparsers(dest='command', required=True)
 
-    except ValueError:
-        print("Invalid input.")
+    p_sched = sub.add_parser('schedule', help="Run a CPU scheduling trace")
+    p_sched.add_argument('policy', choices=['priority', 'ppriority', 'srtf', 'rr', 'mlfq'])
+    p_sched.add_argument('trace')
+    p_sched.add_argument('--quantum', type=int)
+    p_sched.add_argument('--quanta', help="MLFQ quanta per level, e.g. 4,8")
+    p_sched.add_argument('--context-switch', type=int, default=0)
+    p_sched.add_argument('-o', '--output', help="Write per-process rows ('-' = stdout)")
+    p_sched.add_argument('--event-log', help="Record dispatch/preempt/complete events to this binary log")
 
-# ==========================================
-# PART 2: FILE ALLOCATION STRATEGIES
-# ==========================================
+    p_gantt = sub.add_parser('gantt', help="Draw a Gantt chart from a scheduling event log")
+    p_gantt.add_argument('log')
+    p_gantt.add_argument('--width', type=int, help="Columns (text, default 100) or bars (SVG, default 1000)")
+    p_gantt.add_argument('--start', type=int, help="First time unit to draw")
+    p_gantt.add_argument('--end', type=int, help="Time unit to stop drawing at")
+    p_gantt.add_argument('--svg', help="Write an SVG chart to this file instead of printing")
 
-def sequential_allocation():
-    """
-    Simulates Sequential File Allocation.
-    """
-    print("\n--- Sequential File Allocation ---")
-    total_blocks = 50
-    disk = [0] * total_blocks # 0 = free, 1 = allocated
-    files = {}
+    p_cmp = sub.add_parser('compare', help="Compare several policies on one trace")
+    p_cmp.add_argument('trace')
+    p_cmp.add_argument('--policies', default='priority,ppriority,srtf,rr,mlfq')
+    p_cmp.add_argument('--quantum', type=int, default=4)
+    p_cmp.add_argument('--quanta', help="MLFQ quanta per level, e.g. 4,8")
+    p_cmp.add_argument('--context-switch', type=int, default=0)
 
-    while True:
-        print(f"\nDisk Status (Total: {total_blocks} blocks): {disk.count(0)} free")
-        choice = input("1. Allocate File\n2. Show Files\n3. Exit to Main Menu\nChoice: ")
-        
-        if choice == '1':
-            name = input("Enter file name: ")
-            try:
-                start = int(input(f"Enter starting block (0-{total_blocks-1}): "))
-                length = int(input("Enter length of file: "))
-                
-                if start + length > total_blocks:
-                    print("Error: File exceeds disk bounds.")
-                    continue
-                
-                # Check if blocks are free
-                is_free = True
-                for i in range(start, start + length):
-                    if disk[i] == 1:
-                        is_free = False
-                        break
-                
-                if is_free:
-                    for i in range(start, start + length):
-                        disk[i] = 1
-                    files[name] = (start, length)
-                    print(f"File '{name}' allocated successfully at blocks {start} to {start+length-1}.")
-                else:
-                    print("Error: Blocks already allocated.")
-            except ValueError:
-                print("Invalid input.")
+    p_sweep = sub.add_parser('sweep', help="Run a parameter grid in parallel")
+    p_sweep.add_argument('kind', choices=['schedule', 'allocate'])
+    p_sweep.add_argument('trace')
+    p_sweep.add_argument('--policies', default='priority,ppriority,srtf,rr,mlfq')
+    p_sweep.add_argument('--quantum', default='1,2,4,8', help="Round Robin quanta, e.g. 1,2,4,8")
+    p_sweep.add_argument('--context-switch', default='0', help="Context switch times, e.g. 0,1")
+    p_sweep.add_argument('--strategies', default='first,best,worst')
+    p_sweep.add_argument('--blocks', default='100,500,200,300,600',
+                         help="Block layouts separated by ';', e.g. '100,500;300,300'")
+    p_sweep.add_argument('--workers', type=int)
+    p_sweep.add_argument('-o', '--output', default='-')
 
-        elif choice == '2':
-            print("\nAllocated Files:")
-            for name, (start, length) in files.items():
-                print(f"File: {name} | Start: {start} | Length: {length}")
-        
-        elif choice == '3':
-            break
+    p_mvt = sub.add_parser('mvt', help="Run an MVT arrival/exit trace")
+    p_mvt.add_argument('trace')
+    p_mvt.add_argument('--memory', type=int, required=True, help="Total memory size")
+    p_mvt.add_argument('--strategy', default='first', choices=['first', 'best', 'worst'])
+    p_mvt.add_argument('--compact', action='store_true', help="Compact when no hole is big enough")
+    p_mvt.add_argument('--move-cost', type=int, default=1, help="Compaction cost per unit moved")
+    p_mvt.add_argument('--process-cost', type=int, default=0, help="Compaction cost per process moved")
+    p_mvt.add_argument('--sample-every', type=int, default=0, help="Fragmentation sample interval (events)")
+    p_mvt.add_argument('-o', '--output', default='-', help="Where to write fragmentation samples")
 
-def indexed_allocation():
-    """
-    Simulates Indexed File Allocation.
-    """
-    print("\n--- Indexed File Allocation ---")
-    total_blocks = 50
-    disk = [0] * total_blocks
-    # Randomly occupy some blocks to make it realistic
-    for i in range(10):
-        disk[random.randint(0, 49)] = 1
-        
-    print(f"Disk initialized with {disk.count(1)} used blocks (random).")
-    
-    while True:
-        choice = input("\n1. Create File\n2. Exit to Main Menu\nChoice: ")
-        if choice == '1':
-            name = input("Enter file name: ")
-            try:
-                size = int(input("Enter file size (in blocks): "))
-                free_blocks = [i for i, x in enumerate(disk) if x == 0]
-                
-                # We need size + 1 blocks (1 for index block)
-                if len(free_blocks) < size + 1:
-                    print("Error: Not enough memory.")
-                    continue
-                
-                index_block = free_blocks[0]
-                disk[index_block] = 1
-                allocated_blocks = []
-                
-                # Allocate data blocks randomly from remaining free blocks
-                for i in range(size):
-                    block = free_blocks[i+1] # Skip the one we used for index
-                    disk[block] = 1
-                    allocated_blocks.append(block)
-                
-                print(f"\nFile '{name}' Allocated.")
-                print(f"Index Block: {index_block}")
-                print(f"Data Blocks pointers in Index Block: {allocated_blocks}")
-                
-            except ValueError:
-                print("Invalid input.")
-        elif choice == '2':
-            break
+    p_idx = sub.add_parser('indexed', help="Run an indexed file allocation trace")
+    p_idx.add_argument('trace')
+    p_idx.add_argument('--blocks', type=int, required=True, help="Total disk blocks")
+    p_idx.add_argument('--pointers', type=int, default=128, help="Pointers per index block")
+    p_idx.add_argument('-o', '--output', help="Write one row per created file ('-' = stdout)")
 
-# ==========================================
-# PART 3: MEMORY MANAGEMENT (CONTIGUOUS)
-# ==========================================
+    p_lay = sub.add_parser('layouts', help="Compare file layouts on a create/read/delete trace")
+    p_lay.add_argument('trace')
+    p_lay.add_argument('--blocks', type=int, required=True, help="Total disk blocks")
+    p_lay.add_argument('--layouts', default=','.join(FILE_LAYOUTS))
+    p_lay.add_argument('--pointers', type=int, default=128, help="Pointers per index block")
 
-def memory_allocation_simulation():
-    """
-    Simulates First-Fit, Best-Fit, and Worst-Fit.
-    """
-    print("\n--- Contiguous Memory Allocation ---")
-    try:
-        # Initial Memory State
-        block_sizes = [100, 500, 200, 300, 600]
-        print(f"Available Memory Blocks: {block_sizes}")
-        
-        n_proc = int(input("Enter number of processes: "))
-        process_sizes = []
-        for i in range(n_proc):
-            process_sizes.append(int(input(f"Enter memory for Process {i+1}: ")))
-
-        print("\nSelect Strategy:")
-        print("1. First Fit")
-        print("2. Best Fit")
-        print("3. Worst Fit")
-        strat = input("Choice: ")
-        
-        allocation = [-1] * n_proc # Stores block index for each process
-        
-        # We work on a copy of blocks for the simulation
-        blocks = block_sizes.copy()
-
-        for i in range(n_proc):
-            p_size = process_sizes[i]
-            best_idx = -1
-            
-            if strat == '1': # First Fit
-                for j in range(len(blocks)):
-                    if blocks[j] >= p_size:
-                        best_idx = j
-                        break
-                        
-            elif strat == '2': # Best Fit
-                for j in range(len(blocks)):
-                    if blocks[j] >= p_size:
-                        if best_idx == -1 or blocks[j] < blocks[best_idx]:
-                            best_idx = j
-                            
-            elif strat == '3': # Worst Fit
-                for j in range(len(blocks)):
-                    if blocks[j] >= p_size:
-                        if best_idx == -1 or blocks[j] > blocks[best_idx]:
-                            best_idx = j
-            
-            if best_idx != -1:
-                allocation[i] = best_idx
-                blocks[best_idx] -= p_size # Reduce available memory in block
-            
-        print(f"\n{'Process No.':<15}{'Process Size':<15}{'Block No.':<15}{'Block Initial Size'}")
-        for i in range(n_proc):
-            blk_no = allocation[i] + 1 if allocation[i] != -1 else "Not Allocated"
-            orig_size = block_sizes[allocation[i]] if allocation[i] != -1 else "-"
-            print(f"{i+1:<15}{process_sizes[i]:<15}{blk_no:<15}{orig_size}")
-
-    except ValueError:
-        print("Invalid input.")
+    p_disk = sub.add_parser('disk', help="Run a disk-arm scheduling trace")
+    p_disk.add_argument('trace')
+    p_disk.add_argument('--cylinders', type=int, required=True, help="Cylinders (blocks) on the disk")
+    p_disk.add_argument('--head', type=int, default=0, help="Initial head position")
+    p_disk.add_argument('--algorithms', default=','.join(DISK_ALGORITHMS.values()))
+    p_disk.add_argument('--seek-time', type=int, default=1, help="Time to move one cylinder")
+    p_disk.add_argument('--transfer-time', type=int, default=0, help="Time to read one block")
+    p_disk.add_argument('--layout', choices=FILE_LAYOUTS,
+                        help="Treat the trace as a file trace: replay it on this layout, then read every file back")
+    p_disk.add_argument('--pointers', type=int, default=128, help="Pointers per index block")
+    p_disk.add_argument('-o', '--output', help="Write per-request rows for a single algorithm ('-' = stdout)")
 
-# ==========================================
-# PART 4: MFT & MVT
-# ==========================================
+    p_page = sub.add_parser('paging', help="Fault counts of a page reference trace over a range of frame counts")
+    p_page.add_argument('trace', help="Page numbers (text, or CSV/JSONL with a 'page' column)")
+    p_page.add_argument('--frames', required=True, help="Frame counts, e.g. 1-64 or 4,8,16")
+    p_page.add_argument('--policies', default=','.join(PAGING_POLICIES.values()))
+    p_page.add_argument('-o', '--output', default='-')
+
+    p_gen = sub.add_parser('generate', help="Generate a synthetic trace from seeded distributions")
+    p_gen.add_argument('kind', choices=TRACE_KINDS)
+    p_gen.add_argument('-n', '--count', type=int, required=True,
+                       help="Jobs, allocations, processes, file events, disk requests or page references")
+    p_gen.add_argument('-o', '--output', default='-')
+    p_gen.add_argument('--seed', type=int)
+    p_gen.add_argument('--rate', type=float, default=0.15, help="Mean arrivals per time unit (Poisson)")
+    p_gen.add_argument('--burst', choices=['exp', 'pareto'], default='exp', help="Burst time distribution")
+    p_gen.add_argument('--mean-burst', type=float, default=5.0)
+    p_gen.add_argument('--alpha', type=float, default=1.5, help="Pareto shape")
+    p_gen.add_argument('--priorities', type=int, default=5)
+    p_gen.add_argument('--size-mu', type=float, help="Lognormal size parameters (of log size)")
+    p_gen.add_argument('--size-sigma', type=float, default=1.0)
+    p_gen.add_argument('--lifetime', type=float, default=100.0,
+                       help="Mean allocation lifetime (in allocations) or MVT duration")
+    p_gen.add_argument('--pages', type=int, default=1000)
+    p_gen.add_argument('--zipf', type=float, default=1.0, help="Zipf exponent of page popularity")
+    p_gen.add_argument('--cylinders', type=int, default=5000)
+    p_gen.add_argument('--chunk', type=int, default=1 << 18, help="Rows drawn per chunk")
+
+    p_bench = sub.add_parser('bench', help="Benchmark the simulators on synthetic traces")
+    p_bench.add_argument('--benchmarks', default=','.join(BENCHMARKS))
+    p_bench.add_argument('--sizes', default='1000,10000,100000', help="Trace sizes, e.g. 1000,100000,10000000")
+    p_bench.add_argument('--seed', type=int, default=1)
+    p_bench.add_argument('-o', '--output', help="Save the results as JSON (e.g. to use as a baseline)")
+    p_bench.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    p_bench.add_argument('--tolerance', type=float, default=0.25,
+                         help="Slowdown in events/s (as a fraction) flagged as a regression")
+    p_bench.add_argument('--max-exponent', type=float, default=1.25,
+                         help="Scaling exponent above which a benchmark is flagged")
+
+    p_alloc = sub.add_parser('allocate', help="Run a memory allocation trace")
+    p_alloc.add_argument('trace')
+    p_alloc.add_argument('--blocks', required=True, help="Comma-separated block sizes")
+    p_alloc.add_argument('--strategy', default='first', choices=['first', 'best', 'worst', 'buddy', 'slab'])
+    p_alloc.add_argument('--min-block', type=int, default=1, help="Buddy System minimum block size")
+    p_alloc.add_argument('--slab-size', type=int, default=512)
+    p_alloc.add_argument('-o', '--output', default='-')
+
+    args = parser.parse_args(argv)
 
-def mft_mvt_simulation():
-    """
-    Simulates MFT (Fixed Partition) and MVT (Variable Partition).
-    """
-    print("\n--- MFT / MVT Simulation ---")
-    print("1. MFT (Multiprogramming with Fixed Tasks)")
-    print("2. MVT (Multiprogramming with Variable Tasks)")
-    choice = input("Choice: ")
-    
     try:
-        total_memory = int(input("Enter Total Memory Size (e.g. 1000): "))
-        
-        if choice == '1': # MFT
-            block_size = int(input("Enter Block Size (Fixed): "))
-            num_blocks = total_memory // block_size
-            external_frag_initial = total_memory - (num_blocks * block_size)
-            
-            print(f"\nTotal Blocks Created: {num_blocks}")
-            print(f"Initial External Fragmentation (Unusable): {external_frag_initial}")
-            
-            n_proc = int(input("Enter number of processes: "))
-            internal_frag_total = 0
-            processes_alloc = 0
-            
-            print(f"\n{'Process':<10}{'Memory Req':<15}{'Allocated':<15}{'Internal Frag':<15}")
-            
-            for i in range(n_proc):
-                mem_req = int(input(f"Memory for Process {i+1}: "))
-                if processes_alloc < num_blocks:
-                    if mem_req <= block_size:
-                        frag = block_size - mem_req
-                        internal_frag_total += frag
-                        processes_alloc += 1
-                        print(f"{i+1:<10}{mem_req:<15}{'YES':<15}{frag:<15}")
-                    else:
-                         print(f"{i+1:<10}{mem_req:<15}{'NO (Too Big)':<15}{'-':<15}")
-                else:
-                    print(f"{i+1:<10}{mem_req:<15}{'NO (Full)':<15}{'-':<15}")
-            
-            print(f"\nTotal Internal Fragmentation: {internal_frag_total}")
-
-        elif choice == '2': # MVT
-            current_mem = total_memory
-            n = 0
-            processes = []
-            
-            while True:
-                mem_req = int(input(f"\nEnter memory for Process {n+1}: "))
-                if mem_req <= current_mem:
-                    print(f"Memory allocated for Process {n+1}")
-                    current_mem -= mem_req
-                    processes.append((n+1, mem_req))
-                    n += 1
+        if args.command == 'schedule':
+            quanta = [int(q) for q in args.quanta.split(',')] if args.quanta else None
+            policy = make_policy(args.policy, args.quantum, quanta)
+            at, bt, ct = array('q'), array('q'), array('q')
+
+            def tap(results):
+                for r in results:
+                    at.append(r['at'])
+                    bt.append(r['bt'])
+                    ct.append(r['ct'])
+                    yield r
+
+            log = EventLog(args.event_log) if args.event_log else None
+            results = tap(stream_schedule(read_trace(args.trace), policy, args.context_switch, log))
+            try:
+                if args.output:
+                    write_records(results, args.output, RESULT_FIELDS)
                 else:
-                    print("Memory is Full / Not enough space.")
-                
-                cont = input("Add another process? (y/n): ")
-                if cont.lower() != 'y':
-                    break
-            
-            print(f"\nTotal Memory: {total_memory}")
-            print(f"Total Allocated: {total_memory - current_mem}")
-            print(f"Total External Fragmentation (Remaining): {current_mem}")
-
-    except ValueError:
-        print("Invalid input.")
+                    for _ in results:
+                        pass
+            finally:
+                if log is not None:
+                    log.close()
+            print_summary(compute_metrics(at, bt, ct), file=sys.stderr if args.output == '-' else None)
+
+        elif args.command == 'gantt':
+            if args.svg:
+                bars = render_gantt_svg(args.log, args.svg, args.width or 1000, args.start, args.end)
+                print(f"Wrote {bars} bars to {args.svg}")
+            else:
+                render_gantt_text(args.log, args.width or 100, args.start, args.end)
+
+        elif args.command == 'compare':
+            quanta = [int(q) for q in args.quanta.split(',')] if args.quanta else None
+            policies = {name: (lambda name=name: make_policy(name, args.quantum, quanta))
+                        for name in args.policies.split(',')}
+            for make in policies.values():
+                make() # Fail on a bad policy before any simulation runs
+            table = compare_policies(lambda: read_trace(args.trace), policies, args.context_switch)
+            print_comparison(table)
+
+        elif args.command == 'sweep':
+            if args.kind == 'schedule':
+                points = schedule_grid(args.policies.split(','),
+                                       [int(q) for q in args.quantum.split(',')],
+                                       [int(c) for c in args.context_switch.split(',')])
+                for point in points:
+                    make_policy(point['policy'], point['quantum']) # Fail fast on bad input
+                fields = ('policy', 'quantum', 'context_switch', 'avg_wt', 'p95_wt', 'p99_wt',
+                          'avg_tat', 'p99_tat', 'throughput', 'utilization', 'fairness', 'seconds')
+            else:
+                layouts = [[int(b) for b in layout.split(',')] for layout in args.blocks.split(';')]
+                points = allocate_grid(args.strategies.split(','), layouts)
+                for point in points:
+                    if point['strategy'] not in ALLOCATION_STRATEGIES.values():
+                        raise ValueError(f"Unknown allocation strategy: {point['strategy']}")
+                fields = ('strategy', 'blocks', 'allocations', 'failures', 'failed_pct',
+                          'internal_frag', 'external_frag', 'live', 'seconds')
+            rows = run_sweep(read_trace(args.trace), points, args.workers)
+            write_records(rows, args.output, fields)
+
+        elif args.command == 'mvt':
+            memory = MVTMemory(args.memory, args.strategy, args.move_cost, args.process_cost)
+            samples = simulate_mvt(read_trace(args.trace), memory, args.compact, args.sample_every)
+            fields = ('event', 'processes', 'used', 'free', 'holes', 'largest_free', 'external_frag',
+                      'failures', 'compactions', 'compaction_cost')
+            if args.sample_every:
+                write_records(samples, args.output, fields)
+            else:
+                for _ in samples:
+                    pass
+            report = memory.report()
+            out = sys.stderr if args.sample_every and args.output == '-' else None
+            print(f"Total Memory: {report['total']} | Allocated: {report['used']} | Free: {report['free']}", file=out)
+            print(f"Holes: {report['holes']} | Largest Hole: {report['largest_free']} | "
+                  f"External Fragmentation: {report['external_frag'] * 100:.2f}%", file=out)
+            print(f"Failed Loads: {report['failures']} | Compactions: {report['compactions']} | "
+                  f"Units Moved: {report['units_moved']} | Cost: {report['compaction_cost']}", file=out)
+
+        elif args.command == 'indexed':
+            disk = IndexedDisk(args.blocks, args.pointers)
+            latency = array('d') # Microseconds per create
+            failed = 0
+
+            def creates():
+                nonlocal failed
+                for i, r in enumerate(read_trace(args.trace)):
+                    name = r.get('name', r.get('id', i + 1))
+                    op = r.get('op', 'create')
+                    if op == 'delete':
+                        disk.delete(name)
+                    if op != 'create':
+                        continue
+                    size = int(r['size'])
+                    if size > disk.max_file_size():
+                        failed += 1
+                        continue
+                    start = time.perf_counter()
+                    record = disk.create(name, size)
+                    latency.append((time.perf_counter() - start) * 1e6)
+                    if record is None:
+                        failed += 1
+                        continue
+                    yield {'name': name, 'size': len(record['data']), 'index': record['index'],
+                           'index_blocks': len(record['meta'])}
+
+            if args.output:
+                write_records(creates(), args.output, ('name', 'size', 'index', 'index_blocks'))
+            else:
+                for _ in creates():
+                    pass
+            out = sys.stderr if args.output == '-' else None
+            ordered = sorted(latency)
+            print(f"Files: {len(disk.files)} | Failed Creates: {failed} | Free Blocks: {disk.free}", file=out)
+            print(f"Metadata Overhead: {disk.metadata_overhead() * 100:.2f}% of file blocks", file=out)
+            if ordered:
+                print(f"Create Latency p50/p99/max: {percentile(ordered, 50):.2f} / "
+                      f"{percentile(ordered, 99):.2f} / {ordered[-1]:.2f} us", file=out)
+
+        elif args.command == 'layouts':
+            layouts = args.layouts.split(',')
+            for layout in layouts:
+                make_file_disk(layout, 1) # Fail on a bad layout before any replay runs
+            table = compare_file_layouts(lambda: read_trace(args.trace), layouts, args.blocks, args.pointers)
+            print_layout_comparison(table)
+
+        elif args.command == 'disk':
+            algorithms = args.algorithms.split(',')
+            for algorithm in algorithms:
+                if algorithm not in DISK_ALGORITHMS.values():
+                    raise ValueError(f"Unknown disk scheduling algorithm: {algorithm}")
+            if args.output and len(algorithms) != 1:
+                raise ValueError("-o needs a single algorithm.")
+            if args.layout:
+                disk = make_file_disk(args.layout, args.cylinders, args.pointers)
+                replay_file_trace(read_trace(args.trace), disk)
+                requests = lambda: file_read_requests(disk)
+            else:
+                requests = lambda: read_trace(args.trace)
+            if args.output:
+                seek, latency = array('q'), array('q')
+
+                def tap(results):
+                    for r in results:
+                        seek.append(r['seek'])
+                        latency.append(r['ct'] - r['at'])
+                        yield r
+
+                served = tap(schedule_disk(requests(), algorithms[0], args.head, args.cylinders,
+                                           args.seek_time, args.transfer_time))
+                write_records(served, args.output, DISK_RESULT_FIELDS)
+                table = {algorithms[0]: compute_disk_metrics(seek, latency)}
+            else:
+                table = compare_disk_schedulers(requests, algorithms, args.head, args.cylinders,
+                                                args.seek_time, args.transfer_time)
+            print_disk_comparison(table, file=sys.stderr if args.output == '-' else None)
+
+        elif args.command == 'paging':
+            frame_counts = []
+            for part in args.frames.split(','):
+                lo, _, hi = part.partition('-')
+                frame_counts.extend(range(int(lo), int(hi or lo) + 1))
+            policies = args.policies.split(',')
+            for policy in policies:
+                if policy not in PAGING_POLICIES.values():
+                    raise ValueError(f"Unknown page replacement policy: {policy}")
+            n, table = fault_curve(read_references(args.trace), frame_counts, policies)
+            if n == 0:
+                raise ValueError("Empty reference trace.")
+            rows = ({'policy': policy, 'frames': frames, 'faults': faults, 'fault_rate': faults / n}
+                    for policy, curve in table.items() for frames, faults in sorted(curve.items()))
+            write_records(rows, args.output, ('policy', 'frames', 'faults', 'fault_rate'))
+
+        elif args.command == 'generate':
+            if args.count < 0 or args.chunk <= 0 or args.rate <= 0:
+                raise ValueError("Count, chunk size and rate must be positive.")
+            sampler = Sampler(args.seed)
+            n, chunk = args.count, args.chunk
+            if args.kind == 'schedule':
+                chunks = schedule_workload(sampler, n, args.rate, args.burst, args.mean_burst, args.alpha,
+                                           args.priorities, chunk)
+            elif args.kind == 'allocate':
+                chunks = allocate_workload(sampler, n, args.size_mu or 4.0, args.size_sigma, args.lifetime, chunk)
+            elif args.kind == 'mvt':
+                chunks = mvt_workload(sampler, n, args.rate, args.size_mu or 4.0, args.size_sigma, args.lifetime, chunk)
+            elif args.kind == 'files':
+                chunks = files_workload(sampler, n, args.size_mu or 3.0, args.size_sigma, chunk=chunk)
+            elif args.kind == 'disk':
+                chunks = disk_workload(sampler, n, args.rate, args.cylinders, chunk)
+            else:
+                chunks = paging_workload(sampler, n, args.pages, args.zipf, chunk)
+            # Page references are written as a plain list unless a CSV is asked for
+            header = args.kind != 'paging' or args.output.endswith('.csv')
+            count = write_trace(chunks, args.output, TRACE_FIELDS[args.kind], header)
+            if args.output != '-':
+                print(f"Wrote {count} rows to {args.output}")
+
+        elif args.command == 'bench':
+            baseline = None
+            if args.baseline:
+                with open(args.baseline) as f:
+                    baseline = json.load(f)
+            report = run_benchmarks(args.benchmarks.split(','), [int(n) for n in args.sizes.split(',')], args.seed)
+            if args.output:
+                with open(args.output, 'w') as f:
+                    json.dump(report, f, indent=2)
+            print_benchmarks(report, baseline)
+            regressions = find_regressions(report, baseline or {}, args.tolerance, args.max_exponent)
+            for message in regressions:
+                print(f"REGRESSION: {message}")
+            if regressions:
+                return 1
+
+        elif args.command == 'allocate':
+            allocator = make_allocator(args.strategy, [int(b) for b in args.blocks.split(',')],
+                                       args.min_block, args.slab_size)
+            records = ({'id': r['id'], 'size': r['size'],
+                        'block': allocator.label(r['block']) if r['block'] != -1 else -1}
+                       for r in replay_allocations(read_trace(args.trace), allocator))
+            write_records(records, args.output, ('id', 'size', 'block'))
+            print_fragmentation(allocator.report(), file=sys.stderr if args.output == '-' else None)
+
+    except (ValueError, KeyError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
 
 # ==========================================
 # MAIN EXECUTION BLOCK
@@ -370,8 +430,12 @@ def main():
         print("2. Round Robin Scheduling")
         print("3. Sequential File Allocation")
         print("4. Indexed File Allocation")
-        print("5. Memory Allocation (First/Best/Worst Fit)")
+        print("5. Memory Allocation (First/Best/Worst Fit, Buddy, Slab)")
         print("6. MFT / MVT Simulation")
+        print("7. Preemptive Scheduling (Priority/SRTF/MLFQ)")
+        print("8. Linked File Allocation (Linked/FAT)")
+        print("9. Disk Scheduling (FCFS/SSTF/SCAN/C-SCAN/LOOK/C-LOOK)")
+        print("10. Page Replacement (FIFO/LRU/Clock/LFU/OPT)")
         print("0. Exit")
         
         choice = input("\nEnter your choice: ")
@@ -388,6 +452,14 @@ def main():
             memory_allocation_simulation()
         elif choice == '6':
             mft_mvt_simulation()
+        elif choice == '7':
+            preemptive_scheduling()
+        elif choice == '8':
+            linked_allocation()
+        elif choice == '9':
+            disk_scheduling()
+        elif choice == '10':
+            page_replacement()
         elif choice == '0':
             print("Exiting...")
             break
@@ -395,4 +467,6 @@ def main():
             print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(batch_main(sys.argv[1:]))
+    main()
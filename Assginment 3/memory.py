@@ -0,0 +1,681 @@
+import bisect
+import heapq
+
+from structures import ExtentIndex, SortedList
+
+# ==========================================
+# PART 3: MEMORY MANAGEMENT (CONTIGUOUS)
+# ==========================================
+
+ALLOCATION_STRATEGIES = {'1': 'first', '2': 'best', '3': 'worst', '4': 'buddy', '5': 'slab'}
+
+class FitAllocator:
+    """
+    First/Best/Worst Fit over a fixed set of memory blocks, with free().
+    A request carves space out of one block; freeing it gives the space back.
+
+    Each strategy keeps an index over the blocks' free space so a request
+    costs O(log n) instead of a scan of every block:
+      First Fit - segment tree of the largest free space per range of blocks
+      Best Fit  - SortedList of (free, block), searched for the smallest fit
+      Worst Fit - max-heap of (free, block) with lazy deletion of stale entries
+    Ties go to the lowest block number, as in the original linear scans.
+    """
+    def __init__(self, block_sizes, strategy):
+        strategy = ALLOCATION_STRATEGIES.get(strategy, strategy)
+        if strategy not in ('first', 'best', 'worst'):
+            raise ValueError(f"Unknown allocation strategy: {strategy}")
+        self.strategy = strategy
+        self.block_sizes = list(block_sizes)
+        self.free_space = list(block_sizes)
+        self.owners = {} # handle -> (block index, size)
+        self.allocations = 0
+        self.failures = 0
+
+        n = len(self.block_sizes)
+        if strategy == 'first':
+            self.leaves = 1
+            while self.leaves < n:
+                self.leaves *= 2
+            self.tree = [-1] * (2 * self.leaves) # Padding leaves fit nothing, not even size 0
+            self.tree[self.leaves:self.leaves + n] = self.free_space
+            for i in range(self.leaves - 1, 0, -1):
+                self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+        elif strategy == 'best':
+            self.by_size = SortedList((size, j) for j, size in enumerate(self.free_space))
+        else:
+            self.heap = [(-size, j) for j, size in enumerate(self.free_space)]
+            heapq.heapify(self.heap)
+
+    def _find(self, size):
+        """Returns the block the strategy picks for size, or -1."""
+        if self.strategy == 'first':
+            if self.tree[1] < size:
+                return -1
+            i = 1
+            while i < self.leaves:
+                # Go left whenever the left half has room: that is the first fit
+                i = 2 * i if self.tree[2 * i] >= size else 2 * i + 1
+            return i - self.leaves
+        if self.strategy == 'best':
+            fit = self.by_size.ceiling((size, -1))
+            return fit[1] if fit is not None else -1
+        while self.heap and -self.heap[0][0] != self.free_space[self.heap[0][1]]:
+            heapq.heappop(self.heap) # Stale entry
+        return self.heap[0][1] if self.heap and -self.heap[0][0] >= size else -1
+
+    def _resize(self, j, new_free):
+        """Sets block j's free space and updates the strategy's index."""
+        old_free = self.free_space[j]
+        self.free_space[j] = new_free
+        if self.strategy == 'first':
+            i = j + self.leaves
+            self.tree[i] = new_free
+            i //= 2
+            while i:
+                self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+                i //= 2
+        elif self.strategy == 'best':
+            self.by_size.remove((old_free, j))
+            self.by_size.add((new_free, j))
+        else:
+            heapq.heappush(self.heap, (-new_free, j))
+            if len(self.heap) > 2 * len(self.free_space) + 64:
+                self.heap = [(-size, k) for k, size in enumerate(self.free_space)]
+                heapq.heapify(self.heap)
+
+    def allocate(self, size, handle=None):
+        """
+        Places a request of the given size and returns its block index (-1 if it
+        does not fit anywhere). Pass a handle to be able to free() it later.
+        """
+        j = self._find(size)
+        if j == -1:
+            self.failures += 1
+            return -1
+        self._resize(j, self.free_space[j] - size) # Reduce available memory in block
+        self.allocations += 1
+        if handle is not None:
+            self.owners[handle] = (j, size)
+        return j
+
+    def free(self, handle):
+        """Releases an allocation. Returns False if the handle is not allocated."""
+        owner = self.owners.pop(handle, None)
+        if owner is None:
+            return False
+        j, size = owner
+        self._resize(j, self.free_space[j] + size)
+        return True
+
+    def block_size(self, j):
+        return self.block_sizes[j]
+
+    def label(self, j):
+        return j + 1
+
+    def report(self):
+        """Fragmentation report for the current state of memory."""
+        total = sum(self.block_sizes)
+        free = sum(self.free_space)
+        largest = max(self.free_space, default=0)
+        return {
+            'total': total,
+            'used': total - free,
+            'free': free,
+            'largest_free': largest,
+            'internal_frag': 0.0, # Requests get exactly the space they ask for
+            # Share of free memory that a single request cannot use
+            'external_frag': 1 - largest / free if free else 0.0,
+            'allocations': self.allocations,
+            'failures': self.failures,
+            'live': len(self.owners),
+        }
+
+class BuddyAllocator:
+    """
+    Binary Buddy System over a memory of total_size units.
+    Requests are rounded up to a power-of-two number of min_block units.
+    Free blocks sit in one free list per order; a bitmap per order holds one
+    bit per buddy pair (set when exactly one of the pair is free), so freeing
+    a block tells in O(1) whether its buddy can be merged with it.
+    Memory that is not a power of two is split into the largest aligned
+    power-of-two chunks, which are never merged with each other.
+    """
+    def __init__(self, total_size, min_block=1):
+        if total_size <= 0 or min_block <= 0:
+            raise ValueError("Memory size and minimum block must be positive.")
+        self.min_block = min_block
+        self.total_units = total_size // min_block
+        self.max_order = max(self.total_units.bit_length() - 1, 0)
+        self.free_lists = [{} for _ in range(self.max_order + 1)] # order -> {offset: None}
+        self.pair_bits = [bytearray((self.total_units >> (k + 1)) + 1) for k in range(self.max_order + 1)]
+        self.chunk_starts = []
+        self.chunk_orders = []
+        self.owners = {} # handle -> offset
+        self.orders = {} # allocated offset -> (order, requested size)
+        self.requested = 0
+        self.allocations = 0
+        self.failures = 0
+
+        offset = 0
+        for order in range(self.max_order, -1, -1):
+            if self.total_units & (1 << order):
+                self.chunk_starts.append(offset)
+                self.chunk_orders.append(order)
+                self._push(offset, order)
+                offset += 1 << order
+
+    def _push(self, offset, order):
+        self.free_lists[order][offset] = None
+        self.pair_bits[order][offset >> (order + 1)] ^= 1
+
+    def _take(self, offset, order):
+        del self.free_lists[order][offset]
+        self.pair_bits[order][offset >> (order + 1)] ^= 1
+
+    def allocate(self, size, handle=None):
+        """Returns the start address of the block given to the request, or -1."""
+        units = max(-(-size // self.min_block), 1)
+        order = (units - 1).bit_length()
+        k = order
+        while k <= self.max_order and not self.free_lists[k]:
+            k += 1
+        if k > self.max_order:
+            self.failures += 1
+            return -1
+
+        offset = next(reversed(self.free_lists[k])) # Most recently freed block
+        self._take(offset, k)
+        while k > order:
+            # Split: keep the lower half, free the upper half (its buddy)
+            k -= 1
+            self._push(offset + (1 << k), k)
+
+        self.orders[offset] = (order, size)
+        self.requested += size
+        self.allocations += 1
+        if handle is not None:
+            self.owners[handle] = offset
+        return offset * self.min_block
+
+    def free(self, handle):
+        """Releases an allocation and merges it with free buddies."""
+        offset = self.owners.pop(handle, None)
+        if offset is None:
+            return False
+        order, size = self.orders.pop(offset)
+        self.requested -= size
+        chunk = bisect.bisect_right(self.chunk_starts, offset) - 1
+        top = self.chunk_orders[chunk]
+
+        while True:
+            bits = self.pair_bits[order]
+            pair = offset >> (order + 1)
+            if order == top or not bits[pair]:
+                # No buddy in this chunk, or the buddy is allocated
+                self._push(offset, order)
+                return True
+            # Pair bit set: the buddy is free, so merge and try one order up
+            self._take(offset ^ (1 << order), order)
+            offset &= ~(1 << order)
+            order += 1
+
+    def block_size(self, address):
+        return (1 << self.orders[address // self.min_block][0]) * self.min_block
+
+    def label(self, address):
+        return f"@{address}"
+
+    def report(self):
+        """Fragmentation report for the current state of memory."""
+        total = self.total_units * self.min_block
+        reserved = sum(1 << order for order, _ in self.orders.values()) * self.min_block
+        free = total - reserved
+        largest = max((1 << k for k in range(self.max_order + 1) if self.free_lists[k]), default=0) * self.min_block
+        return {
+            'total': total,
+            'used': self.requested,
+            'free': free,
+            'largest_free': largest,
+            # Space handed out beyond what was asked for (rounding up)
+            'internal_frag': 1 - self.requested / reserved if reserved else 0.0,
+            'external_frag': 1 - largest / free if free else 0.0,
+            'allocations': self.allocations,
+            'failures': self.failures,
+            'live': len(self.owners),
+        }
+
+class SlabAllocator:
+    """
+    Slab / size-class allocator. Memory is cut into slabs of slab_size units;
+    a slab is dedicated to one size class and carved into equal objects.
+    A request is rounded up to its size class and served from a partially
+    used slab of that class, or from a fresh empty slab - both O(1).
+    Fully freed slabs go back to the empty pool for any class to reuse.
+    """
+    def __init__(self, total_size, slab_size=512, size_classes=None):
+        if slab_size <= 0 or total_size < slab_size:
+            raise ValueError("Memory must hold at least one slab.")
+        if size_classes is None:
+            size_classes = []
+            size = 8
+            while size < slab_size:
+                size_classes.append(size)
+                size *= 2
+            size_classes.append(slab_size)
+        if any(c <= 0 or c > slab_size for c in size_classes):
+            raise ValueError("Size classes must fit in a slab.")
+        self.total_size = total_size
+        self.slab_size = slab_size
+        self.size_classes = sorted(size_classes)
+        num_slabs = total_size // slab_size
+        self.empty_slabs = list(range(num_slabs - 1, -1, -1)) # Stack of slab numbers
+        self.partial = {c: {} for c in self.size_classes} # class -> {slab: None} with free objects
+        self.slab_class = [0] * num_slabs
+        self.slab_free = [None] * num_slabs # slab -> stack of free object indexes
+        self.owners = {} # handle -> address
+        self.sizes = {} # allocated address -> requested size
+        self.requested = 0
+        self.allocations = 0
+        self.failures = 0
+
+    def allocate(self, size, handle=None):
+        """Returns the address of the object given to the request, or -1."""
+        k = bisect.bisect_left(self.size_classes, size)
+        if k == len(self.size_classes):
+            self.failures += 1
+            return -1
+        cls = self.size_classes[k]
+        partial = self.partial[cls]
+        if partial:
+            slab = next(iter(partial))
+        elif self.empty_slabs:
+            slab = self.empty_slabs.pop()
+            self.slab_class[slab] = cls
+            self.slab_free[slab] = list(range(self.slab_size // cls - 1, -1, -1))
+            partial[slab] = None
+        else:
+            self.failures += 1
+            return -1
+
+        free_objects = self.slab_free[slab]
+        address = slab * self.slab_size + free_objects.pop() * cls
+        if not free_objects:
+            del partial[slab]
+        self.sizes[address] = size
+        self.requested += size
+        self.allocations += 1
+        if handle is not None:
+            self.owners[handle] = address
+        return address
+
+    def free(self, handle):
+        """Returns an object to its slab; an emptied slab goes back to the pool."""
+        address = self.owners.pop(handle, None)
+        if address is None:
+            return False
+        self.requested -= self.sizes.pop(address)
+        slab, offset = divmod(address, self.slab_size)
+        cls = self.slab_class[slab]
+        free_objects = self.slab_free[slab]
+        free_objects.append(offset // cls)
+        if len(free_objects) == self.slab_size // cls:
+            self.partial[cls].pop(slab, None)
+            self.slab_free[slab] = None
+            self.empty_slabs.append(slab)
+        else:
+            self.partial[cls][slab] = None
+        return True
+
+    def block_size(self, address):
+        return self.slab_class[address // self.slab_size]
+
+    def label(self, address):
+        return f"@{address}"
+
+    def report(self):
+        """Fragmentation report for the current state of memory."""
+        reserved = sum(self.slab_class[address // self.slab_size] for address in self.sizes)
+        free = self.total_size - reserved
+        if self.empty_slabs:
+            largest = self.slab_size
+        else:
+            largest = max((cls for cls, slabs in self.partial.items() if slabs), default=0)
+        return {
+            'total': self.total_size,
+            'used': self.requested,
+            'free': free,
+            'largest_free': largest,
+            # Space handed out beyond what was asked for (rounding to a size class)
+            'internal_frag': 1 - self.requested / reserved if reserved else 0.0,
+            'external_frag': 1 - largest / free if free else 0.0,
+            'allocations': self.allocations,
+            'failures': self.failures,
+            'live': len(self.owners),
+        }
+
+def make_allocator(strategy, block_sizes, min_block=1, slab_size=512):
+    """
+    Builds the allocator for a strategy name or menu choice. Buddy and Slab
+    manage the combined size of block_sizes as one memory.
+    """
+    strategy = ALLOCATION_STRATEGIES.get(strategy, strategy)
+    if strategy == 'buddy':
+        return BuddyAllocator(sum(block_sizes), min_block)
+    if strategy == 'slab':
+        return SlabAllocator(sum(block_sizes), slab_size)
+    return FitAllocator(block_sizes, strategy)
+
+def replay_allocations(records, allocator):
+    """
+    Replays a malloc/free trace against an allocator. Each record has an 'op'
+    ('alloc' by default, or 'free'), an 'id' and, for allocations, a 'size'.
+    Yields {'id', 'size', 'block'} for every allocation (block -1 = failed).
+    """
+    for i, record in enumerate(records):
+        handle = record.get('id', i + 1)
+        if record.get('op', 'alloc') == 'free':
+            allocator.free(handle)
+        else:
+            size = int(record['size'])
+            yield {'id': handle, 'size': size, 'block': allocator.allocate(size, handle)}
+
+def print_fragmentation(report, file=None):
+    print(f"\nTotal Memory: {report['total']} | Used: {report['used']} | Free: {report['free']}", file=file)
+    print(f"Largest Free Block: {report['largest_free']}", file=file)
+    print(f"Internal Fragmentation: {report['internal_frag'] * 100:.2f}%", file=file)
+    print(f"External Fragmentation: {report['external_frag'] * 100:.2f}%", file=file)
+    print(f"Allocations: {report['allocations']} | Failed: {report['failures']} | Live: {report['live']}", file=file)
+
+def iter_allocate(blocks, requests, strategy):
+    """
+    Streams memory requests through an allocation strategy and yields the
+    block index (First/Best/Worst Fit) or start address (Buddy/Slab) chosen
+    for each one (-1 if it could not be placed).
+    blocks is not modified; a request carves space out of its block.
+    """
+    allocator = make_allocator(strategy, blocks)
+    for p_size in requests:
+        yield allocator.allocate(p_size)
+
+def allocate(blocks, requests, strategy):
+    """
+    Places each request into a block with the given strategy
+    ('first'/'best'/'worst' or menu choice '1'/'2'/'3').
+    Returns the block index for each request (-1 = Not Allocated).
+    """
+    return list(iter_allocate(blocks, requests, strategy))
+
+def memory_allocation_simulation():
+    """
+    Simulates First-Fit, Best-Fit, Worst-Fit, Buddy System and Slab allocation.
+    """
+    print("\n--- Contiguous Memory Allocation ---")
+    try:
+        # Initial Memory State
+        block_sizes = [100, 500, 200, 300, 600]
+        print(f"Available Memory Blocks: {block_sizes}")
+        
+        n_proc = int(input("Enter number of processes: "))
+        process_sizes = []
+        for i in range(n_proc):
+            process_sizes.append(int(input(f"Enter memory for Process {i+1}: ")))
+
+        print("\nSelect Strategy:")
+        print("1. First Fit")
+        print("2. Best Fit")
+        print("3. Worst Fit")
+        print("4. Buddy System")
+        print("5. Slab Allocator")
+        strat = input("Choice: ")
+        
+        allocator = make_allocator(strat, block_sizes)
+        allocation = [allocator.allocate(size, i+1) for i, size in enumerate(process_sizes)] # Stores block index for each process
+
+        # For Buddy/Slab, Block No. is the start address of the block handed out
+        print(f"\n{'Process No.':<15}{'Process Size':<15}{'Block No.':<15}{'Block Initial Size'}")
+        for i in range(n_proc):
+            blk_no = allocator.label(allocation[i]) if allocation[i] != -1 else "Not Allocated"
+            orig_size = allocator.block_size(allocation[i]) if allocation[i] != -1 else "-"
+            print(f"{i+1:<15}{process_sizes[i]:<15}{blk_no:<15}{orig_size}")
+
+        print_fragmentation(allocator.report())
+
+    except ValueError:
+        print("Invalid input.")
+
+# ==========================================
+# PART 4: MFT & MVT
+# ==========================================
+
+class MVTMemory:
+    """
+    Variable-partition (MVT) memory with process arrival, exit and compaction.
+
+    Holes live in an ExtentIndex: O(log n) lookup of the holes next to a
+    departing process so they can be coalesced, O(log n) Best and Worst Fit,
+    and First Fit descending its max-length address index (MaxSortedList)
+    straight to the lowest-address hole that is large enough.
+    Compaction slides every process down to address 0 and charges
+    move_cost per unit moved plus process_cost per process moved.
+    """
+    def __init__(self, total_memory, strategy='first', move_cost=1, process_cost=0):
+        strategy = ALLOCATION_STRATEGIES.get(strategy, strategy)
+        if strategy not in ('first', 'best', 'worst'):
+            raise ValueError(f"Unknown allocation strategy: {strategy}")
+        if total_memory <= 0:
+            raise ValueError("Total memory must be positive.")
+        self.total_memory = total_memory
+        self.strategy = strategy
+        self.move_cost = move_cost
+        self.process_cost = process_cost
+        self.holes = ExtentIndex([(0, total_memory)])
+        self.processes = {} # pid -> (start, size)
+        self.compactions = 0
+        self.units_moved = 0
+        self.compaction_cost = 0
+        self.failures = 0
+
+    def allocate(self, pid, size, compact=False):
+        """
+        Loads a process into a hole. If no hole is big enough but there is
+        enough free memory in total and compact is set, memory is compacted
+        first. Returns the start address, or -1 if the process does not fit.
+        """
+        if pid in self.processes:
+            raise ValueError(f"Process {pid} is already in memory.")
+        if size <= 0:
+            raise ValueError("Process size must be positive.")
+        start = self.holes.find(size, self.strategy)
+        if start is None and compact and size <= self.holes.free:
+            self.compact()
+            start = self.holes.find(size, self.strategy)
+        if start is None:
+            self.failures += 1
+            return -1
+
+        self.holes.carve(start, size)
+        self.processes[pid] = (start, size)
+        return start
+
+    def release(self, pid):
+        """Process exit: frees its partition and coalesces it with adjacent holes."""
+        if pid not in self.processes:
+            return False
+        start, size = self.processes.pop(pid)
+        self.holes.release(start, size)
+        return True
+
+    def compact(self):
+        """Moves all processes to the low end of memory, leaving one hole. Returns the cost."""
+        address = 0
+        moved = 0
+        cost = 0
+        for pid, (start, size) in sorted(self.processes.items(), key=lambda item: item[1][0]):
+            if start != address:
+                self.processes[pid] = (address, size)
+                moved += size
+                cost += size * self.move_cost + self.process_cost
+            address += size
+
+        self.holes = ExtentIndex([(address, self.total_memory - address)] if address < self.total_memory else [])
+        self.compactions += 1
+        self.units_moved += moved
+        self.compaction_cost += cost
+        return cost
+
+    def memory_map(self):
+        """(start, size, pid) for every partition and hole in address order (pid None = hole)."""
+        parts = [(start, size, pid) for pid, (start, size) in self.processes.items()]
+        parts += [(start, size, None) for start, size in self.holes.extents()]
+        return sorted(parts, key=lambda part: part[0])
+
+    def report(self):
+        """Fragmentation report for the current state of memory."""
+        free = self.holes.free
+        largest = self.holes.largest()
+        return {
+            'total': self.total_memory,
+            'used': self.total_memory - free,
+            'free': free,
+            'holes': len(self.holes),
+            'largest_free': largest,
+            'external_frag': 1 - largest / free if free else 0.0,
+            'processes': len(self.processes),
+            'failures': self.failures,
+            'compactions': self.compactions,
+            'units_moved': self.units_moved,
+            'compaction_cost': self.compaction_cost,
+        }
+
+def simulate_mvt(records, memory, compact=False, sample_every=0):
+    """
+    Replays MVT events against an MVTMemory. A record is either an explicit
+    event - {'op': 'arrive', 'id', 'size'} or {'op': 'exit', 'id'} - or an
+    arrival with an 'at' time and a 'duration', in which case the exit is
+    scheduled automatically (records must then be in arrival order).
+    Every sample_every events a fragmentation sample is yielded, so growth
+    of fragmentation over a long run can be followed without storing it.
+    """
+    exits = [] # Heap of (exit time, pid) for arrivals with a duration
+    events = 0
+
+    def sample():
+        row = memory.report()
+        row['event'] = events
+        return row
+
+    for i, record in enumerate(records):
+        pid = record.get('id', i + 1)
+        at = record.get('at')
+        # Processes whose time is up leave before the next arrival
+        while exits and at is not None and exits[0][0] <= at:
+            memory.release(heapq.heappop(exits)[1])
+            events += 1
+            if sample_every and events % sample_every == 0:
+                yield sample()
+
+        if record.get('op', 'arrive') in ('exit', 'free'):
+            memory.release(pid)
+        else:
+            start = memory.allocate(pid, int(record['size']), compact)
+            if start != -1 and record.get('duration') is not None:
+                heapq.heappush(exits, (at + int(record['duration']), pid))
+        events += 1
+        if sample_every and events % sample_every == 0:
+            yield sample()
+
+    while exits:
+        memory.release(heapq.heappop(exits)[1])
+        events += 1
+        if sample_every and events % sample_every == 0:
+            yield sample()
+
+def mft_mvt_simulation():
+    """
+    Simulates MFT (Fixed Partition) and MVT (Variable Partition).
+    """
+    print("\n--- MFT / MVT Simulation ---")
+    print("1. MFT (Multiprogramming with Fixed Tasks)")
+    print("2. MVT (Multiprogramming with Variable Tasks)")
+    choice = input("Choice: ")
+    
+    try:
+        total_memory = int(input("Enter Total Memory Size (e.g. 1000): "))
+        
+        if choice == '1': # MFT
+            block_size = int(input("Enter Block Size (Fixed): "))
+            num_blocks = total_memory // block_size
+            external_frag_initial = total_memory - (num_blocks * block_size)
+            
+            print(f"\nTotal Blocks Created: {num_blocks}")
+            print(f"Initial External Fragmentation (Unusable): {external_frag_initial}")
+            
+            n_proc = int(input("Enter number of processes: "))
+            internal_frag_total = 0
+            processes_alloc = 0
+            
+            print(f"\n{'Process':<10}{'Memory Req':<15}{'Allocated':<15}{'Internal Frag':<15}")
+            
+            for i in range(n_proc):
+                mem_req = int(input(f"Memory for Process {i+1}: "))
+                if processes_alloc < num_blocks:
+                    if mem_req <= block_size:
+                        frag = block_size - mem_req
+                        internal_frag_total += frag
+                        processes_alloc += 1
+                        print(f"{i+1:<10}{mem_req:<15}{'YES':<15}{frag:<15}")
+                    else:
+                         print(f"{i+1:<10}{mem_req:<15}{'NO (Too Big)':<15}{'-':<15}")
+                else:
+                    print(f"{i+1:<10}{mem_req:<15}{'NO (Full)':<15}{'-':<15}")
+            
+            print(f"\nTotal Internal Fragmentation: {internal_frag_total}")
+
+        elif choice == '2': # MVT
+            print("\nSelect Strategy:")
+            print("1. First Fit")
+            print("2. Best Fit")
+            print("3. Worst Fit")
+            strat = input("Choice: ")
+            compact = input("Compact memory when no hole is big enough? (y/n): ").lower() == 'y'
+            memory = MVTMemory(total_memory, strat)
+            n = 0
+
+            while True:
+                print("\n1. Load Process\n2. Terminate Process\n3. Compact Memory\n4. Show Memory Map\n5. Finish")
+                action = input("Choice: ")
+                if action == '1':
+                    mem_req = int(input(f"Enter memory for Process {n+1}: "))
+                    start = memory.allocate(n+1, mem_req, compact)
+                    if start != -1:
+                        print(f"Memory allocated for Process {n+1} at address {start}")
+                        n += 1
+                    else:
+                        print("Memory is Full / Not enough space.")
+                elif action == '2':
+                    pid = int(input("Enter Process number to terminate: "))
+                    if memory.release(pid):
+                        print(f"Process {pid} terminated; its memory was merged with adjacent holes.")
+                    else:
+                        print(f"Process {pid} is not in memory.")
+                elif action == '3':
+                    cost = memory.compact()
+                    print(f"Memory compacted (cost: {cost}).")
+                elif action == '4':
+                    print(f"\n{'Start':<10}{'Size':<10}{'Contents'}")
+                    for start, size, pid in memory.memory_map():
+                        print(f"{start:<10}{size:<10}{'Process ' + str(pid) if pid is not None else 'Hole'}")
+                elif action == '5':
+                    break
+
+            report = memory.report()
+            print(f"\nTotal Memory: {total_memory}")
+            print(f"Total Allocated: {report['used']}")
+            print(f"Total External Fragmentation (Remaining): {report['free']}")
+            print(f"Holes: {report['holes']} | Largest Hole: {report['largest_free']}")
+            print(f"Compactions: {report['compactions']} | Units Moved: {report['units_moved']} | Cost: {report['compaction_cost']}")
+
+    except ValueError:
+        print("Invalid input.")
@@ -0,0 +1,404 @@
+import heapq
+from array import array
+from collections import OrderedDict, deque
+
+from traces import read_trace
+
+# ==========================================
+# PART 6: PAGING AND PAGE REPLACEMENT
+# ==========================================
+
+PAGING_POLICIES = {'1': 'fifo', '2': 'lru', '3': 'clock', '4': 'lfu', '5': 'opt'}
+
+def read_references(path, chunk_size=1 << 20):
+    """
+    Streams page numbers from a reference trace: a CSV (with a 'page' column)
+    or JSONL trace, or a plain text file of page numbers separated by
+    whitespace or commas. Plain text is read in fixed-size chunks, so a
+    reference string on one very long line is never held in memory at once.
+    """
+    if path.endswith(('.csv', '.jsonl', '.json')):
+        for r in read_trace(path):
+            yield int(r['page'])
+        return
+    with open(path) as f:
+        tail = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            tokens = (tail + chunk).replace(',', ' ').split()
+            # The last token may continue in the next chunk
+            tail = tokens.pop() if tokens and not chunk[-1].isspace() and chunk[-1] != ',' else ''
+            for token in tokens:
+                yield int(token)
+        if tail:
+            yield int(tail)
+
+class FIFOPager:
+    """First-In First-Out: evicts the page that was loaded longest ago."""
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Need at least one frame.")
+        self.frames = frames
+        self.queue = deque()
+        self.resident = set()
+        self.victim = None
+
+    def access(self, page):
+        """References a page. Returns True on a page fault; the evicted page (or None) is left in self.victim."""
+        self.victim = None
+        if page in self.resident:
+            return False
+        if len(self.queue) >= self.frames:
+            self.victim = self.queue.popleft()
+            self.resident.discard(self.victim)
+        self.queue.append(page)
+        self.resident.add(page)
+        return True
+
+    def pages(self):
+        return list(self.queue)
+
+class LRUPager:
+    """
+    Least Recently Used: evicts the page referenced longest ago. Pages are
+    kept in an OrderedDict in recency order, so a hit is one move_to_end()
+    and an eviction one popitem().
+    """
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Need at least one frame.")
+        self.frames = frames
+        self.recent = OrderedDict()
+        self.victim = None
+
+    def access(self, page):
+        self.victim = None
+        if page in self.recent:
+            self.recent.move_to_end(page)
+            return False
+        if len(self.recent) >= self.frames:
+            self.victim = self.recent.popitem(last=False)[0]
+        self.recent[page] = None
+        return True
+
+    def pages(self):
+        return list(self.recent)
+
+class ClockPager:
+    """
+    Clock (second chance): frames form a ring with one reference bit each.
+    The hand clears set bits as it passes and evicts the first page whose
+    bit is already clear.
+    """
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Need at least one frame.")
+        self.frames = frames
+        self.slots = []
+        self.referenced = bytearray()
+        self.where = {} # page -> slot
+        self.hand = 0
+        self.victim = None
+
+    def access(self, page):
+        self.victim = None
+        slot = self.where.get(page)
+        if slot is not None:
+            self.referenced[slot] = 1
+            return False
+        if len(self.slots) < self.frames:
+            self.where[page] = len(self.slots)
+            self.slots.append(page)
+            self.referenced.append(1)
+            return True
+        referenced, hand = self.referenced, self.hand
+        while referenced[hand]:
+            referenced[hand] = 0
+            hand = hand + 1 if hand + 1 < self.frames else 0
+        self.victim = self.slots[hand]
+        del self.where[self.victim]
+        self.slots[hand] = page
+        self.where[page] = hand
+        referenced[hand] = 1
+        self.hand = hand + 1 if hand + 1 < self.frames else 0
+        return True
+
+    def pages(self):
+        return list(self.slots)
+
+class LFUPager:
+    """
+    Least Frequently Used: evicts the resident page referenced least often
+    since it was loaded, the least recently used of them on a tie. Pages are
+    bucketed by reference count (one OrderedDict per count) and the lowest
+    count in use is tracked, so every operation is O(1).
+    """
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Need at least one frame.")
+        self.frames = frames
+        self.count = {} # page -> references since it was loaded
+        self.buckets = {} # count -> OrderedDict of pages with that count
+        self.min_count = 0
+        self.victim = None
+
+    def access(self, page):
+        self.victim = None
+        count = self.count.get(page)
+        if count is not None:
+            bucket = self.buckets[count]
+            del bucket[page]
+            if not bucket:
+                del self.buckets[count]
+                if self.min_count == count:
+                    self.min_count = count + 1
+            self.count[page] = count + 1
+            self.buckets.setdefault(count + 1, OrderedDict())[page] = None
+            return False
+        if len(self.count) >= self.frames:
+            bucket = self.buckets[self.min_count]
+            self.victim = bucket.popitem(last=False)[0]
+            if not bucket:
+                del self.buckets[self.min_count]
+            del self.count[self.victim]
+        self.count[page] = 1
+        self.buckets.setdefault(1, OrderedDict())[page] = None
+        self.min_count = 1
+        return True
+
+    def pages(self):
+        return list(self.count)
+
+def next_uses(refs):
+    """
+    For each position of a reference string, the position of the next
+    reference to the same page (len(refs) if there is none), found in one
+    backward pass.
+    """
+    n = len(refs)
+    nxt = array('q', bytes(8 * n))
+    seen = {}
+    for i in range(n - 1, -1, -1):
+        page = refs[i]
+        nxt[i] = seen.get(page, n)
+        seen[page] = i
+    return nxt
+
+class OPTPager:
+    """
+    Belady's optimal algorithm: evicts the resident page whose next use is
+    furthest away. Next uses are precomputed (see next_uses) and the resident
+    pages kept in a max-heap on next use. Stale heap entries are skipped
+    when popped, and the heap is rebuilt once they outnumber resident pages,
+    so a whole trace costs O(n log n).
+    Pages must be referenced in the order of the trace next_use came from.
+    """
+    def __init__(self, frames, next_use):
+        if frames <= 0:
+            raise ValueError("Need at least one frame.")
+        self.frames = frames
+        self.next_use = next_use
+        self.position = 0
+        self.resident = {} # page -> position of its next use
+        self.heap = []
+        self.victim = None
+
+    def access(self, page):
+        self.victim = None
+        nxt = self.next_use[self.position]
+        self.position += 1
+        resident, heap = self.resident, self.heap
+        fault = page not in resident
+        if fault and len(resident) >= self.frames:
+            while True:
+                neg, victim = heapq.heappop(heap)
+                if resident.get(victim) == -neg:
+                    break
+            del resident[victim]
+            self.victim = victim
+        resident[page] = nxt
+        heapq.heappush(heap, (-nxt, page))
+        if len(heap) > 2 * self.frames + 64:
+            self.heap = [(-use, p) for p, use in resident.items()]
+            heapq.heapify(self.heap)
+        return fault
+
+    def pages(self):
+        return list(self.resident)
+
+def make_pager(policy, frames, next_use=None):
+    """Builds a page replacement policy from its name (OPT also needs next_uses() of the trace)."""
+    policy = PAGING_POLICIES.get(policy, policy)
+    if policy == 'fifo':
+        return FIFOPager(frames)
+    if policy == 'lru':
+        return LRUPager(frames)
+    if policy == 'clock':
+        return ClockPager(frames)
+    if policy == 'lfu':
+        return LFUPager(frames)
+    if policy == 'opt':
+        if next_use is None:
+            raise ValueError("OPT needs the next use of every reference.")
+        return OPTPager(frames, next_use)
+    raise ValueError(f"Unknown page replacement policy: {policy}")
+
+class StackDistance:
+    """
+    LRU stack distances in one pass (Mattson's algorithm). The stack distance
+    of a reference is the number of distinct pages referenced since the last
+    reference to the same page, itself included. Because LRU is a stack
+    algorithm, a reference hits with F frames exactly when its distance is at
+    most F. One histogram of distances therefore gives the LRU fault count
+    for every frame count.
+
+    Distances are counted with a Fenwick tree over reference times, with one
+    mark at the latest reference to each page. When the tree fills up, the
+    live marks are renumbered from 1, so the tree stays proportional to the
+    number of distinct pages, not the trace length.
+    """
+    def __init__(self, capacity=1 << 16):
+        self.capacity = capacity
+        self.tree = array('i', bytes(4 * (capacity + 1)))
+        self.last = {} # page -> time (tree position) of its latest reference
+        self.time = 0
+        self.hist = array('q', [0]) # hist[d] = references at stack distance d
+        self.cold = 0 # First references, which miss at any frame count
+        self.n = 0
+
+    def _rebuild(self):
+        pages = sorted(self.last, key=self.last.get)
+        self.capacity = max(self.capacity, 2 * len(pages))
+        tree = self.tree = array('i', bytes(4 * (self.capacity + 1)))
+        for t, page in enumerate(pages, 1):
+            self.last[page] = t
+            tree[t] = 1
+        for i in range(1, self.capacity + 1): # Linear-time Fenwick build
+            j = i + (i & -i)
+            if j <= self.capacity:
+                tree[j] += tree[i]
+        self.time = len(pages)
+
+    def reference(self, page):
+        """Records a reference and returns its stack distance (0 for a first reference)."""
+        self.n += 1
+        tree, capacity = self.tree, self.capacity
+        t = self.last.get(page)
+        if t is None:
+            self.cold += 1
+            distance = 0
+        else:
+            below = 0 # Marks at or before t
+            i = t
+            while i:
+                below += tree[i]
+                i &= i - 1
+            distance = len(self.last) - below + 1
+            if distance >= len(self.hist):
+                self.hist.extend(array('q', bytes(8 * max(distance + 1 - len(self.hist), len(self.hist)))))
+            self.hist[distance] += 1
+            while t <= capacity:
+                tree[t] -= 1
+                t += t & -t
+            del self.last[page]
+        if self.time == capacity:
+            self._rebuild()
+            tree, capacity = self.tree, self.capacity
+        self.time += 1
+        t = self.last[page] = self.time
+        while t <= capacity:
+            tree[t] += 1
+            t += t & -t
+        return distance
+
+    def faults(self, frame_counts):
+        """LRU page faults at each frame count: {frames: faults}."""
+        hist = self.hist
+        result = {}
+        hits = 0
+        d = 1
+        for frames in sorted(frame_counts):
+            while d <= frames and d < len(hist):
+                hits += hist[d]
+                d += 1
+            result[frames] = self.n - hits
+        return result
+
+def fault_curve(refs, frame_counts, policies=('fifo', 'lru', 'clock', 'lfu', 'opt')):
+    """
+    Counts the page faults of each policy at every frame count in
+    frame_counts, in a single pass over refs (e.g. read_references()).
+    LRU uses one StackDistance for all frame counts. The other policies run
+    one pager per frame count side by side. OPT needs the next use of every
+    reference, so when it is asked for, refs are first loaded into an array.
+    Returns (references, {policy: {frames: faults}}).
+    """
+    policies = [PAGING_POLICIES.get(p, p) for p in policies]
+    frame_counts = sorted(set(frame_counts))
+    if not frame_counts or frame_counts[0] <= 0:
+        raise ValueError("Frame counts must be positive.")
+    next_use = None
+    if 'opt' in policies:
+        refs = array('q', refs)
+        next_use = next_uses(refs)
+    stack = StackDistance() if 'lru' in policies else None
+    pagers = [(policy, frames, make_pager(policy, frames, next_use))
+              for policy in policies if policy != 'lru' for frames in frame_counts]
+    faults = [0] * len(pagers)
+    accesses = [pager.access for _, _, pager in pagers]
+    slots = range(len(pagers))
+    n = 0
+    for page in refs:
+        n += 1
+        if stack is not None:
+            stack.reference(page)
+        for i in slots:
+            if accesses[i](page):
+                faults[i] += 1
+
+    table = {policy: {} for policy in policies}
+    if stack is not None:
+        table['lru'] = stack.faults(frame_counts)
+    for (policy, frames, _), count in zip(pagers, faults):
+        table[policy][frames] = count
+    return n, table
+
+def page_replacement():
+    """
+    Simulates page replacement on a reference string.
+    """
+    print("\n--- Page Replacement ---")
+    try:
+        refs = [int(x) for x in input("Enter page reference string (space separated): ").replace(',', ' ').split()]
+        frames = int(input("Enter number of frames: "))
+        print("1. FIFO\n2. LRU\n3. Clock\n4. LFU\n5. OPT (Optimal)\n6. Compare All (1 to N frames)")
+        choice = input("Choice: ")
+        if not refs:
+            print("Empty reference string.")
+            return
+        if choice == '6':
+            n, table = fault_curve(refs, range(1, frames + 1))
+            print(f"\n{'Frames':<8}" + "".join(f"{policy.upper():<8}" for policy in table))
+            for f in range(1, frames + 1):
+                print(f"{f:<8}" + "".join(f"{table[policy][f]:<8}" for policy in table))
+            return
+        if choice not in PAGING_POLICIES:
+            print("Invalid choice.")
+            return
+        pager = make_pager(choice, frames, next_uses(refs))
+    except ValueError as e:
+        print(f"Invalid input. {e}")
+        return
+
+    faults = 0
+    print(f"\n{'Ref':<6}{'Frames':<{3 * frames + 6}}{'Result'}")
+    for page in refs:
+        fault = pager.access(page)
+        faults += fault
+        result = "Fault" if fault else "Hit"
+        if pager.victim is not None:
+            result += f" (evicted {pager.victim})"
+        print(f"{page:<6}{str(pager.pages()):<{3 * frames + 6}}{result}")
+    print(f"\nPage Faults: {faults} | Hits: {len(refs) - faults} | Fault Rate: {faults / len(refs) * 100:.2f}%")
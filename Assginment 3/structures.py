@@ -0,0 +1,276 @@
+import bisect
+
+# ==========================================
+# UTILITY STRUCTURES
+# ==========================================
+
+class SortedList:
+    """
+    Sorted list kept in chunks of a few hundred items (the layout used by the
+    sortedcontainers package), so add/remove only shift one chunk and a
+    lookup is two bisects. Used where a size- or address-ordered index has
+    to be updated on every operation.
+    """
+    CHUNK = 512
+
+    def __init__(self, items=()):
+        items = sorted(items)
+        self.chunks = [items[i:i + self.CHUNK] for i in range(0, len(items), self.CHUNK)]
+        self.maxes = [chunk[-1] for chunk in self.chunks]
+        self.size = len(items)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, item):
+        self.size += 1
+        if not self.chunks:
+            self.chunks.append([item])
+            self.maxes.append(item)
+            return
+        k = bisect.bisect_left(self.maxes, item)
+        if k == len(self.maxes):
+            k -= 1
+        chunk = self.chunks[k]
+        bisect.insort(chunk, item)
+        self.maxes[k] = chunk[-1]
+        if len(chunk) > 2 * self.CHUNK:
+            self.chunks[k:k + 1] = [chunk[:self.CHUNK], chunk[self.CHUNK:]]
+            self.maxes[k:k + 1] = [chunk[self.CHUNK - 1], chunk[-1]]
+
+    def remove(self, item):
+        """Removes an item that is known to be present."""
+        k = bisect.bisect_left(self.maxes, item)
+        chunk = self.chunks[k]
+        del chunk[bisect.bisect_left(chunk, item)]
+        self.size -= 1
+        if chunk:
+            self.maxes[k] = chunk[-1]
+        else:
+            del self.chunks[k]
+            del self.maxes[k]
+
+    def ceiling(self, item):
+        """Smallest item >= item, or None."""
+        k = bisect.bisect_left(self.maxes, item)
+        if k == len(self.maxes):
+            return None
+        chunk = self.chunks[k]
+        return chunk[bisect.bisect_left(chunk, item)]
+
+    def floor(self, item):
+        """Largest item <= item, or None."""
+        k = bisect.bisect_right(self.maxes, item)
+        if k < len(self.maxes):
+            chunk = self.chunks[k]
+            i = bisect.bisect_right(chunk, item)
+            if i:
+                return chunk[i - 1]
+        return self.maxes[k - 1] if k else None
+
+    def last(self):
+        return self.maxes[-1] if self.maxes else None
+
+    def iter_from(self, item):
+        """Yields the items >= item in order."""
+        k = bisect.bisect_left(self.maxes, item)
+        if k == len(self.maxes):
+            return
+        chunk = self.chunks[k]
+        yield from chunk[bisect.bisect_left(chunk, item):]
+        for chunk in self.chunks[k + 1:]:
+            yield from chunk
+
+class MaxSortedList(SortedList):
+    """
+    SortedList of keys that each carry a value, which can also find the
+    first key (from a given key on) whose value is at least a bound. The
+    values are kept in chunks parallel to the keys, and a max segment tree
+    over the chunks' largest values leads the search straight to the one
+    chunk holding the answer: O(log n) plus a scan of that chunk.
+    """
+    def __init__(self, items=()):
+        items = sorted(items)
+        super().__init__(key for key, _ in items)
+        values = [value for _, value in items]
+        self.values = [values[i:i + self.CHUNK] for i in range(0, len(values), self.CHUNK)]
+        self.vmax = [max(chunk) for chunk in self.values]
+        self._build()
+
+    def _build(self):
+        # Rebuilt only when the number of chunks changes (after ~CHUNK updates)
+        self.leaves = 1
+        while self.leaves < len(self.vmax):
+            self.leaves *= 2
+        tree = [-1] * (2 * self.leaves)
+        tree[self.leaves:self.leaves + len(self.vmax)] = self.vmax
+        for i in range(self.leaves - 1, 0, -1):
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+        self.tree = tree
+
+    def _update(self, k):
+        self.vmax[k] = value = max(self.values[k])
+        tree = self.tree
+        i = k + self.leaves
+        tree[i] = value
+        i >>= 1
+        while i:
+            value = max(tree[2 * i], tree[2 * i + 1])
+            if tree[i] == value:
+                break
+            tree[i] = value
+            i >>= 1
+
+    def add(self, key, value):
+        self.size += 1
+        if not self.chunks:
+            self.chunks.append([key])
+            self.maxes.append(key)
+            self.values.append([value])
+            self.vmax.append(value)
+            self._build()
+            return
+        k = bisect.bisect_left(self.maxes, key)
+        if k == len(self.maxes):
+            k -= 1
+        chunk, values = self.chunks[k], self.values[k]
+        i = bisect.bisect_left(chunk, key)
+        chunk.insert(i, key)
+        values.insert(i, value)
+        self.maxes[k] = chunk[-1]
+        if len(chunk) > 2 * self.CHUNK:
+            self.chunks[k:k + 1] = [chunk[:self.CHUNK], chunk[self.CHUNK:]]
+            self.maxes[k:k + 1] = [chunk[self.CHUNK - 1], chunk[-1]]
+            self.values[k:k + 1] = [values[:self.CHUNK], values[self.CHUNK:]]
+            self.vmax[k:k + 1] = [max(values[:self.CHUNK]), max(values[self.CHUNK:])]
+            self._build()
+        elif value > self.vmax[k]:
+            self._update(k)
+
+    def remove(self, key):
+        """Removes a key that is known to be present."""
+        k = bisect.bisect_left(self.maxes, key)
+        chunk, values = self.chunks[k], self.values[k]
+        i = bisect.bisect_left(chunk, key)
+        del chunk[i]
+        value = values.pop(i)
+        self.size -= 1
+        if chunk:
+            self.maxes[k] = chunk[-1]
+            if value == self.vmax[k]:
+                self._update(k)
+        else:
+            del self.chunks[k], self.maxes[k], self.values[k], self.vmax[k]
+            self._build()
+
+    def first_at_least(self, key, bound):
+        """Smallest key >= key whose value is >= bound, or None."""
+        k = bisect.bisect_left(self.maxes, key)
+        if k == len(self.maxes):
+            return None
+        if self.vmax[k] >= bound:
+            chunk, values = self.chunks[k], self.values[k]
+            for i in range(bisect.bisect_left(chunk, key), len(chunk)):
+                if values[i] >= bound:
+                    return chunk[i]
+        # First later chunk whose largest value is big enough
+        tree = self.tree
+        i = k + 1 + self.leaves
+        if k + 1 >= len(self.vmax):
+            return None
+        while tree[i] < bound:
+            while i & 1:
+                i >>= 1
+            if not i:
+                return None
+            i += 1
+        while i < self.leaves:
+            i = 2 * i if tree[2 * i] >= bound else 2 * i + 1
+        k = i - self.leaves
+        values = self.values[k]
+        for i in range(len(values)):
+            if values[i] >= bound:
+                return self.chunks[k][i]
+
+class ExtentIndex:
+    """
+    Free extents (start, length) of a linear space such as memory or a disk.
+    Extents are indexed by start, with the largest length per chunk of
+    starts (for First and Next Fit and for finding the neighbours to coalesce
+    with in O(log n)), and by (length, start) (for Best and Worst Fit in
+    O(log n)). Adjacent free extents are always merged.
+    """
+    def __init__(self, extents=()):
+        extents = list(extents)
+        self.starts = MaxSortedList(extents) # Start -> length, for First and Next Fit
+        self.length = dict(extents)
+        self.by_size = SortedList((length, start) for start, length in extents)
+        self.free = sum(self.length.values())
+        self.cursor = 0 # Next Fit resumes from here
+
+    def __len__(self):
+        return len(self.length)
+
+    def _add(self, start, length):
+        self.starts.add(start, length)
+        self.length[start] = length
+        self.by_size.add((length, start))
+
+    def _remove(self, start):
+        length = self.length.pop(start)
+        self.starts.remove(start)
+        self.by_size.remove((length, start))
+        return length
+
+    def largest(self):
+        fit = self.by_size.last()
+        return fit[0] if fit is not None else 0
+
+    def find(self, size, strategy='first'):
+        """Start of the extent the strategy picks for size, or None."""
+        if strategy == 'best':
+            fit = self.by_size.ceiling((size, -1))
+            return fit[1] if fit is not None else None
+        if strategy == 'worst':
+            fit = self.by_size.last()
+            return fit[1] if fit is not None and fit[0] >= size else None
+        if strategy == 'next':
+            start = self.starts.first_at_least(self.cursor, size)
+            return start if start is not None else self.starts.first_at_least(0, size)
+        if strategy == 'first':
+            return self.starts.first_at_least(0, size)
+        raise ValueError(f"Unknown allocation strategy: {strategy}")
+
+    def is_free(self, start, size):
+        """True if [start, start + size) lies inside one free extent."""
+        head = self.starts.floor(start)
+        return head is not None and head + self.length[head] >= start + size
+
+    def carve(self, start, size):
+        """Marks [start, start + size) as used. Returns False if it is not all free."""
+        head = self.starts.floor(start)
+        if head is None or head + self.length[head] < start + size:
+            return False
+        length = self._remove(head)
+        if start > head:
+            self._add(head, start - head)
+        if head + length > start + size:
+            self._add(start + size, head + length - start - size)
+        self.free -= size
+        self.cursor = start + size
+        return True
+
+    def release(self, start, size):
+        """Marks [start, start + size) as free, merging it with adjacent extents."""
+        self.free += size
+        nxt = start + size
+        if nxt in self.length:
+            size += self._remove(nxt)
+        prev = self.starts.floor(start)
+        if prev is not None and prev + self.length[prev] == start:
+            start, size = prev, size + self._remove(prev)
+        self._add(start, size)
+
+    def extents(self):
+        """(start, length) of every free extent in address order."""
+        return [(start, self.length[start]) for start in self.starts.iter_from(0)]
@@ -0,0 +1,120 @@
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from cpu_scheduling import JobTable, make_policy
+from memory import make_allocator, replay_allocations
+
+# ==========================================
+# PARAMETER SWEEPS
+# ==========================================
+# Every point of a sweep grid is an independent simulation, so the points are
+# fanned out over a process pool. The trace is loaded once into a shared
+# memory segment (one int64 column per field) that the workers attach to,
+# instead of being pickled into every task.
+
+SCHEDULE_COLUMNS = ('id', 'at', 'bt', 'p')
+ALLOCATE_COLUMNS = ('op', 'id', 'size') # op: 0 = alloc, 1 = free
+
+_shared_trace = None # (SharedMemory, columns, n) inside a worker
+
+def share_trace(records, columns):
+    """
+    Copies trace records into a new shared memory segment.
+    Returns (segment, n); the caller must close() and unlink() the segment.
+    """
+    data = [array('q') for _ in columns]
+    for record in records:
+        for col, field in zip(data, columns):
+            col.append(int(record.get(field, 0)))
+    n = len(data[0])
+    segment = shared_memory.SharedMemory(create=True, size=max(8 * n * len(columns), 1))
+    view = segment.buf.cast('q')
+    for k, col in enumerate(data):
+        view[k * n:(k + 1) * n] = col
+    view.release()
+    return segment, n
+
+def _attach_trace(name, columns, n):
+    """Pool initializer: attaches a worker to the shared trace."""
+    global _shared_trace
+    _shared_trace = (shared_memory.SharedMemory(name=name), columns, n)
+
+def _shared_records():
+    """Yields the shared trace as plain records, one row at a time."""
+    segment, columns, n = _shared_trace
+    view = segment.buf.cast('q')
+    cols = [view[k * n:(k + 1) * n] for k in range(len(columns))]
+    try:
+        for i in range(n):
+            yield {field: col[i] for field, col in zip(columns, cols)}
+    finally:
+        for col in cols:
+            col.release()
+        view.release()
+
+def _run_point(point):
+    """Runs one sweep point against the shared trace and returns its result row."""
+    start = time.perf_counter()
+    if point['kind'] == 'schedule':
+        policy = make_policy(point['policy'], point.get('quantum'), point.get('quanta'))
+        segment, columns, n = _shared_trace
+        view = segment.buf.cast('q')
+        cols = [view[k * n:(k + 1) * n] for k in range(len(columns))]
+        try:
+            # Run straight off the shared columns, with no per-row records
+            row = JobTable(*cols).run(policy, point.get('context_switch', 0)).metrics()
+        finally:
+            for col in cols:
+                col.release()
+            view.release()
+    else:
+        allocator = make_allocator(point['strategy'], point['blocks'])
+        events = ({'op': 'free' if r['op'] else 'alloc', 'id': r['id'], 'size': r['size']}
+                  for r in _shared_records())
+        for _ in replay_allocations(events, allocator):
+            pass
+        row = allocator.report()
+        attempts = row['allocations'] + row['failures']
+        row['failed_pct'] = 100 * row['failures'] / attempts if attempts else 0.0
+    row.update({k: v for k, v in point.items() if k != 'kind'})
+    if 'blocks' in row:
+        row['blocks'] = ','.join(map(str, row['blocks']))
+    row['seconds'] = time.perf_counter() - start
+    return row
+
+def schedule_grid(policies, quanta=(None,), context_switches=(0,)):
+    """Sweep points for every policy x quantum x context switch combination."""
+    points = []
+    for name in policies:
+        # Only Round Robin takes a quantum; the other policies get one point each
+        for q in (quanta if name == 'rr' else (None,)):
+            for cs in context_switches:
+                points.append({'kind': 'schedule', 'policy': name, 'quantum': q, 'context_switch': cs})
+    return points
+
+def allocate_grid(strategies, block_layouts):
+    """Sweep points for every fit strategy x block layout combination."""
+    return [{'kind': 'allocate', 'strategy': s, 'blocks': list(b)}
+            for s in strategies for b in block_layouts]
+
+def run_sweep(records, points, workers=None):
+    """
+    Runs every sweep point over the same trace on a process pool and returns
+    one result row per point, in the order of points.
+    """
+    if points and points[0]['kind'] == 'schedule':
+        columns = SCHEDULE_COLUMNS
+    else:
+        columns = ALLOCATE_COLUMNS
+        records = ({'op': int(r.get('op') == 'free'), 'id': r.get('id', i + 1), 'size': r.get('size') or 0}
+                   for i, r in enumerate(records))
+    segment, n = share_trace(records, columns)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_trace,
+                                 initargs=(segment.name, columns, n)) as pool:
+            return list(pool.map(_run_point, points))
+    finally:
+        segment.close()
+        segment.unlink()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The simulator modules sit next to main.py, which is run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
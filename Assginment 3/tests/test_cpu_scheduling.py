@@ -0,0 +1,157 @@
+import random
+from collections import deque
+
+import pytest
+
+from cpu_scheduling import (JobTable, MLFQPolicy, PriorityPolicy, RoundRobinPolicy, SRTFPolicy,
+                            make_policy, schedule, stream_schedule)
+
+
+def random_jobs(rng, n):
+    jobs, at = [], 0
+    for i in range(n):
+        at += rng.choice([0, 0, 1, 2, 5, 20])
+        jobs.append({'id': i + 1, 'at': at, 'bt': rng.randint(1, 12), 'p': rng.randint(0, 4)})
+    return jobs
+
+
+def reference_schedule(jobs, policy, quantum=None, quanta=None):
+    """
+    Tick-by-tick reference: advances the clock one time unit at a time and
+    re-decides everything at every tick. Returns {id: completion time}.
+    At each tick, in order: the running job completes or its slice expires,
+    arrivals join the ready queue, a preemptive policy may take the CPU from
+    the running job, an expired job is requeued behind the arrivals, and an
+    idle CPU picks the next job.
+    """
+    pending = sorted(jobs, key=lambda j: (j['at'], j['id']))
+    rem = {j['id']: j['bt'] for j in jobs}
+    info = {j['id']: j for j in jobs}
+    lvl = {j['id']: 0 for j in jobs}
+    ready = [] if policy in ('priority', 'ppriority', 'srtf') else None
+    fifo = deque()
+    levels = [deque() for _ in quanta] if policy == 'mlfq' else None
+    done = {}
+    running, used, t = None, 0, 0
+
+    def key(job_id):
+        if policy == 'srtf':
+            return (rem[job_id], info[job_id]['at'], job_id)
+        return (info[job_id]['p'], info[job_id]['at'], job_id)
+
+    def slice_length(job_id):
+        if policy == 'rr':
+            return quantum
+        if policy == 'mlfq':
+            return quanta[lvl[job_id]]
+        return None
+
+    def push(job_id):
+        if ready is not None:
+            ready.append(job_id)
+        elif levels is not None:
+            levels[lvl[job_id]].append(job_id)
+        else:
+            fifo.append(job_id)
+
+    def pop():
+        if ready is not None:
+            if not ready:
+                return None
+            best = min(ready, key=key)
+            ready.remove(best)
+            return best
+        if levels is not None:
+            return next((level.popleft() for level in levels if level), None)
+        return fifo.popleft() if fifo else None
+
+    while len(done) < len(jobs):
+        expired = None
+        if running is not None:
+            if rem[running] == 0:
+                done[running] = t
+                running = None
+            elif slice_length(running) is not None and used == slice_length(running):
+                expired, running = running, None
+        while pending and pending[0]['at'] <= t:
+            push(pending.pop(0)['id'])
+        if running is not None:
+            if policy in ('ppriority', 'srtf') and ready and min(map(key, ready)) < key(running):
+                push(running)
+                running = None
+            elif policy == 'mlfq' and any(levels[l] for l in range(lvl[running])):
+                push(running)
+                running = None
+        if expired is not None:
+            if policy == 'mlfq':
+                lvl[expired] = min(lvl[expired] + 1, len(quanta) - 1)
+            push(expired)
+        if running is None:
+            running, used = pop(), 0
+        if running is not None:
+            rem[running] -= 1
+            used += 1
+        t += 1
+    return done
+
+
+CASES = [
+    ('priority', {}),
+    ('ppriority', {}),
+    ('srtf', {}),
+    ('rr', {'quantum': 1}),
+    ('rr', {'quantum': 3}),
+    ('mlfq', {'quanta': [2, 4]}),
+    ('mlfq', {'quanta': [1]}),
+]
+
+
+@pytest.mark.parametrize('name, params', CASES)
+def test_policy_matches_tick_reference(name, params):
+    rng = random.Random(name + str(params))
+    for _ in range(40):
+        jobs = random_jobs(rng, rng.randint(1, 25))
+        quanta = params.get('quanta')
+        policy = make_policy(name, params.get('quantum'), quanta)
+        result = schedule(jobs, policy)
+        got = {r['id']: r['ct'] for r in result['jobs']}
+        expected = reference_schedule(jobs, name, params.get('quantum'),
+                                      quanta + [None] if quanta else None)
+        assert got == expected
+
+
+@pytest.mark.parametrize('policy', [lambda: PriorityPolicy(), lambda: PriorityPolicy(preemptive=True),
+                                    lambda: SRTFPolicy(), lambda: RoundRobinPolicy(2),
+                                    lambda: MLFQPolicy((2, 4, None))])
+def test_streaming_matches_job_table(policy):
+    rng = random.Random(7)
+    jobs = random_jobs(rng, 300)
+    table = {r['id']: r for r in schedule(jobs, policy())['jobs']}
+    streamed = {r['id']: r for r in stream_schedule(jobs, policy())}
+    assert streamed == table
+
+
+def test_job_table_sorts_unordered_input():
+    jobs = [{'id': 2, 'at': 3, 'bt': 2}, {'id': 1, 'at': 0, 'bt': 4}, {'id': 3, 'at': 3, 'bt': 1}]
+    table = JobTable.from_records(jobs)
+    table.run(RoundRobinPolicy(2))
+    assert list(table.ct) == [6, 4, 7]
+
+
+def test_results_conserve_work():
+    rng = random.Random(3)
+    jobs = random_jobs(rng, 200)
+    for name, params in CASES:
+        policy = make_policy(name, params.get('quantum'), params.get('quanta'))
+        for r in schedule(jobs, policy)['jobs']:
+            assert r['tat'] == r['ct'] - r['at'] >= r['bt']
+            assert r['wt'] == r['tat'] - r['bt'] >= 0
+
+
+def test_context_switch_only_delays():
+    rng = random.Random(4)
+    jobs = random_jobs(rng, 100)
+    plain = schedule(jobs, RoundRobinPolicy(3))['jobs']
+    switched = schedule(jobs, RoundRobinPolicy(3), context_switch=1)['jobs']
+    assert all(s['ct'] >= p['ct'] for s, p in zip(switched, plain))
+    assert max(s['ct'] for s in switched) > max(p['ct'] for p in plain)
@@ -0,0 +1,61 @@
+import pytest
+
+from file_allocation import BlockPool, IndexedDisk, LinkedDisk
+
+
+def test_block_pool_rejects_double_free_without_changes():
+    pool = BlockPool(10)
+    blocks = pool.take(4)
+    pool.give(blocks[:1])
+    bitmap, free = bytes(pool.bitmap), pool.free
+    with pytest.raises(ValueError):
+        pool.give(blocks) # blocks[0] is already free
+    with pytest.raises(ValueError):
+        pool.give([blocks[1], blocks[1]])
+    assert bytes(pool.bitmap) == bitmap
+    assert pool.free == free
+
+
+def test_block_pool_take_wraps_and_counts():
+    pool = BlockPool(8)
+    first = pool.take(6)
+    pool.give(first[:3])
+    assert sorted(pool.take(5)) == [0, 1, 2, 6, 7]
+    assert pool.free == 0
+    with pytest.raises(ValueError):
+        pool.take(1)
+
+
+def test_indexed_overhead_ignores_reserved_blocks():
+    disk = IndexedDisk(100, pointers_per_block=8)
+    for block in range(0, 100, 5):
+        disk.reserve(block)
+    record = disk.create('a', 30)
+    meta, data = len(record['meta']), len(record['data'])
+    assert data == 30
+    assert disk.metadata_overhead() == meta / (meta + data)
+    assert disk.delete('a')
+    assert disk.metadata_overhead() == 0.0
+    assert disk.free == 80
+
+
+def test_indexed_delete_after_double_free_leaves_disk_unchanged():
+    disk = IndexedDisk(100, pointers_per_block=8)
+    record = disk.create('a', 30)
+    disk.pool.give([record['data'][5]])
+    free, overhead = disk.free, disk.metadata_overhead()
+    with pytest.raises(ValueError):
+        disk.delete('a')
+    assert 'a' in disk.files
+    assert (disk.free, disk.metadata_overhead()) == (free, overhead)
+
+
+@pytest.mark.parametrize('fat', [False, True])
+def test_linked_delete_returns_every_block(fat):
+    disk = LinkedDisk(50, fat=fat)
+    free = disk.free
+    disk.create('a', 7)
+    assert disk.free == free - 7
+    assert disk.delete('a')
+    assert disk.free == free
+    assert not disk.delete('a')
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from memory import FitAllocator, allocate
+
+
+def reference_pick(free_space, size, strategy):
+    """The original linear scans: ties go to the lowest block number."""
+    fits = [j for j, free in enumerate(free_space) if free >= size]
+    if not fits:
+        return -1
+    if strategy == 'first':
+        return fits[0]
+    if strategy == 'best':
+        return min(fits, key=lambda j: (free_space[j], j))
+    return min(fits, key=lambda j: (-free_space[j], j)) # worst
+
+
+@pytest.mark.parametrize('strategy', ['first', 'best', 'worst'])
+def test_fit_allocator_matches_linear_scan(strategy):
+    rng = random.Random(strategy)
+    for _ in range(30):
+        blocks = [rng.randint(0, 300) for _ in range(rng.randint(0, 40))]
+        allocator = FitAllocator(blocks, strategy)
+        free_space = list(blocks)
+        live = {}
+        for handle in range(400):
+            if live and rng.random() < 0.4:
+                victim = rng.choice(list(live))
+                j, size = live.pop(victim)
+                assert allocator.free(victim)
+                free_space[j] += size
+            else:
+                size = rng.randint(0, 120)
+                expected = reference_pick(free_space, size, strategy)
+                assert allocator.allocate(size, handle) == expected
+                if expected != -1:
+                    free_space[expected] -= size
+                    live[handle] = (expected, size)
+            assert allocator.free_space == free_space
+        report = allocator.report()
+        assert report['free'] == sum(free_space)
+        assert report['largest_free'] == max(free_space, default=0)
+        assert report['live'] == len(live)
+
+
+@pytest.mark.parametrize('strategy', ['first', 'best', 'worst'])
+def test_empty_block_list_fits_nothing(strategy):
+    assert allocate([], [0, 5], strategy) == [-1, -1]
+
+
+def test_free_unknown_handle():
+    allocator = FitAllocator([10], 'first')
+    assert not allocator.free('missing')
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        FitAllocator([10], 'random')
@@ -0,0 +1,122 @@
+import bisect
+import random
+
+import pytest
+
+from structures import ExtentIndex, MaxSortedList, SortedList
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Tiny chunks, so a few hundred operations split and empty many of them
+    monkeypatch.setattr(SortedList, 'CHUNK', 2)
+
+
+def free_runs(bitmap):
+    """(start, length) of every run of free (0) cells: the reference extents."""
+    runs, start = [], None
+    for i, used in enumerate(bitmap + b'\x01'):
+        if not used and start is None:
+            start = i
+        elif used and start is not None:
+            runs.append((start, i - start))
+            start = None
+    return runs
+
+
+def reference_find(runs, size, strategy, cursor):
+    fits = [(start, length) for start, length in runs if length >= size]
+    if not fits:
+        return None
+    if strategy == 'first':
+        return fits[0][0]
+    if strategy == 'next':
+        return next((start for start, _ in fits if start >= cursor), fits[0][0])
+    if strategy == 'best':
+        return min(fits, key=lambda run: (run[1], run[0]))[0]
+    return max(fits, key=lambda run: (run[1], run[0]))[0] # worst
+
+
+def test_sorted_list_matches_a_plain_sorted_list(small_chunks):
+    rng = random.Random(1)
+    items = SortedList(rng.sample(range(1000), 50))
+    reference = sorted(items.iter_from(0))
+    for _ in range(2000):
+        if reference and rng.random() < 0.45:
+            item = rng.choice(reference)
+            items.remove(item)
+            reference.remove(item)
+        else:
+            item = rng.randrange(1000)
+            if item in reference:
+                continue
+            items.add(item)
+            bisect.insort(reference, item)
+        probe = rng.randrange(-1, 1001)
+        i = bisect.bisect_left(reference, probe)
+        assert items.ceiling(probe) == (reference[i] if i < len(reference) else None)
+        i = bisect.bisect_right(reference, probe)
+        assert items.floor(probe) == (reference[i - 1] if i else None)
+        assert list(items.iter_from(probe)) == [x for x in reference if x >= probe]
+        assert len(items) == len(reference)
+    assert items.last() == (reference[-1] if reference else None)
+
+
+def test_max_sorted_list_first_at_least(small_chunks):
+    rng = random.Random(2)
+    values = {}
+    keys = MaxSortedList()
+    for _ in range(2000):
+        if values and rng.random() < 0.4:
+            key = rng.choice(list(values))
+            keys.remove(key)
+            del values[key]
+        else:
+            key = rng.randrange(500)
+            if key in values:
+                continue
+            values[key] = rng.randrange(1, 50)
+            keys.add(key, values[key])
+        lo, bound = rng.randrange(500), rng.randrange(1, 50)
+        expected = min((k for k, v in values.items() if k >= lo and v >= bound), default=None)
+        assert keys.first_at_least(lo, bound) == expected
+
+
+@pytest.mark.parametrize('strategy', ['first', 'next', 'best', 'worst'])
+def test_extent_index_matches_a_block_map(small_chunks, strategy):
+    rng = random.Random(strategy)
+    for _ in range(20):
+        total = rng.randint(1, 400)
+        bitmap = bytearray(total)
+        index = ExtentIndex([(0, total)])
+        held = []
+        for _ in range(300):
+            if held and rng.random() < 0.45:
+                start, size = held.pop(rng.randrange(len(held)))
+                index.release(start, size)
+                bitmap[start:start + size] = bytes(size)
+            else:
+                size = rng.randint(1, max(1, total // 8))
+                runs = free_runs(bitmap)
+                start = index.find(size, strategy)
+                assert start == reference_find(runs, size, strategy, index.cursor)
+                if start is None:
+                    continue
+                assert index.carve(start, size)
+                bitmap[start:start + size] = b'\x01' * size
+                held.append((start, size))
+            # Invariants: extents are the free runs (so always merged), counts agree
+            runs = free_runs(bitmap)
+            assert index.extents() == runs
+            assert index.free == bitmap.count(0)
+            assert len(index) == len(runs)
+            assert index.largest() == max((length for _, length in runs), default=0)
+
+
+def test_extent_index_carve_rejects_used_space():
+    index = ExtentIndex([(0, 10)])
+    assert index.carve(2, 3)
+    assert not index.carve(4, 2)
+    assert not index.is_free(0, 3)
+    assert index.is_free(5, 5)
+    assert index.extents() == [(0, 2), (5, 5)]
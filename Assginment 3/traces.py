@@ -0,0 +1,256 @@
+import bisect
+import csv
+import heapq
+import itertools
+import json
+import math
+import random
+import sys
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; traces are drawn in pure Python without it
+    np = None
+
+# ==========================================
+# TRACE GENERATION
+# ==========================================
+# Synthetic workloads from seeded statistical models. Columns are drawn one
+# chunk at a time and written out before the next chunk is drawn, so memory
+# is bounded by the chunk size however long the trace is. Draws are
+# vectorized with NumPy when it is installed, with the random module
+# otherwise; a given seed reproduces the same trace on the same backend.
+
+TRACE_KINDS = ('schedule', 'allocate', 'mvt', 'files', 'disk', 'paging')
+
+class Sampler:
+    """Seeded source of random columns: NumPy arrays, or lists without NumPy."""
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        self.cdfs = {} # (items, s) -> Zipf CDF
+
+    def sequence(self, start, n):
+        return np.arange(start, start + n, dtype=np.int64) if np is not None else list(range(start, start + n))
+
+    def uniform(self, n):
+        return self.rng.random(n) if np is not None else [self.rng.random() for _ in range(n)]
+
+    def integers(self, lo, hi, n):
+        """n integers uniform on [lo, hi]."""
+        if np is not None:
+            return self.rng.integers(lo, hi + 1, n)
+        return [self.rng.randint(lo, hi) for _ in range(n)]
+
+    def exponential(self, mean, n):
+        if np is not None:
+            return self.rng.exponential(mean, n)
+        return [self.rng.expovariate(1 / mean) for _ in range(n)]
+
+    def pareto(self, alpha, scale, n):
+        """Pareto with shape alpha and minimum scale."""
+        if np is not None:
+            return (self.rng.pareto(alpha, n) + 1) * scale
+        return [self.rng.paretovariate(alpha) * scale for _ in range(n)]
+
+    def lognormal(self, mu, sigma, n):
+        if np is not None:
+            return self.rng.lognormal(mu, sigma, n)
+        return [self.rng.lognormvariate(mu, sigma) for _ in range(n)]
+
+    def zipf(self, items, s, n):
+        """n ranks in [0, items) with P(rank k) proportional to 1 / (k + 1) ** s."""
+        cdf = self.cdfs.get((items, s))
+        if np is not None:
+            if cdf is None:
+                cdf = self.cdfs[items, s] = np.cumsum(1.0 / np.arange(1, items + 1) ** s)
+            ranks = np.searchsorted(cdf, self.rng.random(n) * cdf[-1], side='right')
+            return np.minimum(ranks, items - 1)
+        if cdf is None:
+            cdf = self.cdfs[items, s] = list(itertools.accumulate(1.0 / k ** s for k in range(1, items + 1)))
+        total, last = cdf[-1], items - 1
+        return [min(bisect.bisect_right(cdf, self.rng.random() * total), last) for _ in range(n)]
+
+    def permutation(self, items):
+        if np is not None:
+            return self.rng.permutation(items)
+        values = list(range(items))
+        self.rng.shuffle(values)
+        return values
+
+    def positive_ints(self, values):
+        """Rounds samples up to integers of at least 1."""
+        if np is not None:
+            return np.maximum(np.ceil(values), 1).astype(np.int64)
+        return [max(1, math.ceil(v)) for v in values]
+
+    def arrivals(self, rate, n, start):
+        """
+        Arrival times of a Poisson process with the given rate (exponential
+        gaps), continuing from time start. Returns (integer times, new start).
+        """
+        gaps = self.exponential(1 / rate, n)
+        if np is not None:
+            times = start + np.cumsum(gaps)
+            return np.floor(times).astype(np.int64), float(times[-1])
+        times = list(itertools.accumulate(gaps, initial=start))[1:]
+        return [int(t) for t in times], times[-1]
+
+    def tolist(self, values):
+        return values.tolist() if np is not None else values
+
+def _chunks(n, chunk):
+    for start in range(0, n, chunk):
+        yield start, min(chunk, n - start)
+
+def schedule_workload(sampler, n, rate=0.15, burst='exp', mean_burst=5.0, alpha=1.5, priorities=5, chunk=1 << 18):
+    """
+    Scheduling trace (id, at, bt, p): Poisson arrivals, exponential or
+    Pareto (heavy-tailed) bursts with the given mean, uniform priorities.
+    """
+    t = 0.0
+    for start, m in _chunks(n, chunk):
+        at, t = sampler.arrivals(rate, m, t)
+        if burst == 'pareto':
+            # Minimum that gives the requested mean (the mean is infinite for alpha <= 1)
+            raw = sampler.pareto(alpha, mean_burst * (alpha - 1) / alpha if alpha > 1 else mean_burst, m)
+        else:
+            raw = sampler.exponential(mean_burst, m)
+        yield {'id': sampler.sequence(start + 1, m), 'at': at, 'bt': sampler.positive_ints(raw),
+               'p': sampler.integers(1, priorities, m)}
+
+def mvt_workload(sampler, n, rate=0.15, size_mu=4.0, size_sigma=1.0, lifetime=100.0, chunk=1 << 18):
+    """MVT trace (id, at, size, duration): Poisson arrivals, lognormal sizes, exponential durations."""
+    t = 0.0
+    for start, m in _chunks(n, chunk):
+        at, t = sampler.arrivals(rate, m, t)
+        yield {'id': sampler.sequence(start + 1, m), 'at': at,
+               'size': sampler.positive_ints(sampler.lognormal(size_mu, size_sigma, m)),
+               'duration': sampler.positive_ints(sampler.exponential(lifetime, m))}
+
+def disk_workload(sampler, n, rate=0.15, cylinders=5000, chunk=1 << 18):
+    """Disk request trace (id, at, block): Poisson arrivals, uniform blocks."""
+    t = 0.0
+    for start, m in _chunks(n, chunk):
+        at, t = sampler.arrivals(rate, m, t)
+        yield {'id': sampler.sequence(start + 1, m), 'at': at, 'block': sampler.integers(0, cylinders - 1, m)}
+
+def paging_workload(sampler, n, pages=1000, s=1.0, chunk=1 << 18):
+    """
+    Page references (page) with Zipf popularity. Ranks are mapped through a
+    random permutation, so the popular pages are spread over the page space.
+    """
+    pages_by_rank = sampler.permutation(pages)
+    for start, m in _chunks(n, chunk):
+        yield {'page': pages_by_rank[sampler.zipf(pages, s, m)] if np is not None
+               else [pages_by_rank[k] for k in sampler.zipf(pages, s, m)]}
+
+def allocate_workload(sampler, n, size_mu=4.0, size_sigma=1.0, lifetime=100.0, chunk=1 << 18):
+    """
+    Allocation trace (op, id, size) of n allocations with lognormal sizes.
+    Each allocation is freed after an exponential lifetime, counted in later
+    allocations; allocations still live at the end are left allocated.
+    """
+    pending = [] # Heap of (free time, id)
+    for start, m in _chunks(n, chunk):
+        sizes = sampler.tolist(sampler.positive_ints(sampler.lognormal(size_mu, size_sigma, m)))
+        lifetimes = sampler.tolist(sampler.exponential(lifetime, m))
+        ops, ids, out = [], [], []
+        for t, size, life in zip(range(start, start + m), sizes, lifetimes):
+            while pending and pending[0][0] <= t:
+                ops.append('free')
+                ids.append(heapq.heappop(pending)[1])
+                out.append('')
+            ops.append('alloc')
+            ids.append(t + 1)
+            out.append(size)
+            heapq.heappush(pending, (t + life, t + 1))
+        yield {'op': ops, 'id': ids, 'size': out}
+
+def files_workload(sampler, n, size_mu=3.0, size_sigma=1.0, create=0.1, delete=0.05, chunk=1 << 18):
+    """
+    File trace (op, name, size, block) of n events: creates with lognormal
+    sizes, deletes of a random live file and, otherwise, reads of a random
+    block of a random live file.
+    """
+    live = [] # Live files as (name, size); deletes swap the last one into the hole
+    next_name = 1
+    for start, m in _chunks(n, chunk):
+        choice, pick, offset = (sampler.tolist(sampler.uniform(m)) for _ in range(3))
+        sizes = sampler.tolist(sampler.positive_ints(sampler.lognormal(size_mu, size_sigma, m)))
+        ops, names, out, blocks = [], [], [], []
+        for x, y, z, size in zip(choice, pick, offset, sizes):
+            if not live or x < create:
+                live.append((next_name, size))
+                ops.append('create')
+                names.append(next_name)
+                out.append(size)
+                blocks.append('')
+                next_name += 1
+                continue
+            k = int(y * len(live))
+            name, length = live[k]
+            if x < create + delete:
+                live[k] = live[-1]
+                live.pop()
+                ops.append('delete')
+                out.append('')
+                blocks.append('')
+            else:
+                ops.append('read')
+                out.append('')
+                blocks.append(int(z * length))
+            names.append(name)
+        yield {'op': ops, 'name': names, 'size': out, 'block': blocks}
+
+TRACE_FIELDS = {
+    'schedule': ('id', 'at', 'bt', 'p'),
+    'allocate': ('op', 'id', 'size'),
+    'mvt': ('id', 'at', 'size', 'duration'),
+    'files': ('op', 'name', 'size', 'block'),
+    'disk': ('id', 'at', 'block'),
+    'paging': ('page',),
+}
+
+def write_trace(chunks, path, fields, header=True):
+    """
+    Writes column chunks as a CSV trace ('-' = stdout), one chunk at a time.
+    Each chunk is formatted with a single %-format of a repeated row template,
+    which is several times faster than a csv.writer or numpy.savetxt. Fields
+    are integers or plain words, so they never need quoting. Without a
+    header, a single-column trace is a plain list of numbers, which
+    read_references reads.
+    Returns the number of rows written.
+    """
+    out = sys.stdout if path == '-' else open(path, 'w', buffering=1 << 20)
+    row = ','.join(['%s'] * len(fields)) + '\n'
+    count = 0
+    try:
+        if header:
+            out.write(','.join(fields) + '\n')
+        for chunk in chunks:
+            columns = [chunk[field] for field in fields]
+            if np is not None and all(isinstance(col, np.ndarray) for col in columns):
+                values = np.column_stack(columns).ravel().tolist()
+            else:
+                values = list(itertools.chain.from_iterable(zip(*columns)))
+            n = len(columns[0])
+            out.write((row * n) % tuple(values))
+            count += n
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count
+
+def read_trace(path):
+    """
+    Streams records from a CSV (with header row) or JSONL trace file.
+    Numeric CSV fields are converted to int.
+    """
+    with open(path, newline='') as f:
+        if path.endswith(('.jsonl', '.json')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(f):
+                yield {k: int(v) if v.lstrip('-').isdigit() else v for k, v in row.items()}
@@ -1,6 +1,14 @@
+import contextlib
+import heapq
+import itertools
 import os
+import select
+import selectors
+import signal
+import struct
 import sys
 import time
+from array import array
 
 # --- Task 1: Process Creation Utility ---
 def task_1_process_creation(num_children=3):
@@ -36,6 +44,365 @@ def task_1_process_creation(num_children=3):
     print("-" * 50)
 
 
+# --- Child Reaping Helpers ---
+@contextlib.contextmanager
+def sigchld_wakeup():
+    """
+    While active, every SIGCHLD writes a byte to the returned pipe, so a
+    selector can wait for children to exit alongside its other descriptors.
+    """
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    old_handler = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    old_wakeup = signal.set_wakeup_fd(wake_w)
+    try:
+        yield wake_r
+    finally:
+        signal.set_wakeup_fd(old_wakeup)
+        signal.signal(signal.SIGCHLD, old_handler)
+        os.close(wake_r)
+        os.close(wake_w)
+
+
+def reset_child_signals():
+    """Detaches a forked child that does not exec from the parent's SIGCHLD wakeup."""
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+
+def drain(fd):
+    """Reads a non-blocking pipe until it is empty."""
+    try:
+        while os.read(fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def reap_exited():
+    """
+    Reaps every child that has exited, without blocking, in whatever order
+    they finished. Yields (pid, exit code); a child killed by a signal gets
+    minus the signal number, as in subprocess.
+    """
+    while True:
+        try:
+            info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG)
+        except ChildProcessError:
+            return # No children left
+        if info is None:
+            return
+        yield info.si_pid, info.si_status if info.si_code == os.CLD_EXITED else -info.si_status
+
+
+# --- Task 1 (continued): Pre-forked Worker Pool ---
+# Forking a child per task costs a fork() and a reap per task. A pool forks
+# a fixed set of workers once; they take fixed-size task records from a pipe
+# and send result records back through another. Records are written in
+# chunks of at most PIPE_BUF bytes, which the kernel writes atomically, so
+# workers sharing the pipes never see a torn record.
+TASK_RECORD = struct.Struct('=qq')     # task id, argument
+RESULT_RECORD = struct.Struct('=qqqq') # task id, worker slot, status (0 ok, 1 raised), service time (ns)
+TASKS_PER_READ = 32                    # Tasks a worker takes from the pipe at once
+POOL_RESTARTS = 3                      # Re-forks of a slot in a row without a finished task
+
+
+def short_task(n):
+    """A short CPU-bound task: sums the first n squares."""
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _write_records(fd, data, size):
+    """Writes data to fd in chunks of whole records of at most PIPE_BUF bytes."""
+    step = select.PIPE_BUF // size * size
+    for i in range(0, len(data), step):
+        os.write(fd, data[i:i + step])
+
+
+def _pool_worker(index, task_fd, result_fd, work, per_read=TASKS_PER_READ):
+    """
+    Worker loop: runs tasks from the task pipe until EOF, reporting each one.
+    A task that raises is reported as failed rather than taking the worker
+    (and the rest of its batch) down with it.
+    """
+    results = bytearray()
+    while True:
+        data = os.read(task_fd, TASK_RECORD.size * per_read)
+        if not data:
+            break
+        for task_id, arg in TASK_RECORD.iter_unpack(data):
+            status = 0
+            start = time.perf_counter_ns()
+            try:
+                work(arg)
+            except Exception:
+                status = 1
+            results += RESULT_RECORD.pack(task_id, index, status, time.perf_counter_ns() - start)
+        _write_records(result_fd, results, RESULT_RECORD.size)
+        results.clear()
+
+
+def _fork_pool_worker(index, task_r, result_w, parent_fds, work, per_read):
+    """
+    Forks a pool worker for slot index on the task and result pipes; it
+    closes the parent's ends in parent_fds (-1 for one already closed).
+    Returns its pid.
+    """
+    pid = os.fork()
+    if pid == 0:
+        # --- Worker Process Logic ---
+        status = 0
+        try:
+            reset_child_signals()
+            for fd in parent_fds:
+                if fd >= 0:
+                    os.close(fd)
+            _pool_worker(index, task_r, result_w, work, per_read)
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+    return pid
+
+
+def _pool_round(tasks, workers, work, outstanding, totals, exits, per_read=TASKS_PER_READ):
+    """
+    Runs (task id, arg) pairs on one pool of pre-forked workers until the
+    pool drains. The parent feeds the task pipe and collects results with one
+    selector, and reaps workers in whatever order they exit (a SIGCHLD wakes
+    the selector, then os.waitid with WNOHANG collects every exited child).
+    A worker that dies is re-forked in its slot (the parent keeps the pipe
+    ends a replacement needs until the pool is empty), unless the slot has died POOL_RESTARTS times in a row without
+    finishing a task. Every task sent stays in outstanding until its result
+    comes back, so whatever is left there afterwards went down with a worker.
+    Adds to the counts in totals and appends (pid, slot, exit code) of every
+    worker to exits. Returns the tasks that no worker took because every
+    worker was gone.
+    """
+    task_r, task_w = os.pipe()
+    result_r, result_w = os.pipe()
+    os.set_blocking(task_w, False)
+    with sigchld_wakeup() as wake_r:
+        start = time.perf_counter()
+        pids = {} # pid -> worker slot
+        try:
+            for index in range(workers):
+                pids[_fork_pool_worker(index, task_r, result_w, (task_w, result_r), work, per_read)] = index
+        except OSError:
+            if not pids:
+                for fd in (task_r, task_w, result_r, result_w):
+                    os.close(fd)
+                raise # Otherwise run with the workers that did start
+        totals['fork_seconds'] += time.perf_counter() - start
+
+        per_worker = totals['per_worker']
+        deaths = [0] * workers # Deaths in a row per slot without a finished task
+        fed = False
+        unread = [] # Tasks written but never read by a worker
+        batch = [] # Tasks taken from tasks but not yet written...
+        pending = b'' # ...and their records
+        leftover = b'' # A partial result record from the last read
+        step = select.PIPE_BUF // TASK_RECORD.size
+        sel = selectors.DefaultSelector()
+        sel.register(task_w, selectors.EVENT_WRITE)
+        sel.register(result_r, selectors.EVENT_READ)
+        sel.register(wake_r, selectors.EVENT_READ)
+        try:
+            while pids or result_r in sel.get_map():
+                if task_w >= 0 and (fed or not pids):
+                    # Out of tasks (or of workers): closing the task pipe tells the
+                    # workers to exit once they have emptied it
+                    sel.unregister(task_w)
+                    os.close(task_w)
+                    task_w = -1
+                if task_r >= 0 and not pids:
+                    # Every worker is gone: take back the tasks none of them read,
+                    # and close the ends kept for replacements so the result pipe
+                    # reaches EOF
+                    os.set_blocking(task_r, False)
+                    try:
+                        while True:
+                            data = os.read(task_r, 1 << 16)
+                            if not data:
+                                break
+                            for task_id, _ in TASK_RECORD.iter_unpack(data):
+                                unread.append((task_id, outstanding.pop(task_id)))
+                    except BlockingIOError:
+                        pass
+                    os.close(task_r)
+                    os.close(result_w)
+                    task_r = result_w = -1
+                for key, _ in sel.select():
+                    fd = key.fd
+                    if fd == task_w:
+                        if not pending:
+                            batch = list(itertools.islice(tasks, step))
+                            pending = b''.join(TASK_RECORD.pack(task_id, arg) for task_id, arg in batch)
+                            fed = not batch
+                        try:
+                            # At most PIPE_BUF bytes, so written whole or not at all
+                            os.write(task_w, pending)
+                            outstanding.update(batch)
+                            pending = b''
+                        except BlockingIOError:
+                            pass
+                    elif fd == result_r:
+                        data = os.read(result_r, 1 << 16)
+                        if not data:
+                            sel.unregister(result_r)
+                            continue
+                        data = leftover + data
+                        cut = len(data) - len(data) % RESULT_RECORD.size
+                        leftover = data[cut:]
+                        for task_id, index, status, ns in RESULT_RECORD.iter_unpack(data[:cut]):
+                            del outstanding[task_id]
+                            deaths[index] = 0
+                            per_worker[index] += 1
+                            if status:
+                                totals['failed'] += 1
+                            else:
+                                totals['completed'] += 1
+                                totals['service_ns'] += ns
+                    else:
+                        drain(wake_r)
+                        for pid, code in reap_exited():
+                            if pid not in pids:
+                                continue
+                            index = pids.pop(pid)
+                            exits.append((pid, index, code))
+                            if code == 0:
+                                continue
+                            totals['crashed'] += 1
+                            deaths[index] += 1
+                            if deaths[index] <= POOL_RESTARTS:
+                                try:
+                                    pids[_fork_pool_worker(index, task_r, result_w, (task_w, result_r),
+                                                           work, per_read)] = index
+                                    totals['restarted'] += 1
+                                except OSError:
+                                    pass # Carry on with the workers left
+        finally:
+            sel.close()
+            for fd in (task_w, task_r, result_w, result_r):
+                if fd >= 0:
+                    os.close(fd)
+    return unread + batch if pending else unread
+
+
+def run_worker_pool(tasks, workers=None, work=short_task, retries=2):
+    """
+    Runs work(arg) for every arg in tasks on a pool of pre-forked workers.
+    A task that raises is counted as failed. A worker that dies takes the
+    tasks it was holding (up to TASKS_PER_READ) with it: the parent keeps
+    every task sent but not yet reported, and once the pool has drained
+    reruns those on a fresh pool, up to retries times. Those workers take
+    one task at a time, so a task that kills its worker only loses itself.
+    Tasks sent that still have not finished are counted as lost, and tasks
+    never sent (every worker gone) as unsent.
+    Returns a dict of timings and counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    totals = {'completed': 0, 'failed': 0, 'crashed': 0, 'restarted': 0, 'service_ns': 0,
+              'fork_seconds': 0.0, 'per_worker': [0] * workers}
+    outstanding = {} # task id -> arg, sent but not yet reported
+    tasks = enumerate(tasks)
+    exits = [] # (pid, slot, exit code) of every worker
+    requeued = 0
+    start = time.perf_counter()
+    for attempt in range(retries + 1):
+        crashed = totals['crashed']
+        unwritten = _pool_round(tasks, workers, work, outstanding, totals, exits,
+                                TASKS_PER_READ if attempt == 0 else 1)
+        tasks = itertools.chain(unwritten, tasks)
+        if totals['crashed'] == crashed or attempt == retries:
+            break
+        # The dead workers' tasks go first, then any the pool never got to
+        requeued += len(outstanding)
+        tasks = itertools.chain(sorted(outstanding.items()), tasks)
+        outstanding = {}
+    lost = len(outstanding)
+    unsent = sum(1 for _ in tasks)
+    seconds = time.perf_counter() - start
+    completed = totals['completed']
+    per_worker = totals['per_worker']
+    return {'workers': len(per_worker), 'tasks': completed + totals['failed'] + lost + unsent,
+            'completed': completed, 'failed': totals['failed'],
+            'fork_seconds': totals['fork_seconds'], 'seconds': seconds,
+            'throughput': completed / seconds if seconds else 0.0,
+            'service_us': totals['service_ns'] / completed / 1000 if completed else 0.0,
+            'per_worker': per_worker, 'exits': exits, 'crashed': totals['crashed'],
+            'restarted': totals['restarted'], 'requeued': requeued, 'lost': lost, 'unsent': unsent}
+
+
+def run_fork_per_task(tasks, workers=None, work=short_task):
+    """
+    Baseline for the pool: forks a new child for every task, keeping at most
+    workers children alive and reaping whichever finishes first.
+    Returns a dict of timings and counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    running = submitted = failed = 0
+    fork_ns = 0
+    start = time.perf_counter()
+    for arg in tasks:
+        if running == workers:
+            failed += os.waitid(os.P_ALL, 0, os.WEXITED).si_status != 0
+            running -= 1
+        forked = time.perf_counter_ns()
+        pid = os.fork()
+        if pid == 0:
+            # --- Child Process Logic ---
+            status = 0
+            try:
+                work(arg)
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+        fork_ns += time.perf_counter_ns() - forked
+        running += 1
+        submitted += 1
+    while running:
+        failed += os.waitid(os.P_ALL, 0, os.WEXITED).si_status != 0
+        running -= 1
+    seconds = time.perf_counter() - start
+    return {'tasks': submitted, 'completed': submitted - failed, 'seconds': seconds,
+            'throughput': (submitted - failed) / seconds if seconds else 0.0,
+            'fork_us': fork_ns / submitted / 1000 if submitted else 0.0}
+
+
+def task_1_worker_pool(num_tasks=2000, workers=None, task_size=1000):
+    """
+    Runs the same batch of short tasks with a fork per task and on a
+    pre-forked worker pool, and compares fork cost with task throughput.
+    """
+    workers = workers or os.cpu_count() or 1
+    print(f"\n--- Task 1 (Pool Mode): {num_tasks} Short Tasks on {workers} Worker(s) ---")
+    per_task = run_fork_per_task(itertools.repeat(task_size, num_tasks), workers)
+    print(f"  Fork per task:    {per_task['completed']}/{per_task['tasks']} tasks in {per_task['seconds']:.3f} s "
+          f"({per_task['throughput']:.0f} tasks/s), fork() {per_task['fork_us']:.1f} us per task")
+
+    pool = run_worker_pool(itertools.repeat(task_size, num_tasks), workers)
+    print(f"  Pre-forked pool:  {pool['completed']}/{pool['tasks']} tasks in {pool['seconds']:.3f} s "
+          f"({pool['throughput']:.0f} tasks/s), {pool['workers']} fork()s in {pool['fork_seconds'] * 1000:.2f} ms")
+    print(f"  Mean task service time: {pool['service_us']:.1f} us | Tasks per worker: {pool['per_worker']}")
+    if pool['failed']:
+        print(f"  Tasks that raised: {pool['failed']}")
+    failed = {pid: code for pid, _, code in pool['exits'] if code != 0}
+    if failed:
+        print(f"  Workers that exited with an error (pid: status): {failed}")
+    if pool['crashed']:
+        print(f"  Crashed workers: {pool['crashed']} | Re-forked: {pool['restarted']} | "
+              f"Tasks rerun: {pool['requeued']} | Tasks lost: {pool['lost']} | Never sent: {pool['unsent']}")
+    if per_task['throughput']:
+        print(f"  Pool speedup: {pool['throughput'] / per_task['throughput']:.1f}x")
+    print("-" * 50)
+
+
 # --- Task 2: Command Execution Using exec() ---
 def task_2_command_execution():
     """
@@ -72,53 +439,416 @@ def task_2_command_execution():
     print("-" * 50)
 
 
+# --- Task 2 (continued): Concurrent Command Runner ---
+def _spawn_command(cmd):
+    """Forks and execs cmd with its stdout and stderr sent to new pipes. Returns (pid, out fd, err fd)."""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # --- Child Process Logic ---
+        try:
+            os.dup2(out_w, 1)
+            os.dup2(err_w, 2)
+            os.execvp(cmd[0], cmd)
+        except OSError as e:
+            os.write(2, f"Error: Could not run {cmd[0]}: {e.strerror}\n".encode())
+        os._exit(127) # Reached only if execvp failed
+    os.close(out_w)
+    os.close(err_w)
+    os.set_blocking(out_r, False)
+    os.set_blocking(err_r, False)
+    return pid, out_r, err_r
+
+
+def run_commands(commands, concurrency=4, timeout=None):
+    """
+    Runs commands (argument tuples) with at most concurrency running at once,
+    capturing each one's stdout and stderr. One selector watches every
+    output pipe plus a SIGCHLD wakeup pipe, so no thread is needed per child.
+    A command still running after timeout seconds is killed.
+    Returns one dict per command, in the order given: command, pid, status
+    (exit code, or minus the signal number), seconds, stdout, stderr and
+    timed_out.
+    """
+    commands = [tuple(cmd) for cmd in commands]
+    results = [None] * len(commands)
+    running = {} # pid -> result dict
+    streams = {} # fd -> (result dict, 'stdout' or 'stderr')
+    queued = iter(range(len(commands)))
+    sel = selectors.DefaultSelector()
+
+    def close_stream(fd):
+        sel.unregister(fd)
+        os.close(fd)
+        streams.pop(fd)[0]['open'] -= 1
+
+    with sigchld_wakeup() as wake_r:
+        sel.register(wake_r, selectors.EVENT_READ)
+        try:
+            while True:
+                while len(running) < concurrency:
+                    i = next(queued, None)
+                    if i is None:
+                        break
+                    start = time.perf_counter()
+                    pid, out_r, err_r = _spawn_command(commands[i])
+                    result = {'command': ' '.join(commands[i]), 'pid': pid, 'status': None,
+                              'start': start, 'seconds': None, 'stdout': bytearray(),
+                              'stderr': bytearray(), 'timed_out': False, 'open': 2}
+                    results[i] = running[pid] = result
+                    for fd, name in ((out_r, 'stdout'), (err_r, 'stderr')):
+                        streams[fd] = (result, name)
+                        sel.register(fd, selectors.EVENT_READ)
+                if not running:
+                    break
+
+                wait = None
+                if timeout is not None:
+                    deadlines = [r['start'] + timeout for r in running.values() if not r['timed_out']]
+                    if deadlines:
+                        wait = max(0.0, min(deadlines) - time.perf_counter())
+                for key, _ in sel.select(wait):
+                    fd = key.fd
+                    if fd == wake_r:
+                        drain(wake_r)
+                        continue
+                    data = os.read(fd, 1 << 16)
+                    if data:
+                        result, name = streams[fd]
+                        result[name] += data
+                    else:
+                        close_stream(fd)
+
+                now = time.perf_counter()
+                for pid, code in reap_exited():
+                    result = running.get(pid)
+                    if result is not None:
+                        result['status'] = code
+                        result['seconds'] = now - result['start']
+                # A child is done once it has exited and both pipes are closed
+                for pid in [pid for pid, r in running.items() if r['status'] is not None and not r['open']]:
+                    del running[pid]
+                if timeout is not None:
+                    for result in running.values():
+                        if not result['timed_out'] and now - result['start'] >= timeout:
+                            result['timed_out'] = True
+                            os.kill(result['pid'], signal.SIGKILL)
+                            # Keep what it wrote, but stop waiting for its pipes
+                            for fd in [fd for fd, (r, _) in streams.items() if r is result]:
+                                close_stream(fd)
+        finally:
+            sel.close()
+            for fd in streams:
+                os.close(fd)
+    for result in results:
+        if result is not None:
+            del result['start'], result['open']
+            result['stdout'] = bytes(result['stdout'])
+            result['stderr'] = bytes(result['stderr'])
+    return results
+
+
+def task_2_concurrent_commands(commands=None, concurrency=4, timeout=10):
+    """
+    Runs a batch of diagnostic commands concurrently and reports each one's
+    exit status, latency and captured output.
+    """
+    commands = commands or [('ls', '-l'), ('date',), ('ps', 'aux'), ('uname', '-a'),
+                            ('df', '-h'), ('id',), ('sleep', '1'), ('no-such-command',)]
+    print(f"\n--- Task 2 (Concurrent Mode): {len(commands)} Commands, {concurrency} at a Time ---")
+    start = time.perf_counter()
+    results = run_commands(commands, concurrency, timeout)
+    elapsed = time.perf_counter() - start
+
+    print(f"  {'Command':<20}{'PID':<9}{'Status':<8}{'Latency':<11}{'Stdout':<14}{'Stderr':<8}")
+    for r in results:
+        status = 'timeout' if r['timed_out'] else r['status']
+        lines = r['stdout'].count(b'\n')
+        print(f"  {r['command'][:19]:<20}{r['pid']:<9}{status:<8}{r['seconds'] * 1000:>7.1f} ms"
+              f"{lines:>6} lines{len(r['stderr']):>8} B")
+    for r in results:
+        if r['stderr']:
+            first = r['stderr'].decode(errors='replace').splitlines()[0]
+            print(f"  stderr of '{r['command']}': {first}")
+    total = sum(r['seconds'] for r in results)
+    print(f"\n  Wall time: {elapsed * 1000:.1f} ms | Sum of command latencies: {total * 1000:.1f} ms")
+    print("-" * 50)
+
+
 # --- Task 3: Zombie & Orphan Processes ---
+def _proc_state(pid):
+    """Returns (state, parent pid) of a process from /proc/<pid>/stat, or None if it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            data = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+    fields = data[data.rindex(b')') + 2:].split() # The name may contain spaces and ')'
+    return fields[0].decode(), int(fields[1])
+
+
+def _pidfd_supported():
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
+class LifecycleTracker:
+    """
+    Follows processes through their lifecycle and timestamps every
+    transition: spawned, exited, zombie (exited but not reaped yet), reaped
+    and reparented. Each watched process gets a pidfd (os.pidfd_open), which
+    becomes readable when the process exits, so one selector waits for all
+    of them and nothing has to sleep. Without pidfds (before Linux 5.3, or
+    off Linux) children are followed through SIGCHLD instead; they are then
+    reaped as soon as they exit, so no zombie is ever seen.
+    """
+    def __init__(self, reap=True, verify=True):
+        self.reap = reap         # Reap children as soon as they exit
+        self.verify = verify     # Confirm zombies in /proc/<pid>/stat
+        self.start = time.perf_counter()
+        self.events = []         # (seconds since start, pid, transition, detail)
+        self.children = set()    # Children not reaped yet
+        self.zombies = {}        # pid -> time it exited
+        self.peak_zombies = 0
+        self.reap_delay = 0.0    # Total time children spent as zombies
+        self.reaped = 0
+        self.orphans = {}        # parent pid -> processes to check for a new parent when it exits
+        self.watched = {}        # pid -> pidfd
+        self.sel = selectors.DefaultSelector()
+        self.pidfds = _pidfd_supported()
+        self._wakeup = None
+        if not self.pidfds:
+            self._wakeup = sigchld_wakeup()
+            self.sel.register(self._wakeup.__enter__(), selectors.EVENT_READ)
+
+    def record(self, pid, transition, detail=''):
+        now = time.perf_counter() - self.start
+        self.events.append((now, pid, transition, detail))
+        return now
+
+    def spawn(self, target, *args):
+        """Forks a child that runs target(*args) and exits. Returns its pid."""
+        pid = os.fork()
+        if pid == 0:
+            # --- Child Process Logic ---
+            status = 0
+            try:
+                self.sel.close()
+                reset_child_signals()
+                target(*args)
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+        self.children.add(pid)
+        self.record(pid, 'spawned')
+        self.watch(pid)
+        return pid
+
+    def watch(self, pid):
+        """Starts following a process (a child, or any other process)."""
+        if not self.pidfds or pid in self.watched:
+            return
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            self._exited(pid) # Gone before we could watch it
+            return
+        self.watched[pid] = fd
+        self.sel.register(fd, selectors.EVENT_READ, pid)
+
+    def watch_reparent(self, pid, parent):
+        """Records when pid gets a new parent, which happens when parent exits."""
+        self.orphans.setdefault(parent, []).append(pid)
+        self.watch(parent)
+
+    def reap_child(self, pid):
+        info = os.waitid(os.P_PID, pid, os.WEXITED)
+        self._reaped(pid, info.si_status if info.si_code == os.CLD_EXITED else -info.si_status)
+
+    def reap_all(self):
+        """Reaps every child that has exited."""
+        for pid in list(self.zombies):
+            self.reap_child(pid)
+
+    def _reaped(self, pid, status):
+        now = self.record(pid, 'reaped', f"status {status}")
+        self.children.discard(pid)
+        self.reap_delay += now - self.zombies.pop(pid, now)
+        self.reaped += 1
+
+    def _exited(self, pid, status=None):
+        now = self.record(pid, 'exited')
+        if pid in self.children:
+            if status is not None:
+                self._reaped(pid, status) # SIGCHLD mode: reaped already
+            else:
+                self.zombies[pid] = now
+                self.peak_zombies = max(self.peak_zombies, len(self.zombies))
+                if self.verify:
+                    state = _proc_state(pid)
+                    if state and state[0] == 'Z':
+                        self.record(pid, 'zombie')
+                if self.reap:
+                    self.reap_child(pid)
+        # The kernel reparents a process's children before reporting its exit
+        for orphan in self.orphans.pop(pid, ()):
+            state = _proc_state(orphan)
+            if state is not None:
+                self.record(orphan, 'reparented', f"new parent {state[1]}")
+
+    def poll(self, timeout=None):
+        """Handles the events of one select() call. Returns how many there were."""
+        events = self.sel.select(timeout)
+        for key, _ in events:
+            if key.data is None:
+                drain(key.fd)
+                for pid, status in reap_exited():
+                    self._exited(pid, status)
+            else:
+                self.sel.unregister(key.fd)
+                os.close(self.watched.pop(key.data))
+                self._exited(key.data)
+        return len(events)
+
+    def run(self, until=None):
+        """Handles events until until() is true, or nothing is left to wait for."""
+        while not (until and until()):
+            if not (self.watched if self.pidfds else self.children):
+                break
+            self.poll()
+
+    def has(self, pid, transition):
+        """Whether a transition has been recorded for pid."""
+        return any(p == pid and t == transition for _, p, t, _ in self.events)
+
+    def close(self):
+        for fd in self.watched.values():
+            os.close(fd)
+        self.watched.clear()
+        self.sel.close()
+        if self._wakeup is not None:
+            self._wakeup.__exit__(None, None, None)
+
+    def print_timeline(self):
+        for seconds, pid, transition, detail in self.events:
+            print(f"  {seconds * 1000:9.3f} ms  PID {pid:<8}{transition:<12}{detail}")
+
+
+def _zombie_child():
+    print(f"  Zombie Child (PID:{os.getpid()}): Exiting now.", flush=True)
+
+
+def _orphan_parent(pid_w, go_r):
+    """Forks the orphan-to-be, reports its pid through pid_w, then exits before it."""
+    pid = os.fork()
+    if pid == 0:
+        # --- Orphan Child Logic ---
+        print(f"  Orphan Child (PID:{os.getpid()}): My parent is {os.getppid()}.", flush=True)
+        os.read(go_r, 1) # Wait until the tracker has seen the reparent
+        print(f"  Orphan Child: My original parent died. My new parent is {os.getppid()} (init/systemd or a subreaper).",
+              flush=True)
+        os._exit(0)
+    os.write(pid_w, struct.pack('=q', pid))
+    print(f"  Parent (PID:{os.getpid()}): Exiting before my child.", flush=True)
+
+
 def task_3_zombie_and_orphan():
     """
     Demonstrates the creation of zombie and orphan processes.
     [cite_start][cite: 40, 41]
+    A LifecycleTracker waits for each transition instead of sleeping, and
+    prints a timestamped timeline of each part.
     """
     print("\n--- Task 3: Simulating Zombie & Orphan Processes ---")
+    sys.stdout.flush() # Children must not inherit unwritten output
 
     # 1. Zombie Process Simulation
     print("\n-- Part A: Zombie Process --")
-    pid = os.fork()
-    if pid == 0:
-        # Child process exits immediately
-        print(f"  Zombie Child (PID:{os.getpid()}): Exiting now.")
-        os._exit(0)
-    else:
-        # Parent does not wait, allowing the child to become a zombie
+    tracker = LifecycleTracker(reap=False)
+    try:
+        pid = tracker.spawn(_zombie_child)
+        # Parent does not reap the child when it exits, so it becomes a zombie
         print(f"  Parent (PID:{os.getpid()}): Created child {pid}, not waiting.")
-        print("  >> The child is now a zombie. Check with 'ps -el | grep defunct' in another terminal.")
-        time.sleep(5)
-        # Now, the parent cleans up the zombie
-        os.waitpid(pid, 0)
+        tracker.run(until=lambda: pid not in tracker.children or pid in tracker.zombies)
+        if pid in tracker.zombies:
+            state = _proc_state(pid)
+            print(f"  >> The child is now a zombie (state {state[0] if state else '?'} in /proc/{pid}/stat).")
+            # Now, the parent cleans up the zombie
+            tracker.reap_all()
         print("  Parent: Cleaned up the zombie process.")
+        tracker.print_timeline()
+    finally:
+        tracker.close()
 
     # 2. Orphan Process Simulation
     print("\n-- Part B: Orphan Process --")
-    pid = os.fork()
-    if pid == 0:
-        # Child process lives on after parent dies
-        original_ppid = os.getppid()
-        print(f"  Orphan Child (PID:{os.getpid()}): My parent is {original_ppid}.")
-        time.sleep(2) # Give parent time to exit
-        new_ppid = os.getppid()
-        print(f"  Orphan Child: My original parent died. My new parent is {new_ppid} (init/systemd).")
-        os._exit(0)
-    else:
-        # Parent exits immediately
-        print(f"  Parent (PID:{os.getpid()}): Exiting before my child.")
-        time.sleep(0.1) # A small delay to ensure the child's first print happens
-        # We can't use os._exit() here as it would terminate the whole script.
-
-    # Wait for the orphan child to finish its demonstration before moving on
-    time.sleep(3)
+    pid_r, pid_w = os.pipe()
+    go_r, go_w = os.pipe()
+    tracker = LifecycleTracker()
+    try:
+        parent = tracker.spawn(_orphan_parent, pid_w, go_r)
+        orphan = struct.unpack('=q', os.read(pid_r, 8))[0]
+        tracker.watch(orphan)
+        tracker.watch_reparent(orphan, parent)
+        # The orphan is told to go on only once its reparent has been recorded
+        tracker.run(until=lambda: tracker.has(orphan, 'reparented') or tracker.has(orphan, 'exited'))
+        os.write(go_w, b'x')
+        tracker.run()
+        tracker.print_timeline()
+    finally:
+        tracker.close()
+        for fd in (pid_r, pid_w, go_r, go_w):
+            os.close(fd)
+
     print("\nParent: Orphan simulation complete.")
     print("-" * 50)
 
 
+def task_3_fork_storm(num_children=2000):
+    """
+    Forks num_children children that exit at once, first without reaping
+    them until all have exited (zombies build up), then reaping each as soon
+    as it exits. Reports the zombie peak and how long children stayed zombies.
+    """
+    print(f"\n--- Task 3 (Fork Storm): {num_children} Short-lived Children ---")
+    sys.stdout.flush()
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        # One pidfd per live child
+        if soft != resource.RLIM_INFINITY and soft < num_children + 64:
+            limit = num_children + 64 if hard == resource.RLIM_INFINITY else min(hard, num_children + 64)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+    for reap in (False, True):
+        tracker = LifecycleTracker(reap=reap, verify=False)
+        try:
+            start = time.perf_counter()
+            for _ in range(num_children):
+                tracker.spawn(int)
+                tracker.poll(0)
+            forked = time.perf_counter() - start
+            tracker.run()
+            tracker.reap_all()
+            elapsed = time.perf_counter() - start
+        finally:
+            tracker.close()
+        label = "Reap on exit:   " if reap else "Reap at the end:"
+        mean = tracker.reap_delay / tracker.reaped * 1e6 if tracker.reaped else 0.0
+        print(f"  {label} forked in {forked * 1000:.1f} ms, all reaped after {elapsed * 1000:.1f} ms, "
+              f"peak zombies {tracker.peak_zombies}, mean time as a zombie {mean:.0f} us")
+    if not _pidfd_supported():
+        print("  (pidfd_open is not available here: children were reaped on SIGCHLD, so no zombies were seen)")
+    print("-" * 50)
+
+
 # --- Task 4: Inspecting Process Info from /proc ---
 def task_4_inspect_proc(pid_to_inspect):
     """
@@ -154,15 +884,227 @@ def task_4_inspect_proc(pid_to_inspect):
         print("-" * 50)
 
 
+# --- Task 4 (continued): Process Table ---
+def _read_proc_file(path):
+    """Reads a small /proc file with one open and one read, or returns None if the process is gone."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+    try:
+        return os.read(fd, 4096)
+    except (ProcessLookupError, PermissionError):
+        return None
+    finally:
+        os.close(fd)
+
+
+class ProcessTable:
+    """
+    A ps/top-style table of every process, kept in compact array('q')
+    columns (one row per process) and refreshed incrementally. Each refresh
+    lists /proc with os.scandir and reads every /proc/<pid>/stat, but only
+    parses the ones whose contents changed since the last refresh (a
+    sleeping process's stat is byte-for-byte the same); /proc/<pid>/statm is
+    read only for those. With workers > 0 the files are read by a thread
+    pool, which overlaps the system calls of hosts with many processes.
+    """
+    COLUMNS = ('pid', 'ppid', 'state', 'nice', 'threads', 'utime', 'stime', 'minflt', 'majflt',
+               'starttime', 'vsize', 'rss', 'shared', 'cpu')
+
+    def __init__(self, proc='/proc', workers=0):
+        self.proc = proc
+        self.workers = workers
+        self.columns = {name: array('q') for name in self.COLUMNS}
+        self.names = []
+        self.raw = []           # Last stat contents per row
+        self.rows = {}          # pid -> row
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.interval = 0.0     # Seconds between the last two refreshes
+        self.last = None
+        self._pool = None
+        if workers:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(workers)
+
+    def __len__(self):
+        return len(self.names)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def _pids(self):
+        with os.scandir(self.proc) as entries:
+            return [int(e.name) for e in entries if e.name.isdigit()]
+
+    def _read_stats(self, pids):
+        proc = self.proc
+        if self._pool is None:
+            return [_read_proc_file(f"{proc}/{pid}/stat") for pid in pids]
+        step = -(-len(pids) // (self.workers * 4)) or 1
+        chunks = [pids[i:i + step] for i in range(0, len(pids), step)]
+        read = lambda chunk: [_read_proc_file(f"{proc}/{pid}/stat") for pid in chunk]
+        return [data for part in self._pool.map(read, chunks) for data in part]
+
+    def _set(self, row, pid, data):
+        """Parses one stat (and its statm) into row. Returns False if the process is gone."""
+        close = data.rindex(b')')
+        fields = data[close + 2:].split()
+        statm = _read_proc_file(f"{self.proc}/{pid}/statm")
+        if statm is None:
+            return False
+        statm = statm.split()
+        c = self.columns
+        ticks = int(fields[11]) + int(fields[12])
+        if row < len(self.names):
+            old = c['utime'][row] + c['stime'][row]
+            c['cpu'][row] = ticks - old if c['starttime'][row] == int(fields[19]) else ticks
+            self.names[row] = data[data.index(b'(') + 1:close].decode(errors='replace')
+            self.raw[row] = data
+        else:
+            self.names.append(data[data.index(b'(') + 1:close].decode(errors='replace'))
+            self.raw.append(data)
+            for name in self.COLUMNS:
+                c[name].append(0)
+            c['cpu'][row] = 0
+        c['pid'][row] = pid
+        c['ppid'][row] = int(fields[1])
+        c['state'][row] = fields[0][0]
+        c['nice'][row] = int(fields[16])
+        c['threads'][row] = int(fields[17])
+        c['utime'][row] = int(fields[11])
+        c['stime'][row] = int(fields[12])
+        c['minflt'][row] = int(fields[7])
+        c['majflt'][row] = int(fields[9])
+        c['starttime'][row] = int(fields[19])
+        c['vsize'][row] = int(fields[20])
+        c['rss'][row] = int(statm[1]) * self.page_size
+        c['shared'][row] = int(statm[2]) * self.page_size
+        return True
+
+    def _remove(self, row):
+        """Removes a row by moving the last row into its place."""
+        last = len(self.names) - 1
+        del self.rows[self.columns['pid'][row]]
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.names[row] = self.names[last]
+            self.raw[row] = self.raw[last]
+            self.rows[self.columns['pid'][row]] = row
+        for column in self.columns.values():
+            column.pop()
+        self.names.pop()
+        self.raw.pop()
+
+    def refresh(self):
+        """
+        Brings the table up to date. Returns counts for this refresh:
+        processes scanned, parsed (new or changed), added and removed.
+        """
+        start = time.perf_counter()
+        if self.last is not None:
+            self.interval = start - self.last
+        self.last = start
+        pids = self._pids()
+        stats = self._read_stats(pids)
+        cpu = self.columns['cpu']
+        cpu[:] = array('q', bytes(cpu.itemsize * len(cpu))) # Unchanged processes used no CPU time
+        seen = set()
+        parsed = added = 0
+        for pid, data in zip(pids, stats):
+            if data is None:
+                continue # Exited while we scanned
+            row = self.rows.get(pid)
+            if row is not None and self.raw[row] == data:
+                seen.add(pid)
+                continue
+            if row is None:
+                row = len(self.names)
+                if not self._set(row, pid, data):
+                    continue
+                self.rows[pid] = row
+                added += 1
+            elif not self._set(row, pid, data):
+                continue
+            seen.add(pid)
+            parsed += 1
+        gone = [row for pid, row in self.rows.items() if pid not in seen]
+        for row in sorted(gone, reverse=True):
+            self._remove(row)
+        return {'scanned': len(pids), 'parsed': parsed, 'added': added, 'removed': len(gone),
+                'seconds': time.perf_counter() - start}
+
+    def row(self, i):
+        """Returns row i as a dict."""
+        record = {name: column[i] for name, column in self.columns.items()}
+        record['name'] = self.names[i]
+        record['state'] = chr(record['state'])
+        return record
+
+    def top(self, n=5):
+        """The n rows that used the most CPU time since the last refresh, busiest first."""
+        cpu = self.columns['cpu']
+        return [self.row(i) for i in heapq.nlargest(n, range(len(cpu)), key=cpu.__getitem__)]
+
+    def cpu_percent(self, record):
+        """CPU use of a row from top() over the last refresh interval, in percent."""
+        if not self.interval:
+            return 0.0
+        return record['cpu'] / self.clock_ticks / self.interval * 100
+
+
+def task_4_process_table(polls=3, interval=1.0, workers=0):
+    """
+    Polls a ProcessTable like top does and shows how much each refresh had
+    to parse, plus the busiest processes.
+    """
+    print(f"\n--- Task 4 (Process Table): {polls} Polls of /proc, {interval:g} s Apart ---")
+    table = ProcessTable(workers=workers)
+    try:
+        for i in range(polls):
+            if i:
+                time.sleep(interval)
+            stats = table.refresh()
+            print(f"  Poll {i + 1}: {stats['scanned']} processes, parsed {stats['parsed']} "
+                  f"(+{stats['added']} / -{stats['removed']}) in {stats['seconds'] * 1000:.2f} ms")
+        print(f"\n  {'PID':<8}{'PPID':<8}{'S':<3}{'NI':>4}{'THR':>5}{'RSS':>10}{'CPU%':>7}  Name")
+        for r in table.top(5):
+            print(f"  {r['pid']:<8}{r['ppid']:<8}{r['state']:<3}{r['nice']:>4}{r['threads']:>5}"
+                  f"{r['rss'] // 1024:>8} K{table.cpu_percent(r):>7.1f}  {r['name']}")
+    finally:
+        table.close()
+    print("-" * 50)
+
+
 # --- Task 5: Process Prioritization ---
-def cpu_intensive_work(label):
+def burn(iterations):
+    """A simple, inefficient loop to burn CPU cycles."""
+    count = 0
+    for _ in range(iterations):
+        count += 1
+    return count
+
+
+def calibrate_burn(cpu_seconds, sample=0.05):
+    """Returns how many burn() iterations take about cpu_seconds of CPU time on this machine."""
+    n = 10_000
+    while True:
+        start = time.process_time()
+        burn(n)
+        used = time.process_time() - start
+        if used >= sample:
+            return max(1, int(n * cpu_seconds / used))
+        n *= 2
+
+
+def cpu_intensive_work(label, iterations=250_000_000):
     """A simple task that consumes CPU time."""
     start_time = time.time()
     print(f"  {label} (PID:{os.getpid()}, Nice:{os.nice(0)}): Starting CPU work.")
-    # A simple, inefficient loop to burn CPU cycles
-    count = 0
-    for _ in range(250_000_000):
-        count += 1
+    burn(iterations)
     end_time = time.time()
     print(f"  {label}: Finished in {end_time - start_time:.2f} seconds.")
 
@@ -183,6 +1125,8 @@ def task_5_process_prioritization():
 
     num_processes = num_cores * 2
     child_pids = []
+    iterations = calibrate_burn(1.0) # About one CPU-second of work per child
+    sys.stdout.flush()
 
     print("  Starting a mix of default-priority and low-priority children...")
 
@@ -193,11 +1137,11 @@ def task_5_process_prioritization():
             if i % 2 == 0:
                 # Even-numbered children get default priority
                 os.nice(0)
-                cpu_intensive_work(f"Default Priority-{i//2}")
+                cpu_intensive_work(f"Default Priority-{i//2}", iterations)
             else:
                 # Odd-numbered children get low priority
                 os.nice(15) # Using 15 for a more pronounced effect
-                cpu_intensive_work(f"Low Priority-{i//2}")
+                cpu_intensive_work(f"Low Priority-{i//2}", iterations)
             os._exit(0)
         else:
             # Parent Process Logic
@@ -210,20 +1154,127 @@ def task_5_process_prioritization():
     print("\nParent: All CPU-intensive children have finished.")
     print("Observe the finish times: the 'Default Priority' processes should have generally finished earlier than the 'Low Priority' ones.")
     print("-" * 50)
-    
+
+
+# --- Task 5 (continued): Scheduler Fairness Benchmark ---
+def cfs_weight(nice):
+    """CFS load weight of a nice level: 1024 at nice 0, about 1.25x per level (kernel sched_prio_to_weight)."""
+    return 1024 / 1.25 ** nice
+
+
+def _read_schedstat(pid):
+    """(time on CPU, time waiting to run) in seconds from /proc/<pid>/schedstat, or None."""
+    data = _read_proc_file(f"/proc/{pid}/schedstat")
+    if not data:
+        return None
+    run_ns, wait_ns = data.split()[:2]
+    return int(run_ns) / 1e9, int(wait_ns) / 1e9
+
+
+def _fairness_child(nice, cpu, go_r, chunk):
+    """Pins itself, sets its nice level, then burns CPU until the deadline sent through go_r."""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, nice)
+    except PermissionError:
+        pass # Raising priority (nice < current) needs root; run at the level we have
+    deadline = struct.unpack('=d', os.read(go_r, 8))[0]
+    while time.monotonic() < deadline:
+        burn(chunk)
+
+
+def run_fairness_benchmark(levels=(0, 5, 10, 15, 19), seconds=2.0, cpu=None):
+    """
+    Runs one CPU-bound child per nice level, all pinned to the same CPU, for
+    seconds of wall time. The parent waits for each child to exit, reads its
+    /proc/<pid>/schedstat while it is still a zombie (waitid with WNOWAIT),
+    then reaps it with os.wait4 to get its CPU time from rusage.
+    Returns one dict per child: nice, cpu (seconds), share of the CPU time
+    used by all children, expected share by CFS weight, and run/wait time
+    from schedstat (None if unavailable).
+    """
+    if cpu is None and hasattr(os, 'sched_getaffinity'):
+        cpu = min(os.sched_getaffinity(0))
+    chunk = calibrate_burn(0.001) # About 1 ms of CPU between deadline checks
+    go_r, go_w = os.pipe()
+    sys.stdout.flush()
+    children = {} # pid -> requested nice
+    try:
+        for nice in levels:
+            pid = os.fork()
+            if pid == 0:
+                # --- Child Process Logic ---
+                status = 0
+                try:
+                    _fairness_child(nice, cpu, go_r, chunk)
+                except BaseException:
+                    status = 1
+                finally:
+                    os._exit(status)
+            children[pid] = nice
+        # Every child gets the same deadline once all of them exist
+        deadline = time.monotonic() + seconds
+        os.write(go_w, struct.pack('=d', deadline) * len(children))
+    finally:
+        os.close(go_r)
+        os.close(go_w)
+
+    results = []
+    while children:
+        info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+        schedstat = _read_schedstat(info.si_pid)
+        pid, status, usage = os.wait4(info.si_pid, 0)
+        nice = children.pop(pid, None)
+        if nice is None:
+            continue # Not one of ours
+        results.append({'pid': pid, 'nice': nice, 'status': os.waitstatus_to_exitcode(status),
+                        'cpu': usage.ru_utime + usage.ru_stime,
+                        'run': schedstat[0] if schedstat else None,
+                        'wait': schedstat[1] if schedstat else None})
+    results.sort(key=lambda r: (r['nice'], r['pid']))
+    total_cpu = sum(r['cpu'] for r in results) or 1.0
+    total_weight = sum(cfs_weight(r['nice']) for r in results)
+    for r in results:
+        r['share'] = r['cpu'] / total_cpu
+        r['expected'] = cfs_weight(r['nice']) / total_weight
+    return results
+
+
+def task_5_fairness_benchmark(levels=(0, 5, 10, 15, 19), seconds=2.0):
+    """
+    Measures how CPU time is split between processes of different nice
+    levels competing for one CPU, against the split CFS weights predict.
+    """
+    print(f"\n--- Task 5 (Benchmark): CPU Share by Nice Level, {seconds:g} s on One CPU ---")
+    results = run_fairness_benchmark(levels, seconds)
+    print(f"  {'Nice':>4}{'PID':>9}{'CPU (s)':>10}{'Share':>9}{'Expected':>10}{'Run (s)':>10}{'Wait (s)':>10}")
+    for r in results:
+        run = f"{r['run']:>10.3f}" if r['run'] is not None else f"{'-':>10}"
+        wait = f"{r['wait']:>10.3f}" if r['wait'] is not None else f"{'-':>10}"
+        print(f"  {r['nice']:>4}{r['pid']:>9}{r['cpu']:>10.3f}{r['share'] * 100:>8.1f}%"
+              f"{r['expected'] * 100:>9.1f}%{run}{wait}")
+    print("  Expected shares follow the CFS weights (each nice level is worth about 1.25x less CPU).")
+    print("-" * 50)
+
 
 # --- Main Execution ---
 def main():
     """Main function to run all the OS lab tasks."""
     print("====== Operating System Lab Assignment 1 ======")
     task_1_process_creation()
+    task_1_worker_pool()
     task_2_command_execution()
+    task_2_concurrent_commands()
     task_3_zombie_and_orphan()
+    task_3_fork_storm()
     
     # For Task 4, we inspect the main script's own process ID
     task_4_inspect_proc(os.getpid())
+    task_4_process_table()
     
     task_5_process_prioritization()
+    task_5_fairness_benchmark()
     print("\n======== All Tasks Completed ========")
 
 